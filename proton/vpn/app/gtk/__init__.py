@@ -20,21 +20,28 @@ You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
 from importlib.metadata import version, PackageNotFoundError
-import gi
+
+from proton.vpn.app.gtk.utils.startup_tracer import startup_tracer
+
+startup_tracer.checkpoint("python_startup")
 
 try:
     __version__ = version("proton-vpn-gtk-app")
 except PackageNotFoundError:
     __version__ = "development"
 
-gi.require_version("Gtk", "3.0")
-gi.require_version("Notify", "0.7")
+with startup_tracer.phase("import_gtk"):
+    import gi  # pylint: disable=C0413 # noqa: E402
+
+    gi.require_version("Gtk", "3.0")
+    gi.require_version("Notify", "0.7")
 
-from gi.repository import Gtk  # pylint: disable=C0413 # noqa: E402
+    from gi.repository import Gtk  # pylint: disable=C0413 # noqa: E402
 
 from proton.vpn import logging  # pylint: disable=C0413 # noqa: E402
 
 
-logging.config(filename="vpn-app")
+with startup_tracer.phase("configure_logging"):
+    logging.config(filename="vpn-app")
 
 __all__ = [Gtk]
@@ -26,14 +26,24 @@ from proton.vpn.app.gtk.app import App
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.utils.exception_handler import ExceptionHandler
 from proton.vpn.app.gtk.utils.executor import AsyncExecutor
+from proton.vpn.app.gtk.utils.instrumentation import (
+    TaskInstrumentation, is_task_instrumentation_enabled
+)
+from proton.vpn.app.gtk.utils.startup_tracer import startup_tracer
 
 
 def main():
     """Runs the app."""
-
-    with AsyncExecutor() as executor, ExceptionHandler() as exception_handler:
-        controller = Controller.get(executor, exception_handler)
-        sys.exit(App(controller).run(sys.argv))
+    startup_tracer.checkpoint("import_app_modules")
+
+    instrumentation = TaskInstrumentation() if is_task_instrumentation_enabled() else None
+    executor = AsyncExecutor(instrumentation=instrumentation)
+    with executor, ExceptionHandler() as exception_handler:
+        with startup_tracer.phase("initialize_controller"):
+            controller = Controller.get(executor, exception_handler)
+        with startup_tracer.phase("construct_app"):
+            app = App(controller)
+        sys.exit(app.run(sys.argv))
 
 
 if __name__ == "__main__":
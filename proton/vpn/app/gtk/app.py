@@ -26,6 +26,8 @@ from gi.repository import GObject, Gtk, Gdk, GLib
 from proton.vpn import logging
 
 from proton.vpn.app.gtk.controller import Controller
+from proton.vpn.app.gtk.utils.instrumentation import INSTRUMENT_TASKS_OPTION
+from proton.vpn.app.gtk.utils.startup_tracer import startup_tracer, TRACE_STARTUP_OPTION
 from proton.vpn.app.gtk.widgets.main.tray_indicator import TrayIndicator, TrayIndicatorNotSupported
 from proton.vpn.app.gtk.widgets.main.main_window import MainWindow
 from proton.vpn.app.gtk.assets.style import STYLE_PATH
@@ -68,16 +70,28 @@ class App(Gtk.Application):
         Runs at application startup, to load
         any necessary UI elements.
         """
-        Gtk.Application.do_startup(self)
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_path(str(STYLE_PATH / "main.css"))
-
-        screen = Gdk.Screen.get_default()
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        with startup_tracer.phase("gtk_startup"):
+            Gtk.Application.do_startup(self)
+        self._controller.main_loop_watchdog.start()
+        with startup_tracer.phase("load_css"):
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_path(str(STYLE_PATH / "main.css"))
+
+            screen = Gdk.Screen.get_default()
+            Gtk.StyleContext.add_provider_for_screen(
+                screen,
+                css_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+
+    def do_shutdown(self):  # pylint: disable=arguments-differ
+        """Default GTK method.
+
+        Runs once the main loop stopped running, right before the
+        application exits.
+        """
+        self._controller.main_loop_watchdog.stop()
+        Gtk.Application.do_shutdown(self)
 
     def do_activate(self):  # pylint: disable=W0221
         """
@@ -85,7 +99,8 @@ class App(Gtk.Application):
         be shown to the user.
         """
         if not self.window:
-            self.window = MainWindow(self, self._controller)
+            with startup_tracer.phase("build_main_window"):
+                self.window = MainWindow(self, self._controller)
             # Process signal connection requests asap.
             self._process_signal_connect_queue()
             # Windows are associated with the application like this.
@@ -93,13 +108,15 @@ class App(Gtk.Application):
             self.add_window(self.window)
             # The behaviour of the button to close the window is configured
             # depending on whether the tray indicator is shown or not.
-            self.tray_indicator = self._build_tray_indicator_if_possible(
-                self._controller, self.window
-            )
+            with startup_tracer.phase("build_tray_indicator"):
+                self.tray_indicator = self._build_tray_indicator_if_possible(
+                    self._controller, self.window
+                )
             self.window.configure_close_button_behaviour(
                 tray_indicator_enabled=(self.tray_indicator is not None)
             )
-            self.window.show_all()
+            with startup_tracer.phase("show_main_window"):
+                self.window.show_all()
 
         self.window.present()
         self.emit("app-ready")
@@ -224,7 +241,8 @@ class App(Gtk.Application):
             or self._controller.get_app_configuration().start_app_minimized
 
     def add_options(self):
-        """Adds the --start-minimized and --version command line options"""
+        """Adds the --start-minimized, --version, --trace-startup and --instrument-tasks
+        command line options"""
         self.add_main_option(
             "start-minimized",
             0,
@@ -240,3 +258,23 @@ class App(Gtk.Application):
             GLib.OptionArg.NONE,
             "Display the application's version"
         )
+
+        # The option is handled by the startup tracer, which is enabled
+        # before the app is constructed.
+        self.add_main_option(
+            TRACE_STARTUP_OPTION,
+            0,
+            GLib.OptionFlags.NONE,
+            GLib.OptionArg.NONE,
+            "Trace the startup phases and write them to a Chrome trace file"
+        )
+
+        # The option is handled when the executor is created, before the
+        # app is constructed.
+        self.add_main_option(
+            INSTRUMENT_TASKS_OPTION,
+            0,
+            GLib.OptionFlags.NONE,
+            GLib.OptionArg.NONE,
+            "Measure the timings of background tasks and log the slow ones"
+        )
@@ -29,7 +29,11 @@ from proton.utils.environment import VPNExecutionEnvironment
 DEFAULT_APP_CONFIG = {
     "tray_pinned_servers": [],
     "connect_at_app_startup": None,
-    "start_app_minimized": False
+    "start_app_minimized": False,
+    "virtualized_server_list": False,
+    "network_monitor_backend": "netlink",
+    "reconnection_max_delay_seconds": 300,
+    "reconnection_jitter": "proportional"
 }
 
 APP_CONFIG = os.path.join(
@@ -37,6 +41,11 @@ APP_CONFIG = os.path.join(
     "app-config.json"
 )
 
+SERVER_LIST_SNAPSHOT = os.path.join(
+    VPNExecutionEnvironment().path_config,
+    "server-list-snapshot.json"
+)
+
 
 @dataclass
 class AppConfig:
@@ -45,6 +54,10 @@ class AppConfig:
     tray_pinned_servers: list
     connect_at_app_startup: Optional[str]
     start_app_minimized: bool
+    virtualized_server_list: bool = False
+    network_monitor_backend: str = DEFAULT_APP_CONFIG["network_monitor_backend"]
+    reconnection_max_delay_seconds: int = DEFAULT_APP_CONFIG["reconnection_max_delay_seconds"]
+    reconnection_jitter: str = DEFAULT_APP_CONFIG["reconnection_jitter"]
 
     @staticmethod
     def from_dict(data: dict) -> AppConfig:
@@ -58,7 +71,18 @@ class AppConfig:
                 if connect_at_app_startup
                 else None
             ),
-            start_app_minimized=data.get("start_app_minimized", False)
+            start_app_minimized=data.get("start_app_minimized", False),
+            virtualized_server_list=data.get("virtualized_server_list", False),
+            network_monitor_backend=data.get(
+                "network_monitor_backend", DEFAULT_APP_CONFIG["network_monitor_backend"]
+            ),
+            reconnection_max_delay_seconds=data.get(
+                "reconnection_max_delay_seconds",
+                DEFAULT_APP_CONFIG["reconnection_max_delay_seconds"]
+            ),
+            reconnection_jitter=data.get(
+                "reconnection_jitter", DEFAULT_APP_CONFIG["reconnection_jitter"]
+            )
         )
 
     def to_dict(self) -> dict:
@@ -71,5 +95,9 @@ class AppConfig:
         return AppConfig(
             tray_pinned_servers=DEFAULT_APP_CONFIG["tray_pinned_servers"],
             connect_at_app_startup=DEFAULT_APP_CONFIG["connect_at_app_startup"],
-            start_app_minimized=DEFAULT_APP_CONFIG["start_app_minimized"]
+            start_app_minimized=DEFAULT_APP_CONFIG["start_app_minimized"],
+            virtualized_server_list=DEFAULT_APP_CONFIG["virtualized_server_list"],
+            network_monitor_backend=DEFAULT_APP_CONFIG["network_monitor_backend"],
+            reconnection_max_delay_seconds=DEFAULT_APP_CONFIG["reconnection_max_delay_seconds"],
+            reconnection_jitter=DEFAULT_APP_CONFIG["reconnection_jitter"]
         )
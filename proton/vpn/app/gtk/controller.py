@@ -17,11 +17,12 @@ You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
+import copy
 import subprocess  # nosec B404 # nosemgrep: gitlab.bandit.B404
 from concurrent.futures import Future
 from importlib import metadata
 from types import TracebackType
-from typing import Optional, Type, Callable
+from typing import Dict, List, Optional, Type, Callable
 
 from gi.repository import GLib
 from proton.vpn.session import ServerList
@@ -35,16 +36,25 @@ from proton.vpn.core.connection import VPNConnector
 from proton.vpn.core.cache_handler import CacheHandler
 from proton.vpn.session.servers import LogicalServer
 from proton.vpn.session.session import FeatureFlags
-
-from proton.vpn.app.gtk.services import VPNReconnector
-from proton.vpn.app.gtk.services.reconnector.network_monitor import NetworkMonitor
+from proton.vpn.session.dataclasses import BugReportForm
+
+from proton.vpn.app.gtk.services import (
+    ConnectionStatusDispatcher, ServerListSnapshot, ServerListSnapshotStore, VPNReconnector
+)
+from proton.vpn.app.gtk.services.reconnector.backoff import BackoffPolicy, Jitter
+from proton.vpn.app.gtk.services.reconnector.network_monitor import (
+    NetworkMonitor, NetlinkNetworkMonitor
+)
+from proton.vpn.app.gtk.services.reconnector.network_manager_monitor import \
+    NetworkManagerMonitor
 from proton.vpn.app.gtk.services.reconnector.session_monitor import SessionMonitor
+from proton.vpn.app.gtk.services.reconnector.telemetry import Outage, ReconnectionTelemetry
 from proton.vpn.app.gtk.services.reconnector.vpn_monitor import VPNMonitor
 from proton.vpn.core.settings import Settings
 from proton.vpn.app.gtk.utils import semver, glib
 from proton.vpn.app.gtk.utils.exception_handler import ExceptionHandler
-from proton.vpn.app.gtk.utils.executor import AsyncExecutor
-from proton.vpn.app.gtk.widgets.headerbar.menu.bug_report_dialog import BugReportForm
+from proton.vpn.app.gtk.utils.executor import AsyncExecutor, Lane
+from proton.vpn.app.gtk.utils.watchdog import MainLoopWatchdog
 from proton.vpn.app.gtk.config import AppConfig, APP_CONFIG
 from proton.vpn.connection.enum import KillSwitchSetting as KillSwitchSettingEnum
 
@@ -72,7 +82,9 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
         vpn_connector: VPNConnector = None,
         vpn_reconnector: VPNReconnector = None,
         app_config: AppConfig = None,
-        cache_handler: CacheHandler = None
+        cache_handler: CacheHandler = None,
+        main_loop_watchdog: MainLoopWatchdog = None,
+        server_list_snapshot_store: ServerListSnapshotStore = None
     ):  # pylint: disable=too-many-arguments
         self.executor = executor
 
@@ -86,10 +98,21 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
         self._api = api or ProtonVPNAPI(client_type_metadata)
         self._connector = vpn_connector
         self.reconnector = vpn_reconnector
+        # UI subscribers are notified through the dispatcher, which is only
+        # subscribed to the VPN connector while they are registered.
+        self._connection_status_dispatcher = ConnectionStatusDispatcher()
 
         self._app_config = app_config
         self._cache_handler = cache_handler or CacheHandler(APP_CONFIG)
 
+        # In-memory copy of the settings, loaded on first access.
+        self._settings: Optional[Settings] = None
+
+        # Started by the app once the main loop is about to run.
+        self.main_loop_watchdog = main_loop_watchdog or MainLoopWatchdog()
+
+        self._server_list_snapshot_store = server_list_snapshot_store or ServerListSnapshotStore()
+
     async def initialize_vpn_connector(self):
         """
         Runs the required initializations to be able to start new VPN connections.
@@ -100,9 +123,43 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
             vpn_data_refresher=self._api.refresher,
             vpn_connector=self._connector,
             vpn_monitor=VPNMonitor(vpn_connector=self._connector),
-            network_monitor=NetworkMonitor(pool=self.executor),
+            network_monitor=self._build_network_monitor(),
             session_monitor=SessionMonitor(),
-            async_executor=self.executor
+            async_executor=self.executor,
+            backoff_policy=self._build_backoff_policy()
+        )
+
+    def _build_network_monitor(self):
+        """
+        Returns the network monitor for the backend set in the app configuration:
+        "netlink" (default), "networkmanager" or "polling".
+        """
+        backend = self.get_app_configuration().network_monitor_backend
+        if backend == "networkmanager":
+            return NetworkManagerMonitor()
+
+        # Network checks gate every reconnection, so they shouldn't be
+        # queued behind the slow jobs run on the background lane.
+        pool = self.executor.lane(Lane.CRITICAL)
+        if backend == "polling":
+            return NetworkMonitor(pool=pool)
+        if backend != "netlink":
+            logger.warning(f"Unknown network monitor backend: {backend}.")
+
+        return NetlinkNetworkMonitor(pool=pool)
+
+    def _build_backoff_policy(self) -> BackoffPolicy:
+        """Returns the reconnection backoff policy set in the app configuration."""
+        app_config = self.get_app_configuration()
+        try:
+            jitter = Jitter(app_config.reconnection_jitter)
+        except ValueError:
+            logger.warning(f"Unknown reconnection jitter: {app_config.reconnection_jitter}.")
+            jitter = Jitter.PROPORTIONAL
+
+        return BackoffPolicy(
+            max_delay_ms=app_config.reconnection_max_delay_seconds * 1000,
+            jitter=jitter
         )
 
     def login(self, username: str, password: str) -> Future:
@@ -112,7 +169,9 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
         :param password:
         :return: A Future object wrapping the result of the login API call.
         """
-        return self.executor.submit(self._api.login, username, password)
+        future = self.executor.submit(self._api.login, username, password)
+        future.add_done_callback(lambda _: self.invalidate_settings_cache())
+        return future
 
     def submit_2fa_code(self, code: str) -> Future:
         """
@@ -120,14 +179,19 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
         :param code: The 2FA code.
         :return: A Future object wrapping the result of the 2FA verification.
         """
-        return self.executor.submit(self._api.submit_2fa_code, code)
+        future = self.executor.submit(self._api.submit_2fa_code, code)
+        future.add_done_callback(lambda _: self.invalidate_settings_cache())
+        return future
 
     def logout(self) -> Future:
         """
         Logs the user out.
         :return: A future to be able to track the logout completion.
         """
-        return self.executor.submit(self._api.logout)
+        future = self.executor.submit(self._api.logout)
+        future.add_done_callback(lambda _: self.invalidate_settings_cache())
+        future.add_done_callback(lambda _: self.remove_server_list_snapshot())
+        return future
 
     @property
     def user_logged_in(self) -> bool:
@@ -284,19 +348,49 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
             bug_report
         )
 
+    @property
+    def reconnection_outages(self) -> List[Outage]:
+        """Returns the timeline of the last VPN outages, from oldest to newest."""
+        if not self.reconnector:
+            return []
+        return self.reconnector.telemetry.outages
+
+    def export_reconnection_telemetry(self) -> str:
+        """Returns the timeline of the last VPN outages as a JSON document."""
+        if not self.reconnector:
+            return ReconnectionTelemetry().to_json()
+        return self.reconnector.telemetry.to_json()
+
+    def get_diagnostics(self) -> Dict[str, str]:
+        """
+        Returns the diagnostics attached to bug reports, indexed by file name:
+        the timeline of the last VPN outages and the main loop stalls.
+        """
+        return {
+            "reconnection-telemetry.json": self.export_reconnection_telemetry(),
+            "main-loop-stalls.json": self.main_loop_watchdog.to_json(),
+        }
+
     def register_connection_status_subscriber(self, subscriber):
         """
         Registers a new subscriber to connection status updates.
+
+        Subscribers are notified from the main thread, and only get the
+        latest state when several updates happen in quick succession.
         :param subscriber: The subscriber to be registered.
         """
-        self._connector.register(subscriber)
+        if not self._connection_status_dispatcher.has_subscribers:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            self._connector.register(self._connection_status_dispatcher)
+        self._connection_status_dispatcher.register(subscriber)
 
     def unregister_connection_status_subscriber(self, subscriber):
         """
         Unregisters an existing subscriber from connection status updates.
         :param subscriber: The subscriber to be unregistered.
         """
-        self._connector.unregister(subscriber)
+        self._connection_status_dispatcher.unregister(subscriber)
+        if not self._connection_status_dispatcher.has_subscribers:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            self._connector.unregister(self._connection_status_dispatcher)
 
     @property
     def vpn_connector(self) -> VPNConnector:
@@ -334,26 +428,53 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
         return metadata.version("proton-vpn-gtk-app")
 
     def get_settings(self) -> Settings:
-        """Returns general settings."""
+        """
+        Returns general settings.
 
-        return self.executor.submit(
-            self._api.load_settings
-        ).result()
+        Settings are only loaded from disk the first time they are requested,
+        or after the cache was invalidated. Afterwards, the in-memory copy is
+        returned.
+        """
+        settings = self._settings
+        if settings is None:
+            settings = self.executor.submit(
+                self._api.load_settings
+            ).result()
+            self._settings = settings
+
+        return settings
+
+    def invalidate_settings_cache(self):
+        """Forces settings to be loaded from disk the next time they are requested."""
+        self._settings = None
 
     def save_settings(self, settings: Settings, bubble_up_errors=True) -> Future:
         """
         Saves current settings to disk and updates the wireguard certificate
         if necessary.
+
+        The in-memory settings are updated immediately, while settings are
+        persisted asynchronously. If persisting them fails, the in-memory
+        settings are discarded so that they are loaded again from disk.
         """
+        self._settings = settings
+
         async def save(settings):
             # Save the settings to disk
             await self._api.save_settings(settings)
 
         future = self.executor.submit(
             save,
-            settings
+            # Settings might be modified again while they are being persisted.
+            copy.deepcopy(settings)
         )
 
+        def on_settings_saved(future: Future):
+            if future.cancelled() or future.exception() is not None:
+                self.invalidate_settings_cache()
+
+        future.add_done_callback(on_settings_saved)
+
         if bubble_up_errors:
             glib.bubble_up_errors(future)
 
@@ -380,7 +501,7 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
 
     def run_subprocess(self, commands: list, shell: bool = False) -> Future:
         """Run asynchronously subprocess command so it does not block UI."""
-        return self.executor.submit(
+        return self.executor.lane(Lane.BACKGROUND).submit(
             subprocess.run,
             commands,
             stdout=subprocess.PIPE,
@@ -417,6 +538,27 @@ class Controller:  # pylint: disable=too-many-public-methods, too-many-instance-
 
         future.add_done_callback(on_refresher_enabled)
 
+    def load_server_list_snapshot(self, callback: Callable[[Future], None]):
+        """
+        Loads the server list displayed the last time the app ran and calls
+        the callback with a future wrapping it (None if there isn't one).
+        """
+        future = self.executor.lane(Lane.CRITICAL).submit(
+            self._server_list_snapshot_store.load
+        )
+        future.add_done_callback(lambda f: GLib.idle_add(callback, f))
+
+    def save_server_list_snapshot(self, user_tier: int, server_list: ServerList) -> Future:
+        """Persists the server list being displayed, to display it on the next startup."""
+        return self.executor.lane(Lane.BACKGROUND).submit(
+            self._server_list_snapshot_store.save,
+            ServerListSnapshot(user_tier=user_tier, server_list=server_list)
+        )
+
+    def remove_server_list_snapshot(self):
+        """Removes the persisted server list, so that it's not shown to the next user."""
+        self._server_list_snapshot_store.remove()
+
     def disable_refresher(self):
         """Disables the refresher."""
         async def disable():
@@ -26,6 +26,13 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
+from proton.vpn.app.gtk.services.connection_status_dispatcher import \
+    ConnectionStatusDispatcher
 from proton.vpn.app.gtk.services.reconnector.reconnector import VPNReconnector
+from proton.vpn.app.gtk.services.server_list_snapshot import \
+    ServerListSnapshot, ServerListSnapshotStore
 
-__all__ = ["VPNReconnector"]
+__all__ = [
+    "ConnectionStatusDispatcher", "VPNReconnector",
+    "ServerListSnapshot", "ServerListSnapshotStore"
+]
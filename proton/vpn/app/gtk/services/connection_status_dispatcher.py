@@ -0,0 +1,96 @@
+"""
+Fan-out of VPN connection status updates to the UI.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import threading
+from typing import List, Optional
+
+from gi.repository import GLib
+
+from proton.vpn import logging
+from proton.vpn.connection import states
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStatusDispatcher:
+    """
+    Forwards VPN connection status updates to the UI subscribers.
+
+    The dispatcher is subscribed to the VPN connector, which notifies it
+    from another thread. Instead of each subscriber scheduling its own
+    callback on GLib's main loop, the dispatcher schedules a single one,
+    and bursts of updates received before it runs (e.g. Connecting followed
+    by Connected) are collapsed so that subscribers only get the latest
+    state.
+
+    Subscribers are notified on the main thread, calling their
+    `status_update` method. Note that some transitions are skipped, so
+    logic that needs to see every transition (e.g. the reconnector) should
+    subscribe to the VPN connector directly.
+    """
+
+    def __init__(self):
+        self._subscribers: List = []
+        self._lock = threading.Lock()
+        self._latest_state: Optional[states.State] = None
+        self._dispatch_src_id: Optional[int] = None
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Returns True if there is at least one subscriber and False otherwise."""
+        return bool(self._subscribers)
+
+    def register(self, subscriber):
+        """Registers a subscriber to connection status updates."""
+        if subscriber not in self._subscribers:
+            self._subscribers.append(subscriber)
+
+    def unregister(self, subscriber):
+        """Unregisters a subscriber from connection status updates."""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def status_update(self, connection_status: states.State):
+        """
+        This method is called by the VPN connector whenever the connection
+        state changes. It can be called from any thread.
+        """
+        with self._lock:
+            if self._latest_state is not None:
+                logger.debug(
+                    f"Connection status {type(self._latest_state).__name__} "
+                    f"superseded by {type(connection_status).__name__}."
+                )
+            self._latest_state = connection_status
+            if self._dispatch_src_id is None:
+                self._dispatch_src_id = GLib.idle_add(self._dispatch)
+
+    def _dispatch(self):
+        with self._lock:
+            connection_status = self._latest_state
+            self._latest_state = None
+            self._dispatch_src_id = None
+
+        # Subscribers may unregister themselves while being notified.
+        for subscriber in list(self._subscribers):
+            subscriber.status_update(connection_status)
+
+        return False
@@ -0,0 +1,109 @@
+"""
+Backoff policies used to space out VPN reconnection attempts.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from enum import Enum
+import random
+from typing import Optional
+
+
+class Jitter(Enum):
+    """Randomization applied to the exponential backoff delay."""
+    # No randomization.
+    NONE = "none"
+    # The delay is randomly increased or decreased by up to 10%.
+    PROPORTIONAL = "proportional"
+    # The delay is a random value between 0 and the exponential delay.
+    FULL = "full"
+    # The delay is a random value between the base delay and 3 times the
+    # previous delay, so that consecutive delays are not correlated.
+    DECORRELATED = "decorrelated"
+
+
+class BackoffPolicy:
+    """
+    Computes the delay before each retry attempt.
+
+    The delay grows exponentially with the number of previous attempts,
+    it's randomized according to the jitter mode and it never exceeds the
+    maximum delay. `reset` should be called once the retries succeeded.
+    """
+    PROPORTIONAL_JITTER_RATIO = 0.1
+    DECORRELATED_JITTER_MULTIPLIER = 3
+    MAX_EXPONENT = 64
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            base_delay_ms: float = 1000,
+            max_delay_ms: Optional[float] = 300_000,
+            multiplier: float = 2,
+            jitter: Jitter = Jitter.PROPORTIONAL,
+            rng: random.Random = None
+    ):
+        """
+        :param base_delay_ms: delay before the first retry attempt.
+        :param max_delay_ms: maximum delay. If None, the delay is not capped.
+        :param multiplier: factor by which the delay increases after each attempt.
+        :param jitter: randomization applied to the delay.
+        :param rng: random number generator. By default, the one from the
+            random module is used. It can be set to make delays deterministic
+            (e.g. in tests).
+        """
+        self.base_delay_ms = base_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._rng = rng or random
+        self._previous_delay_ms = None
+
+    def next_delay_ms(self, attempt: int) -> float:
+        """
+        Returns the delay before the specified retry attempt.
+
+        :param attempt: number of previous retry attempts.
+        """
+        if self.jitter == Jitter.DECORRELATED:
+            previous_delay_ms = self._previous_delay_ms or self.base_delay_ms
+            delay_ms = self._rng.uniform(  # nosec B311
+                self.base_delay_ms, previous_delay_ms * self.DECORRELATED_JITTER_MULTIPLIER
+            )
+        else:
+            # The exponent is bounded to avoid overflows after many attempts.
+            exponent = min(attempt, self.MAX_EXPONENT)
+            delay_ms = self._cap(self.base_delay_ms * self.multiplier ** exponent)
+            if self.jitter == Jitter.PROPORTIONAL:
+                delay_ms *= self._rng.uniform(  # nosec B311
+                    1 - self.PROPORTIONAL_JITTER_RATIO, 1 + self.PROPORTIONAL_JITTER_RATIO
+                )
+            elif self.jitter == Jitter.FULL:
+                delay_ms = self._rng.uniform(0, delay_ms)  # nosec B311
+
+        delay_ms = self._cap(delay_ms)
+        self._previous_delay_ms = delay_ms
+        return delay_ms
+
+    def reset(self):
+        """Resets the policy state after retries succeeded or were cancelled."""
+        self._previous_delay_ms = None
+
+    def _cap(self, delay_ms: float) -> float:
+        if self.max_delay_ms is None:
+            return delay_ms
+        return min(delay_ms, self.max_delay_ms)
@@ -0,0 +1,172 @@
+"""
+Network connectivity monitoring through NetworkManager's D-Bus API.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from typing import Callable, Optional
+
+from dbus import SystemBus
+from dbus.mainloop.glib import DBusGMainLoop
+
+from proton.vpn import logging
+
+DBusGMainLoop(set_as_default=True)
+
+logger = logging.getLogger(__name__)
+
+BUS_NAME = "org.freedesktop.NetworkManager"
+OBJECT_PATH = "/org/freedesktop/NetworkManager"
+NETWORK_MANAGER_INTERFACE = "org.freedesktop.NetworkManager"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+STATE_CHANGED_SIGNAL = "StateChanged"
+PROPERTIES_CHANGED_SIGNAL = "PropertiesChanged"
+
+# https://networkmanager.dev/docs/api/latest/nm-dbus-types.html
+NM_STATE_CONNECTED_GLOBAL = 70
+NM_CONNECTIVITY_UNKNOWN = 0
+NM_CONNECTIVITY_FULL = 4
+
+
+class NetworkManagerMonitor:
+    """
+    Network monitor that, instead of polling, subscribes to NetworkManager's
+    `StateChanged` signal and to changes of its `State` and `Connectivity`
+    properties.
+
+    After being enabled, it calls the callback set on the network_up_callback
+    attribute as soon as NetworkManager reports global connectivity.
+
+    The network is considered up when NetworkManager's state is
+    CONNECTED_GLOBAL. The connectivity is only used as an extra condition,
+    since it may not be refreshed yet when the state changes (e.g. while
+    roaming), and it's unknown when connectivity checking is disabled.
+
+    Note that it requires a GLib main loop to be running, since D-Bus
+    signals are dispatched on it.
+
+    Attributes:
+        network_up_callback: callable that will be called whenever connectivity
+        to the Internet is detected.
+    """
+
+    def __init__(self, bus: SystemBus = None):
+        self._bus = bus
+        self._signal_receivers = []
+        self._state: Optional[int] = None
+        self._connectivity: Optional[int] = None
+        self._is_network_up = None
+        self.network_up_callback: Callable = None
+
+    def enable(self):
+        """
+        Enables the network connectivity monitor.
+
+        The current NetworkManager state is read asynchronously, and then
+        updated whenever NetworkManager notifies about changes.
+        """
+        if not self._bus:
+            self._bus = SystemBus()
+
+        self._signal_receivers = [
+            self._bus.add_signal_receiver(
+                handler_function=self._on_state_changed,
+                signal_name=STATE_CHANGED_SIGNAL,
+                dbus_interface=NETWORK_MANAGER_INTERFACE,
+                bus_name=BUS_NAME,
+                path=OBJECT_PATH,
+            ),
+            self._bus.add_signal_receiver(
+                handler_function=self._on_properties_changed,
+                signal_name=PROPERTIES_CHANGED_SIGNAL,
+                dbus_interface=PROPERTIES_INTERFACE,
+                bus_name=BUS_NAME,
+                path=OBJECT_PATH,
+            ),
+        ]
+
+        network_manager = self._bus.get_object(BUS_NAME, OBJECT_PATH, introspect=False)
+        network_manager.GetAll(
+            NETWORK_MANAGER_INTERFACE,
+            dbus_interface=PROPERTIES_INTERFACE,
+            reply_handler=self._on_initial_properties,
+            error_handler=self._on_initial_properties_error
+        )
+
+    def disable(self):
+        """Disables the network connectivity monitor."""
+        for signal_receiver in self._signal_receivers:
+            signal_receiver.remove()
+        self._signal_receivers = []
+        self._state = None
+        self._connectivity = None
+        self._is_network_up = None
+
+    @property
+    def is_network_up(self) -> bool:
+        """
+        Returns True if the device is connected to the network or False otherwise.
+        Note: the value returned is based on the last state reported by NetworkManager.
+        """
+        return self._is_network_up
+
+    @property
+    def is_enabled(self) -> bool:
+        """Returns whether the network monitor is enabled or not."""
+        return bool(self._signal_receivers)
+
+    def _on_initial_properties(self, properties: dict):
+        # Signals received in the meantime are more recent.
+        if self._state is None:
+            self._state = properties.get("State")
+        if self._connectivity is None:
+            self._connectivity = properties.get("Connectivity")
+        self._update_network_state()
+
+    def _on_initial_properties_error(self, error: Exception):
+        logger.warning(f"Unable to read NetworkManager state: {error}")
+
+    def _on_state_changed(self, state: int):
+        self._state = int(state)
+        self._update_network_state()
+
+    def _on_properties_changed(
+            self, interface_name: str, changed_properties: dict, _invalidated_properties=None
+    ):
+        if interface_name != NETWORK_MANAGER_INTERFACE:
+            return
+
+        if "State" in changed_properties:
+            self._state = int(changed_properties["State"])
+        if "Connectivity" in changed_properties:
+            self._connectivity = int(changed_properties["Connectivity"])
+        self._update_network_state()
+
+    def _update_network_state(self):
+        if not self.is_enabled:
+            return
+
+        network_up = (
+            self._state == NM_STATE_CONNECTED_GLOBAL
+            and self._connectivity in (None, NM_CONNECTIVITY_UNKNOWN, NM_CONNECTIVITY_FULL)
+        )
+        network_just_went_up = not self._is_network_up and network_up
+        self._is_network_up = network_up
+
+        if network_just_went_up and self.network_up_callback:
+            self.network_up_callback()
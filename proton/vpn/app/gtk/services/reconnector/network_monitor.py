@@ -19,9 +19,12 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
+import os
+import socket
+import struct
 import subprocess  # nosec B404 # nosemgrep: gitlab.bandit.B404
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
 from gi.repository import GLib
 
@@ -31,18 +34,213 @@ from proton.vpn.app.gtk.utils.glib import run_once, run_periodically
 logger = logging.getLogger(__name__)
 
 
+# 192.0.2.1 is used because is a valid IP that won't be in use,
+# since it is reserved for documentation purposes:
+# https://www.rfc-editor.org/rfc/rfc5737.html
+TEST_IPV4_ADDRESS = "192.0.2.1"
+
+IPV4_ROUTE_TABLE = "/proc/net/route"
+IPV6_ROUTE_TABLE = "/proc/net/ipv6_route"
+
+# Route flags. See include/uapi/linux/route.h.
+RTF_UP = 0x0001
+RTF_REJECT = 0x0200
+
+# Netlink constants used to dump the routing rules.
+# See netlink(7), rtnetlink(7) and include/uapi/linux/fib_rules.h.
+NETLINK_ROUTE = 0
+NLMSG_HEADER = struct.Struct("=IHHII")  # length, type, flags, sequence, port id
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+RTM_NEWRULE = 32
+RTM_GETRULE = 34
+# family, destination/source length, tos, table, 2 reserved bytes, action and flags.
+FIB_RULE_HEADER = struct.Struct("=BBBBBBBBI")
+RTATTR_HEADER = struct.Struct("=HH")  # length, type
+FRA_TABLE = 15
+FR_ACT_TO_TBL = 1
+
+# Tables looked up by the routing rules that exist when there isn't any
+# policy routing in place.
+RT_TABLE_DEFAULT = 253
+RT_TABLE_MAIN = 254
+RT_TABLE_LOCAL = 255
+DEFAULT_ROUTING_TABLES = (RT_TABLE_DEFAULT, RT_TABLE_MAIN, RT_TABLE_LOCAL)
+
+
 def check_for_network_connectivity() -> bool:
     """
     Checks for network connectivity and returns True if connected or False otherwise.
+
+    Connectivity is detected by looking up an IPv4 route to the test address
+    or an IPv6 default route in the kernel routing tables exposed in procfs,
+    which avoids spawning a process on every check.
+
+    Only the main routing table is exposed in procfs, so `ip route get` is used
+    instead when there are policy routing rules (e.g. set up by a VPN), when
+    they can't be retrieved or when the routing tables can't be read.
+
+    Note that policy routing rules are usually in place while a VPN
+    connection or the kill switch are set up, so on those hosts every check
+    still spawns a process.
     """
-    # 192.0.2.1 is used because is a valid IP that won't be in use,
-    # since it is reserved for documentation purposes:
-    # https://www.rfc-editor.org/rfc/rfc5737.html
-    result = subprocess.run(                                                    # nosec B603, B607
-        ["ip", "route", "get", "192.0.2.1"], check=False, capture_output=True)  # nosec B607
+    if has_policy_routing_rules() is False:
+        route_found = check_for_route_in_route_tables()
+        if route_found is not None:
+            return route_found
+
+    result = subprocess.run(                                                      # nosec B603, B607
+        ["ip", "route", "get", TEST_IPV4_ADDRESS], check=False, capture_output=True)  # nosec B607
     return result.returncode == 0
 
 
+def check_for_route_in_route_tables(
+        ipv4_route_table: str = IPV4_ROUTE_TABLE,
+        ipv6_route_table: str = IPV6_ROUTE_TABLE
+) -> Optional[bool]:
+    """
+    Returns whether there is an IPv4 route to the test address or an IPv6
+    default route, or None if the routing tables could not be read.
+
+    Only usable (up and not rejecting) routes are taken into account.
+    """
+    try:
+        with open(ipv4_route_table, encoding="utf-8") as route_table:
+            if _has_ipv4_route_to(route_table, TEST_IPV4_ADDRESS):
+                return True
+    except (OSError, ValueError) as error:
+        logger.debug(f"Unable to look up route in {ipv4_route_table}: {error}")
+        return None
+
+    try:
+        with open(ipv6_route_table, encoding="utf-8") as route_table:
+            return _has_ipv6_default_route(route_table)
+    except FileNotFoundError:
+        # IPv6 is disabled.
+        return False
+    except (OSError, ValueError) as error:
+        logger.debug(f"Unable to look up route in {ipv6_route_table}: {error}")
+        return None
+
+
+def has_policy_routing_rules(
+        socket_factory: Callable[[], socket.socket] = None
+) -> Optional[bool]:
+    """
+    Returns whether there are routing rules other than the default ones,
+    which only look up routes in the local, main and default tables, or
+    None if the routing rules could not be retrieved.
+    """
+    try:
+        with (socket_factory or _open_rtnetlink_request_socket)() as netlink_socket:
+            return any(
+                not (action == FR_ACT_TO_TBL and table in DEFAULT_ROUTING_TABLES)
+                for action, table in _dump_routing_rules(netlink_socket)
+            )
+    except (OSError, struct.error) as error:
+        logger.debug(f"Unable to retrieve routing rules: {error}")
+        return None
+
+
+def _open_rtnetlink_request_socket() -> socket.socket:
+    netlink_socket = socket.socket(  # pylint: disable=no-member
+        socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE
+    )
+    netlink_socket.settimeout(1)
+    return netlink_socket
+
+
+def _dump_routing_rules(netlink_socket: socket.socket) -> Iterator[Tuple[int, int]]:
+    """Yields the action and the table of the routing rules of all address families."""
+    request = NLMSG_HEADER.pack(
+        NLMSG_HEADER.size + FIB_RULE_HEADER.size, RTM_GETRULE,
+        NLM_F_REQUEST | NLM_F_DUMP, 1, 0
+    ) + FIB_RULE_HEADER.pack(socket.AF_UNSPEC, 0, 0, 0, 0, 0, 0, 0, 0)
+    netlink_socket.sendto(request, (0, 0))
+
+    while True:
+        data = netlink_socket.recv(65536)
+        if not data:
+            return
+
+        for message_type, payload in _parse_netlink_messages(data):
+            if message_type == NLMSG_DONE:
+                return
+            if message_type == NLMSG_ERROR:
+                error_code, = struct.unpack_from("=i", payload)
+                if error_code:
+                    raise OSError(-error_code, os.strerror(-error_code))
+            elif message_type == RTM_NEWRULE:
+                yield _parse_routing_rule(payload)
+
+
+def _parse_netlink_messages(data: bytes) -> Iterator[Tuple[int, bytes]]:
+    offset = 0
+    while offset + NLMSG_HEADER.size <= len(data):
+        length, message_type, _, _, _ = NLMSG_HEADER.unpack_from(data, offset)
+        if length < NLMSG_HEADER.size:
+            return
+        yield message_type, data[offset + NLMSG_HEADER.size:offset + length]
+        offset += _netlink_align(length)
+
+
+def _parse_routing_rule(payload: bytes) -> Tuple[int, int]:
+    *_, table, _, _, action, _ = FIB_RULE_HEADER.unpack_from(payload)
+    # Tables with ids above 255 are only specified in the FRA_TABLE attribute.
+    offset = FIB_RULE_HEADER.size
+    while offset + RTATTR_HEADER.size <= len(payload):
+        length, attribute_type = RTATTR_HEADER.unpack_from(payload, offset)
+        if length < RTATTR_HEADER.size:
+            break
+        if attribute_type == FRA_TABLE:
+            table, = struct.unpack_from("=I", payload, offset + RTATTR_HEADER.size)
+        offset += _netlink_align(length)
+    return action, table
+
+
+def _netlink_align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def _has_ipv4_route_to(route_table: Iterable[str], ip_address: str) -> bool:
+    # Addresses in /proc/net/route are in network byte order, printed as
+    # native-endian (little endian on all supported platforms) hex integers.
+    address = int.from_bytes(socket.inet_aton(ip_address), "little")
+    lines = iter(route_table)
+    next(lines, None)  # Skip header.
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 8:
+            continue
+
+        destination, flags, mask = int(fields[1], 16), int(fields[3], 16), int(fields[7], 16)
+        if (
+            flags & RTF_UP and not flags & RTF_REJECT
+            and address & mask == destination & mask
+        ):
+            return True
+
+    return False
+
+
+def _has_ipv6_default_route(route_table: Iterable[str]) -> bool:
+    for line in route_table:
+        fields = line.split()
+        if len(fields) < 10:
+            continue
+
+        prefix_length, flags, device = int(fields[1], 16), int(fields[8], 16), fields[9]
+        if (
+            prefix_length == 0 and device != "lo"
+            and flags & RTF_UP and not flags & RTF_REJECT
+        ):
+            return True
+
+    return False
+
+
 class NetworkMonitor:
     """
     After being enabled, it calls the callback set on the network_up_callback
@@ -114,3 +312,141 @@ class NetworkMonitor:
     def is_enabled(self) -> bool:
         """Returns whether the network monitor is enabled or not."""
         return self._polling_handler_id is not None
+
+
+# rtnetlink multicast groups notifying about link and route changes.
+# See rtnetlink(7).
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_ROUTE = 0x40
+RTMGRP_IPV6_ROUTE = 0x400
+
+
+def open_rtnetlink_socket() -> socket.socket:
+    """
+    Returns a non-blocking netlink socket subscribed to link and route
+    change notifications.
+    """
+    netlink_socket = socket.socket(  # pylint: disable=no-member
+        socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE
+    )
+    try:
+        netlink_socket.setblocking(False)
+        netlink_socket.bind((0, RTMGRP_LINK | RTMGRP_IPV4_ROUTE | RTMGRP_IPV6_ROUTE))
+    except OSError:
+        netlink_socket.close()
+        raise
+
+    return netlink_socket
+
+
+class NetlinkNetworkMonitor(NetworkMonitor):
+    """
+    Network monitor that checks the network state whenever the kernel
+    notifies about link or route changes through an rtnetlink socket,
+    instead of polling for it.
+
+    Since a single network change usually results in a burst of
+    notifications, notifications are coalesced and the network state
+    is only checked once per burst.
+
+    If the netlink socket can't be used, it falls back to polling.
+    """
+    # Time to wait for further notifications before checking the network state.
+    COALESCE_INTERVAL_MS = 100
+    RECV_BUFFER_SIZE = 65536
+
+    def __init__(
+            self, pool: ThreadPoolExecutor, polling_interval_ms: int = 5000,
+            socket_factory: Callable[[], socket.socket] = open_rtnetlink_socket,
+            coalesce_interval_ms: int = COALESCE_INTERVAL_MS
+    ):
+        super().__init__(pool, polling_interval_ms)
+        self._socket_factory = socket_factory
+        self._coalesce_interval_ms = coalesce_interval_ms
+        self._socket: Optional[socket.socket] = None
+        self._watch_handler_id = None
+        self._coalesce_handler_id = None
+
+    def enable(self):
+        """
+        Enables the network connectivity monitor.
+
+        The network state is checked once and then every time a link or
+        route change is notified.
+        """
+        try:
+            self._socket = self._socket_factory()
+        except OSError as error:
+            logger.warning(
+                f"Unable to monitor network changes via netlink ({error}). "
+                "Falling back to polling."
+            )
+            super().enable()
+            return
+
+        self._watch_handler_id = GLib.io_add_watch(
+            self._socket.fileno(), GLib.PRIORITY_DEFAULT,
+            GLib.IOCondition.IN | GLib.IOCondition.ERR | GLib.IOCondition.HUP,
+            self._on_netlink_socket_event
+        )
+        self.check_network_state_async()
+
+    def disable(self):
+        """Disables the network connectivity monitor."""
+        self._stop_watching_netlink_socket()
+        super().disable()
+
+    @property
+    def is_enabled(self) -> bool:
+        """Returns whether the network monitor is enabled or not."""
+        return self._watch_handler_id is not None or super().is_enabled
+
+    def _on_netlink_socket_event(self, _fd, condition: GLib.IOCondition) -> bool:
+        if condition & (GLib.IOCondition.ERR | GLib.IOCondition.HUP):
+            logger.warning("Netlink socket closed unexpectedly. Falling back to polling.")
+            self._stop_watching_netlink_socket()
+            super().enable()
+            return False
+
+        self._drain_netlink_socket()
+
+        if self._coalesce_handler_id is None:
+            self._coalesce_handler_id = GLib.timeout_add(
+                self._coalesce_interval_ms, self._on_coalesce_interval_elapsed
+            )
+
+        return True
+
+    def _drain_netlink_socket(self):
+        # The notification contents are not relevant, since the network state
+        # is checked anyway. They just need to be read so that the socket
+        # does not stay readable.
+        while True:
+            try:
+                if not self._socket.recv(self.RECV_BUFFER_SIZE):
+                    return
+            except BlockingIOError:
+                return
+            except OSError as error:
+                # e.g. ENOBUFS, if notifications were dropped because the
+                # receive buffer was full. The network state is checked anyway.
+                logger.debug(f"Error reading netlink notifications: {error}")
+                return
+
+    def _on_coalesce_interval_elapsed(self) -> bool:
+        self._coalesce_handler_id = None
+        self.check_network_state_async()
+        return False
+
+    def _stop_watching_netlink_socket(self):
+        if self._watch_handler_id is not None:
+            GLib.source_remove(self._watch_handler_id)
+            self._watch_handler_id = None
+
+        if self._coalesce_handler_id is not None:
+            GLib.source_remove(self._coalesce_handler_id)
+            self._coalesce_handler_id = None
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
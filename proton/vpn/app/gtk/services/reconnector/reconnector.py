@@ -19,7 +19,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-import random
+from typing import List, Optional, Tuple, Union
 
 from gi.repository import GLib
 from proton.vpn.core.refresher import VPNDataRefresher
@@ -28,9 +28,16 @@ from proton.vpn import logging
 from proton.vpn.connection import states, VPNConnection, events
 from proton.vpn.connection.exceptions import VPNConnectionError, AuthenticationError
 from proton.vpn.core.connection import VPNConnector
+from proton.vpn.session.servers import LogicalServer
 
+from proton.vpn.app.gtk.services.reconnector.backoff import BackoffPolicy
 from proton.vpn.app.gtk.services.reconnector.network_monitor import NetworkMonitor
+from proton.vpn.app.gtk.services.reconnector.network_manager_monitor import \
+    NetworkManagerMonitor
 from proton.vpn.app.gtk.services.reconnector.session_monitor import SessionMonitor
+from proton.vpn.app.gtk.services.reconnector.telemetry import (
+    OutagePhase, ReconnectionTelemetry
+)
 from proton.vpn.app.gtk.services.reconnector.vpn_monitor import VPNMonitor
 from proton.vpn.app.gtk.utils.executor import AsyncExecutor
 
@@ -47,17 +54,31 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
     Currently, it requires a GLib MainLoop to be running. In a future version,
     the reconnector will be refactored so that it runs in a separate python
     process and will run its own main loop.
+
+    If reconnecting to the same server keeps failing, or the server is not
+    available anymore, it falls back to alternative servers in the same
+    country and with the same features.
     """
 
+    # Number of failed attempts to reconnect to the same server before trying
+    # alternative servers.
+    FALLBACK_AFTER_FAILED_ATTEMPTS = 2
+    # Maximum number of alternative servers to try.
+    MAX_FALLBACK_SERVERS = 5
+    # Maximum delay between attempts while trying alternative servers.
+    FALLBACK_MAX_RETRY_DELAY_IN_MS = 3000
+
     # pylint: disable=too-many-arguments
     def __init__(
             self,
             vpn_connector: VPNConnector,
             vpn_data_refresher: VPNDataRefresher,
             vpn_monitor: VPNMonitor,
-            network_monitor: NetworkMonitor,
+            network_monitor: Union[NetworkMonitor, NetworkManagerMonitor],
             session_monitor: SessionMonitor,
-            async_executor: AsyncExecutor
+            async_executor: AsyncExecutor,
+            backoff_policy: BackoffPolicy = None,
+            telemetry: ReconnectionTelemetry = None
     ):
         self._vpn_connector = vpn_connector
         self._vpn_data_refresher = vpn_data_refresher
@@ -74,11 +95,25 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
         self._session_monitor.session_unlocked_callback = self._on_session_unlocked
 
         self._executor = async_executor
+        self._backoff_policy = backoff_policy or BackoffPolicy()
+        self._telemetry = telemetry or ReconnectionTelemetry()
 
         self._new_certificate_src_id = None
         self._retry_src_id = None
         self.retry_counter = 0
 
+        # Server the VPN was last connected to, to be able to go back to it
+        # after trying alternatives, and to find alternatives even if it's
+        # removed from the server list.
+        self._last_connected_logical_server: Optional[LogicalServer] = None
+        # Alternative servers to try, with their VPN server already resolved.
+        self._fallback_servers: Optional[List[Tuple[LogicalServer, object]]] = None
+
+    @property
+    def telemetry(self) -> ReconnectionTelemetry:
+        """Returns the timeline of the last VPN outages."""
+        return self._telemetry
+
     @property
     def is_reconnection_scheduled(self) -> bool:
         """Returns True if there is a pending scheduled reconnection and False otherwise."""
@@ -132,6 +167,9 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
         logger.info(
             f"Reconnection attempt #{self.retry_counter} scheduled in "
             f"{retry_delay/1000:.2f} seconds.")
+        self._telemetry.record(
+            OutagePhase.ATTEMPT_SCHEDULED, f"attempt #{self.retry_counter} in {retry_delay} ms"
+        )
         self._retry_src_id = GLib.timeout_add(retry_delay, self._reconnect)
         return True
 
@@ -154,6 +192,7 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
         unlocked.
         """
         logger.info("Session unlocked.")
+        self._telemetry.record(OutagePhase.SESSION_UNLOCKED)
         self._reset_retry_counter()
 
         if not self.did_vpn_drop:
@@ -173,6 +212,7 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
         the internet.
         """
         logger.info("Network connectivity was detected.")
+        self._telemetry.record(OutagePhase.NETWORK_UP)
         self._reset_retry_counter()
 
         if not self.did_vpn_drop:
@@ -188,6 +228,7 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
     def _on_vpn_drop(self, event: events.Event):
         """Callback called by the VPN monitor when a VPN connection drop was detected."""
         logger.info("VPN connection drop was detected.")
+        self._telemetry.record(OutagePhase.DROP, type(event).__name__)
         if isinstance(event, events.ExpiredCertificate):
             self._handle_certificate_expired()
             return
@@ -209,11 +250,17 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
     def _on_vpn_up(self):
         """Callback called by the VPN monitor when the VPN connection is up."""
         logger.debug("VPN connection is up.")
+        self._telemetry.record(OutagePhase.CONNECTED)
         self._reset_retry_counter()
 
+        connection = self._current_connection
+        if connection:
+            self._last_connected_logical_server = self._get_logical_server(connection.server_id)
+
     def _on_vpn_disconnected(self):
         """Callback called by the VPN monitor when the VPN connection is disconnected."""
         logger.info("VPN connection is disconnected.")
+        self._telemetry.record(OutagePhase.DISCONNECTED)
         self._reset_retry_counter()
 
     def _reconnect(self):
@@ -232,8 +279,11 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
             self.schedule_reconnection()
             return False
 
-        vpn_server = self._get_vpn_server(connection.server_id)
+        vpn_server = self._get_next_vpn_server()
         if vpn_server:
+            self._telemetry.record(
+                OutagePhase.ATTEMPT_STARTED, f"attempt #{self.retry_counter}"
+            )
             future = self._executor.submit(
                 self._vpn_connector.connect,
                 vpn_server,
@@ -243,7 +293,8 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
             future.add_done_callback(lambda f: GLib.idle_add(f.result))
             self._increase_retry_counter()
         else:
-            # The server was removed from the server list after the user had connected to it.
+            # The server was removed from the server list after the user had
+            # connected to it, and there are no alternatives.
             logger.warning(
                 "VPN Reconnection not possible: logical server not found "
                 f"(id = {connection.server_id})"
@@ -251,29 +302,129 @@ class VPNReconnector:  # pylint: disable=too-many-instance-attributes
 
         return False  # Remove periodic source
 
-    def _get_vpn_server(self, server_id: str):
-        logical_server = self._vpn_data_refresher.server_list.get_by_id(server_id)
-        if not logical_server:
-            return None
-        client_config = self._vpn_data_refresher.client_config
+    def _get_logical_server(self, server_id: str) -> Optional[LogicalServer]:
+        return self._vpn_data_refresher.server_list.get_by_id(server_id)
 
+    def _get_vpn_server(self, logical_server: LogicalServer):
+        client_config = self._vpn_data_refresher.client_config
         return self._vpn_connector.get_vpn_server(logical_server, client_config)
 
+    def _get_connected_logical_server(self) -> Optional[LogicalServer]:
+        """
+        Returns the server the VPN was connected to before the outage.
+
+        The current connection can't be used for that, since it points to the
+        last server attempted, which may be one of the alternatives.
+        """
+        if not self._last_connected_logical_server and self._current_connection:
+            self._last_connected_logical_server = self._get_logical_server(
+                self._current_connection.server_id
+            )
+        return self._last_connected_logical_server
+
+    def _get_fallback_server_index(self) -> Optional[int]:
+        """
+        Returns the index of the alternative server to try on the next
+        attempt, or None if the next attempt is not a fallback attempt.
+
+        Whether an attempt is a fallback attempt depends on the number of
+        previous attempts: alternatives are tried right after the connected
+        server failed too many times (or immediately, if the connected server
+        is not available anymore), one per attempt.
+        """
+        connected_logical_server = self._get_connected_logical_server()
+        if not connected_logical_server:
+            return None
+
+        is_connected_server_available = bool(
+            self._get_logical_server(connected_logical_server.id)
+        )
+        first_fallback_attempt = self.FALLBACK_AFTER_FAILED_ATTEMPTS \
+            if is_connected_server_available else 0
+        index = self.retry_counter - first_fallback_attempt
+        if index < 0:
+            return None
+
+        if self._fallback_servers is None:
+            self._fallback_servers = self._resolve_fallback_servers(connected_logical_server)
+
+        if index < len(self._fallback_servers):
+            return index
+
+        return None
+
+    def _get_next_vpn_server(self):
+        """
+        Returns the VPN server to reconnect to: the one the VPN was connected
+        to, unless it failed too many times or is not available anymore,
+        in which case the next alternative server is returned.
+        """
+        fallback_server_index = self._get_fallback_server_index()
+        if fallback_server_index is not None:
+            fallback_logical_server, fallback_vpn_server = \
+                self._fallback_servers[fallback_server_index]
+            logger.info(f"Trying alternative server {fallback_logical_server.name}.")
+            return fallback_vpn_server
+
+        # There are no alternatives (left), so we keep trying with the connected server.
+        connected_logical_server = self._get_connected_logical_server()
+        logical_server = connected_logical_server and self._get_logical_server(
+            connected_logical_server.id
+        )
+        return self._get_vpn_server(logical_server) if logical_server else None
+
+    def _resolve_fallback_servers(
+            self, logical_server: Optional[LogicalServer]
+    ) -> List[Tuple[LogicalServer, object]]:
+        """
+        Returns the best ranked servers the user has access to in the same
+        country and with exactly the same features as the specified server,
+        together with their VPN servers.
+
+        Servers with extra features (e.g. Secure Core or Tor) are not
+        considered, since they would change how the user's traffic is routed.
+        """
+        if not logical_server:
+            return []
+
+        server_list = self._vpn_data_refresher.server_list
+        features = set(logical_server.features)
+        alternatives = sorted(
+            (
+                server for server in server_list
+                if server.id != logical_server.id
+                and server.enabled
+                and server.tier <= server_list.user_tier
+                and server.exit_country == logical_server.exit_country
+                and set(server.features) == features
+            ),
+            key=lambda server: server.score
+        )[:self.MAX_FALLBACK_SERVERS]
+
+        return [(server, self._get_vpn_server(server)) for server in alternatives]
+
     def _calculate_retry_delay_in_milliseconds(self) -> int:
         """
         Returns the amount of milliseconds to wait before a VPN connection retry.
 
-        The amount of time increases exponentially based on the number of
-        previous attempts.
+        The amount of time depends on the number of previous attempts, and
+        is computed by the backoff policy.
         """
-        return (2 ** self.retry_counter *
-                random.uniform(0.9, 1.1) * 1000)  # nosec B311 # noqa: E501 # pylint: disable=line-too-long # nosemgrep: gitlab.bandit.B311
+        delay = self._backoff_policy.next_delay_ms(self.retry_counter)
+
+        if self._get_fallback_server_index() is not None:
+            # Alternative servers are tried in quick succession.
+            delay = min(delay, self.FALLBACK_MAX_RETRY_DELAY_IN_MS)
+
+        return delay
 
     def _reset_retry_counter(self):
         if self._retry_src_id:
             GLib.source_remove(self._retry_src_id)
             self._retry_src_id = None
         self.retry_counter = 0
+        self._fallback_servers = None
+        self._backoff_policy.reset()
 
     def _increase_retry_counter(self):
         self.retry_counter += 1
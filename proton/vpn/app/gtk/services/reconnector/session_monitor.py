@@ -19,12 +19,17 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Callable
+from typing import Callable, Optional
 import dbus
 from dbus import SystemBus
 from dbus.mainloop.glib import DBusGMainLoop
+
+from proton.vpn import logging
+
 DBusGMainLoop(set_as_default=True)
 
+logger = logging.getLogger(__name__)
+
 
 BUS_NAME = "org.freedesktop.login1"
 SEAT_AUTO_PATH = "/org/freedesktop/login1/seat/auto"
@@ -32,6 +37,8 @@ SESSION_INTERFACE = "org.freedesktop.login1.Session"
 SEAT_INTERFACE = "org.freedesktop.login1.Seat"
 PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
 UNLOCK_SIGNAL = "Unlock"
+PROPERTIES_CHANGED_SIGNAL = "PropertiesChanged"
+LOCKED_HINT_PROPERTY = "LockedHint"
 
 
 class SessionMonitor:
@@ -39,6 +46,10 @@ class SessionMonitor:
     After being enabled, it calls the callback set on the
     session_unlocked_callback attribute whenever the user session was unlocked.
 
+    While enabled, it also keeps track of the session `LockedHint` property,
+    so that checking whether the session is unlocked does not require a
+    D-Bus round trip.
+
     Attributes:
         session_unlocked_callback: callable that will be called when the user
         session is unlocked.
@@ -46,7 +57,10 @@ class SessionMonitor:
     def __init__(self, bus: SystemBus = None, session_object_path: str = None):
         self._bus = bus
         self._session_object_path = session_object_path
+        self._session_proxy = None
         self._signal_receiver = None
+        self._properties_signal_receiver = None
+        self._locked_hint: Optional[bool] = None
         self.session_unlocked_callback: Callable = None
 
     def enable(self):
@@ -67,6 +81,7 @@ class SessionMonitor:
             bus_name=BUS_NAME,
             path=self._session_object_path,
         )
+        self._track_locked_hint()
 
     def disable(self):
         """Disables user session monitoring"""
@@ -74,15 +89,86 @@ class SessionMonitor:
             self._signal_receiver.remove()
             self._signal_receiver = None
 
+        if self._properties_signal_receiver:
+            self._properties_signal_receiver.remove()
+            self._properties_signal_receiver = None
+
+        self._locked_hint = None
+
     @property
     def is_session_unlocked(self):
-        """Returns True if the user session is unlocked or False otherwise."""
-        if not self._session_object_path:
-            self._setup()
+        """
+        Returns True if the user session is unlocked or False otherwise.
+
+        While the monitor is enabled, the value returned is the last one
+        notified by logind, so this call doesn't block. Otherwise (or if the
+        initial lock state could not be read yet) the lock state is read
+        synchronously. If it can't be read, the session is assumed to be
+        locked, and it will be read again on the next call.
+        """
+        if self._locked_hint is not None:
+            return not self._locked_hint
+
+        locked_hint = self._read_locked_hint()
+        if locked_hint is None:
+            return False
+
+        if self._properties_signal_receiver:
+            # Changes are notified from now on.
+            self._locked_hint = locked_hint
+
+        return not locked_hint
+
+    def _read_locked_hint(self) -> Optional[bool]:
+        try:
+            if not self._bus:
+                self._bus = SystemBus()
+
+            if not self._session_object_path:
+                self._setup()
+
+            return bool(self._get_session_proxy().Get(
+                SESSION_INTERFACE, LOCKED_HINT_PROPERTY, dbus_interface=PROPERTIES_INTERFACE
+            ))
+        except (dbus.DBusException, RuntimeError) as error:
+            logger.warning(f"Unable to read session lock state: {error}")
+            return None
+
+    def _get_session_proxy(self):
+        if self._session_proxy is None:
+            self._session_proxy = self._bus.get_object(
+                BUS_NAME, self._session_object_path, introspect=False
+            )
+        return self._session_proxy
+
+    def _track_locked_hint(self):
+        session_proxy = self._get_session_proxy()
+        self._properties_signal_receiver = session_proxy.connect_to_signal(
+            PROPERTIES_CHANGED_SIGNAL,
+            self._on_session_properties_changed,
+            dbus_interface=PROPERTIES_INTERFACE
+        )
+        session_proxy.Get(
+            SESSION_INTERFACE, LOCKED_HINT_PROPERTY,
+            dbus_interface=PROPERTIES_INTERFACE,
+            reply_handler=self._on_initial_locked_hint,
+            error_handler=self._on_initial_locked_hint_error
+        )
+
+    def _on_initial_locked_hint(self, locked_hint: bool):
+        # A value notified in the meantime is more recent.
+        if self._locked_hint is None:
+            self._locked_hint = bool(locked_hint)
+
+    def _on_initial_locked_hint_error(self, error: Exception):
+        # The lock state will be read synchronously when it's checked.
+        logger.warning(f"Unable to read session lock state: {error}")
 
-        active_session = self._bus.get_object(BUS_NAME, self._session_object_path)
-        active_session_properties = dbus.Interface(active_session, PROPERTIES_INTERFACE)
-        return not bool(active_session_properties.Get(SESSION_INTERFACE, "LockedHint"))
+    def _on_session_properties_changed(
+            self, interface_name: str, changed_properties: dict, _invalidated_properties=None
+    ):
+        if interface_name == SESSION_INTERFACE and LOCKED_HINT_PROPERTY in changed_properties:
+            self._locked_hint = bool(changed_properties[LOCKED_HINT_PROPERTY])
 
     def _setup(self):
         seat_auto_proxy = self._bus.get_object(
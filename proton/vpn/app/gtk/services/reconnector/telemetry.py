@@ -0,0 +1,213 @@
+"""
+Reconnection telemetry: timeline of the phases of each VPN outage.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Deque, Dict, List, Optional
+
+from proton.vpn import logging
+
+logger = logging.getLogger(__name__)
+
+
+class OutagePhase(Enum):
+    """Phases an outage goes through, from the VPN drop until the VPN is up again."""
+    DROP = "drop"
+    NETWORK_UP = "network_up"
+    SESSION_UNLOCKED = "session_unlocked"
+    ATTEMPT_SCHEDULED = "attempt_scheduled"
+    ATTEMPT_STARTED = "attempt_started"
+    CONNECTED = "connected"
+    # The user disconnected before the VPN connection could be recovered.
+    DISCONNECTED = "disconnected"
+
+
+# Phases that end an outage.
+FINAL_PHASES = (OutagePhase.CONNECTED, OutagePhase.DISCONNECTED)
+
+
+@dataclass
+class OutageEvent:
+    """
+    A phase of an outage and the time it happened.
+
+    Attributes:
+        phase: phase of the outage.
+        timestamp: seconds since the epoch, to be displayed.
+        monotonic_time: seconds according to a monotonic clock, used to
+            measure latencies, since the wall clock may be stepped during
+            the outage (e.g. by NTP once the network is back).
+        details: optional details about the phase.
+    """
+    phase: OutagePhase
+    timestamp: float
+    monotonic_time: float
+    details: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Returns the event as a JSON serializable dict."""
+        return {
+            "phase": self.phase.value,
+            "timestamp": self.timestamp,
+            "details": self.details
+        }
+
+
+@dataclass
+class Outage:
+    """
+    Timeline of a VPN outage.
+
+    The first event is always the VPN drop. Phases can happen more than once
+    (e.g. several reconnection attempts), and the outage ends once the VPN
+    is connected again or the user disconnects.
+    """
+    events: List[OutageEvent] = field(default_factory=list)
+
+    @property
+    def started_at(self) -> float:
+        """Time the VPN connection dropped."""
+        return self.events[0].timestamp
+
+    @property
+    def ended_at(self) -> Optional[float]:
+        """Time the outage ended, or None if it's still ongoing."""
+        if self.is_ongoing:
+            return None
+        return self.events[-1].timestamp
+
+    @property
+    def is_ongoing(self) -> bool:
+        """Returns True if the outage didn't end yet."""
+        return self.events[-1].phase not in FINAL_PHASES
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds between the VPN drop and the end of the outage."""
+        if self.is_ongoing:
+            return None
+        return self.events[-1].monotonic_time - self.events[0].monotonic_time
+
+    @property
+    def attempts(self) -> int:
+        """Number of reconnection attempts started during the outage."""
+        return sum(1 for event in self.events if event.phase is OutagePhase.ATTEMPT_STARTED)
+
+    def phase_latencies(self) -> Dict[str, float]:
+        """
+        Returns the seconds elapsed between the VPN drop and the first time
+        each of the phases was reached, indexed by phase name.
+        """
+        latencies = {}
+        drop_time = self.events[0].monotonic_time
+        for event in self.events[1:]:
+            latencies.setdefault(event.phase.value, event.monotonic_time - drop_time)
+        return latencies
+
+    def to_dict(self) -> dict:
+        """Returns the outage as a JSON serializable dict."""
+        return {
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "duration": self.duration,
+            "attempts": self.attempts,
+            "phase_latencies": self.phase_latencies(),
+            "events": [event.to_dict() for event in self.events]
+        }
+
+
+class ReconnectionTelemetry:
+    """
+    Records the timeline of the last VPN outages.
+
+    The reconnector records each phase as it happens. Phases recorded while
+    there is no ongoing outage are ignored, except for the VPN drop, which
+    starts a new one.
+    """
+    DEFAULT_MAX_OUTAGES = 20
+
+    def __init__(
+            self, max_outages: int = DEFAULT_MAX_OUTAGES,
+            clock: Callable[[], float] = time.monotonic,
+            wall_clock: Callable[[], float] = time.time
+    ):
+        """
+        :param max_outages: number of outages to keep.
+        :param clock: monotonic clock used to measure latencies.
+        :param wall_clock: clock used to timestamp the outage phases.
+        """
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._outages: Deque[Outage] = deque(maxlen=max_outages)
+        # Outages are recorded from the main thread but they can be read
+        # from other threads (e.g. when generating the bug report logs).
+        self._lock = threading.Lock()
+
+    def record(self, phase: OutagePhase, details: str = None):
+        """Records an outage phase."""
+        with self._lock:
+            outage = self._get_ongoing_outage()
+            if outage is None:
+                if phase is not OutagePhase.DROP:
+                    return
+                outage = Outage()
+                self._outages.append(outage)
+
+            outage.events.append(
+                OutageEvent(phase, self._wall_clock(), self._clock(), details)
+            )
+
+        if not outage.is_ongoing:
+            logger.info(
+                f"VPN outage ended ({phase.value}) after {outage.duration:.2f} seconds "
+                f"and {outage.attempts} attempts: {outage.phase_latencies()}"
+            )
+
+    @property
+    def outages(self) -> List[Outage]:
+        """Returns the last outages, from oldest to newest."""
+        with self._lock:
+            return list(self._outages)
+
+    @property
+    def ongoing_outage(self) -> Optional[Outage]:
+        """Returns the ongoing outage, if any."""
+        with self._lock:
+            return self._get_ongoing_outage()
+
+    def to_dict(self) -> dict:
+        """Returns the last outages as a JSON serializable dict."""
+        return {"outages": [outage.to_dict() for outage in self.outages]}
+
+    def to_json(self) -> str:
+        """Returns the last outages as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def _get_ongoing_outage(self) -> Optional[Outage]:
+        if self._outages and self._outages[-1].is_ongoing:
+            return self._outages[-1]
+        return None
@@ -0,0 +1,129 @@
+"""
+Persisted snapshot of the server list displayed the last time the app ran.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from proton.vpn import logging
+from proton.vpn.core.cache_handler import CacheHandler
+from proton.vpn.session.servers import LogicalServer, ServerList
+
+from proton.vpn.app.gtk.config import SERVER_LIST_SNAPSHOT
+
+logger = logging.getLogger(__name__)
+
+# Snapshots persisted with a different version are discarded. It should be
+# increased whenever the format of the snapshot changes.
+SNAPSHOT_VERSION = 1
+
+# Logical server fields required to display the server list.
+_LOGICAL_SERVER_KEYS = (
+    "ID", "Name", "EntryCountry", "ExitCountry", "HostCountry", "City",
+    "Tier", "Features", "Load", "Score", "Status"
+)
+
+
+@dataclass
+class ServerListSnapshot:
+    """
+    Server list displayed to the user, stripped down to the fields required
+    to display it again.
+
+    Attributes:
+        user_tier: tier of the user the server list was displayed to.
+        server_list: server list that was displayed.
+    """
+    user_tier: int
+    server_list: ServerList
+
+    def to_dict(self) -> dict:
+        """Returns the snapshot as a JSON serializable dict."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "user_tier": self.user_tier,
+            "logical_servers": [_compact(server) for server in self.server_list]
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> ServerListSnapshot:
+        """
+        Creates the snapshot from the provided dict.
+        :raises ValueError: if the snapshot was persisted with another version.
+        """
+        version = data.get("version")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported server list snapshot version: {version}.")
+
+        return ServerListSnapshot(
+            user_tier=data["user_tier"],
+            server_list=ServerList.from_dict({
+                "LogicalServers": data["logical_servers"],
+                "MaxTier": data["user_tier"]
+            })
+        )
+
+
+def _compact(server: LogicalServer) -> dict:
+    data = server.to_dict()
+    compact_data = {key: data[key] for key in _LOGICAL_SERVER_KEYS if key in data}
+    # Only the status of the physical servers is required, to know
+    # whether the logical server is enabled or not.
+    compact_data["Servers"] = [
+        {"Status": physical_server.get("Status")}
+        for physical_server in data.get("Servers", [])
+    ]
+    return compact_data
+
+
+class ServerListSnapshotStore:
+    """
+    Persists the server list snapshot to disk, next to the app configuration.
+
+    The snapshot is displayed on startup, while the up-to-date server list
+    is being retrieved, so that the user doesn't have to wait for it to be
+    able to see the app.
+    """
+
+    def __init__(self, cache_handler: CacheHandler = None):
+        self._cache_handler = cache_handler or CacheHandler(SERVER_LIST_SNAPSHOT)
+
+    def load(self) -> Optional[ServerListSnapshot]:
+        """Returns the persisted snapshot, or None if there isn't a usable one."""
+        data = self._cache_handler.load()
+        if data is None:
+            return None
+
+        try:
+            return ServerListSnapshot.from_dict(data)
+        except (ValueError, KeyError, TypeError) as error:
+            logger.warning(f"Discarding server list snapshot: {error}")
+            self._cache_handler.remove()
+            return None
+
+    def save(self, snapshot: ServerListSnapshot):
+        """Persists the snapshot, replacing the previous one."""
+        self._cache_handler.save(snapshot.to_dict())
+
+    def remove(self):
+        """Removes the persisted snapshot."""
+        self._cache_handler.remove()
@@ -16,19 +16,141 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
+from __future__ import annotations
+
 import asyncio
 import concurrent
 import functools
 import inspect
 from concurrent.futures import ThreadPoolExecutor
-from threading import Thread
-from typing import Optional, Coroutine, Callable, Union
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock, Thread
+from typing import Dict, Optional, Coroutine, Callable, Union
 
 from proton.vpn import logging
+from proton.vpn.app.gtk.utils.instrumentation import TaskInstrumentation, TaskStats
 
 logger = logging.getLogger(__name__)
 
 
+class Lane(Enum):
+    """Thread pools blocking functions can be submitted to."""
+    # Work the user is waiting for (e.g. connecting or disconnecting). It's
+    # also where blocking work from coroutines is run.
+    CRITICAL = "critical"
+    # Work submitted without specifying a lane.
+    DEFAULT = "default"
+    # Slow work nobody is actively waiting for (e.g. collecting logs or
+    # running subprocesses).
+    BACKGROUND = "background"
+
+
+# Maximum number of threads per lane. None means ThreadPoolExecutor's default.
+DEFAULT_LANE_MAX_WORKERS = {
+    Lane.CRITICAL: 4,
+    Lane.DEFAULT: None,
+    Lane.BACKGROUND: 2,
+}
+
+
+@dataclass
+class LaneStats:
+    """
+    Snapshot of the work submitted to a lane.
+
+    Attributes:
+        queued: number of functions waiting for a thread.
+        running: number of functions being run.
+    """
+    queued: int = 0
+    running: int = 0
+
+
+class ExecutorLane:
+    """
+    Thread pool with bounded concurrency, keeping track of the number of
+    functions queued and running.
+
+    Coroutine functions are not run on the lane's thread pool but on the
+    asyncio loop of the async executor the lane belongs to.
+    """
+
+    def __init__(
+            self, lane: Lane, async_executor: AsyncExecutor,
+            executor: Optional[ThreadPoolExecutor] = None,
+            max_workers: Optional[int] = None
+    ):
+        self.lane = lane
+        self._async_executor = async_executor
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{lane.value}-lane"
+        )
+        self._lock = Lock()
+        self._stats = LaneStats()
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """Returns the thread pool backing the lane."""
+        return self._executor
+
+    @property
+    def stats(self) -> LaneStats:
+        """Returns a snapshot of the work submitted to the lane."""
+        with self._lock:
+            return LaneStats(queued=self._stats.queued, running=self._stats.running)
+
+    # pylint: disable=invalid-name
+    def submit(self, fn: Union[Coroutine, Callable], *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Submits a coroutine function or a callable to be run in a thread-safe
+        and non-blocking manner.
+
+        :returns: a Future that can be waited for in a non-asyncio manner (or not).
+        """
+        if inspect.iscoroutinefunction(fn):
+            return self._async_executor.submit(fn, *args, **kwargs)
+
+        instrumentation = self._async_executor.instrumentation
+        if instrumentation:
+            fn = instrumentation.wrap(fn, lane=self.lane.value)
+
+        with self._lock:
+            self._stats.queued += 1
+
+        try:
+            future = self._executor.submit(self._run, fn, *args, **kwargs)
+        except Exception:
+            self._on_dequeued()
+            raise
+
+        future.add_done_callback(self._on_done)
+        return future
+
+    def shutdown(self, wait: bool = True):
+        """Shuts down the lane's thread pool."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, fn: Callable, *args, **kwargs):
+        with self._lock:
+            self._stats.queued -= 1
+            self._stats.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._stats.running -= 1
+
+    def _on_done(self, future: concurrent.futures.Future):
+        if future.cancelled():
+            # Cancelled futures never started running.
+            self._on_dequeued()
+
+    def _on_dequeued(self):
+        with self._lock:
+            self._stats.queued -= 1
+
+
 class AsyncExecutor:
     """
     Allows non-asyncio code to execute both coroutine functions and regular (blocking) functions
@@ -54,15 +176,43 @@ class AsyncExecutor:
             assert future1.result() == "async func done"
             assert future2.result() == "regular func done"
 
+    Regular functions are run on separate thread pools (lanes), so that
+    the work the user is waiting for is not queued behind slow background
+    jobs. `submit` uses the default lane, while other lanes are used through
+    `lane`:
+
+    .. code-block:: python
+        with AsyncExecutor() as ce:
+            future = ce.lane(Lane.BACKGROUND).submit(regular_func, blocking_time=0)
+
     """
 
     def __init__(
             self, loop: Optional[asyncio.AbstractEventLoop] = None,
-            executor: Optional[ThreadPoolExecutor] = None
+            executor: Optional[ThreadPoolExecutor] = None,
+            lane_max_workers: Optional[Dict[Lane, Optional[int]]] = None,
+            instrumentation: Optional[TaskInstrumentation] = None
     ):
+        """
+        :param loop: asyncio loop to run coroutine functions on.
+        :param executor: thread pool backing the default lane.
+        :param lane_max_workers: maximum number of threads per lane.
+        :param instrumentation: optional instrumentation recording the
+            timings of the submitted tasks.
+        """
         self._thread: Optional[Thread] = None
-        self._executor = executor or ThreadPoolExecutor()
         self._loop = loop or asyncio.new_event_loop()
+        self.instrumentation = instrumentation
+
+        lane_max_workers = {**DEFAULT_LANE_MAX_WORKERS, **(lane_max_workers or {})}
+        self._lanes = {
+            lane: ExecutorLane(
+                lane, self,
+                executor=executor if lane is Lane.DEFAULT else None,
+                max_workers=max_workers
+            )
+            for lane, max_workers in lane_max_workers.items()
+        }
 
     def start(self):
         """
@@ -81,9 +231,27 @@ class AsyncExecutor:
         """Returns True if the async executor has already been started and False otherwise."""
         return self._thread is not None
 
+    def lane(self, lane: Lane) -> ExecutorLane:
+        """Returns the specified lane, to submit regular functions to it."""
+        return self._lanes[lane]
+
+    def lane_stats(self) -> Dict[Lane, LaneStats]:
+        """Returns a snapshot of the work submitted to each lane."""
+        return {lane: executor_lane.stats for lane, executor_lane in self._lanes.items()}
+
+    def task_stats(self) -> Dict[str, TaskStats]:
+        """
+        Returns the timings of the tasks submitted so far, indexed by task
+        name, or an empty dict if the executor is not instrumented.
+        """
+        if not self.instrumentation:
+            return {}
+        return self.instrumentation.snapshot()
+
     def _run_asyncio_loop_forever(self):
-        self._executor = ThreadPoolExecutor()
-        self._loop.set_default_executor(self._executor)
+        # Blocking work run from coroutines (e.g. connecting to the VPN) goes
+        # to the critical lane, which is shut down together with the loop.
+        self._loop.set_default_executor(self._lanes[Lane.CRITICAL].thread_pool)
         asyncio.set_event_loop(self._loop)
         try:
             self._loop.run_forever()
@@ -109,6 +277,10 @@ class AsyncExecutor:
         self._thread.join()
         self._thread = None
 
+        for lane, executor_lane in self._lanes.items():
+            if lane is not Lane.CRITICAL:
+                executor_lane.shutdown()
+
     # pylint: disable=invalid-name
     def submit(self, fn: Union[Coroutine, Callable], *args, **kwargs) -> concurrent.futures.Future:
         """
@@ -118,10 +290,12 @@ class AsyncExecutor:
         :returns: a Future that can be waited for in a non-asyncio manner (or not).
         """
         if inspect.iscoroutinefunction(fn):
+            if self.instrumentation:
+                fn = self.instrumentation.wrap(fn)
             coroutine = fn(*args, **kwargs)
             return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
 
-        return self._executor.submit(fn, *args, **kwargs)
+        return self._lanes[Lane.DEFAULT].submit(fn, *args, **kwargs)
 
     async def _blocking_function_to_coroutine(self, fn, *args, **kwargs):
         fn_wrapper = functools.partial(fn, *args, **kwargs)
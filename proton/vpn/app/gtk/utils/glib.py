@@ -19,8 +19,9 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
+import time
 from concurrent.futures import Future
-from typing import Callable
+from typing import Callable, Iterable, Optional
 
 from gi.repository import GLib
 
@@ -59,6 +60,46 @@ def run_periodically(function, *args, interval_ms: int, **kwargs) -> int:
     return GLib.timeout_add(interval_ms, wrapper_function)
 
 
+def run_in_batches(
+        function: Callable, items: Iterable, on_complete: Optional[Callable] = None,
+        time_budget_ms: float = 8, priority=GLib.PRIORITY_DEFAULT_IDLE
+) -> Optional[int]:
+    """
+    Calls the function once per item on the GLib main loop, in batches.
+
+    Each batch runs until the time budget is exhausted, and then control
+    is given back to the main loop so that it can process user input and
+    draw a frame before processing the next batch. The first batch is
+    processed synchronously.
+
+    :param function: function to be called with each one of the items.
+    :param items: items to be processed.
+    :param on_complete: optional function to be called once all items were processed.
+    :param time_budget_ms: maximum amount of time each batch is allowed to take.
+    :param priority: priority of the GLib source processing the batches.
+    :return: the id of the GLib source processing the pending batches, or
+        None if all items were processed in the first batch.
+    """
+    iterator = iter(items)
+
+    def process_batch():
+        deadline = time.monotonic() + time_budget_ms / 1000
+        for item in iterator:
+            function(item)
+            if time.monotonic() >= deadline:
+                # True is returned so that GLib processes the next batch.
+                return True
+
+        if on_complete:
+            on_complete()
+        return False
+
+    if not process_batch():
+        return None
+
+    return GLib.idle_add(process_batch, priority=priority)
+
+
 def bubble_up_errors(future: Future):
     """Makes sure that any error the future resolves to bubbles up to the GLib main loop."""
     future.add_done_callback(lambda f: GLib.idle_add(f.result))
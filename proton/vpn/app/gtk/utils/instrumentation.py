@@ -0,0 +1,265 @@
+"""
+Instrumentation of the tasks submitted to the async executor.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import bisect
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from proton.vpn import logging
+
+logger = logging.getLogger(__name__)
+
+# Task instrumentation is enabled either with the command line option or by
+# setting the environment variable.
+INSTRUMENT_TASKS_OPTION = "instrument-tasks"
+INSTRUMENT_TASKS_ENV_VAR = "PROTON_VPN_INSTRUMENT_TASKS"
+
+# Upper bounds (in milliseconds) of the histogram buckets. Values above the
+# last bound are counted in an extra overflow bucket.
+DEFAULT_BUCKET_BOUNDS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 30000)
+
+# Frames from these modules are skipped when looking for the call site.
+_INSTRUMENTATION_MODULES = (
+    os.path.normcase(__file__),
+    os.path.normcase(os.path.join(os.path.dirname(__file__), "executor.py")),
+)
+
+
+@dataclass
+class Histogram:
+    """Distribution of durations, in milliseconds."""
+    bucket_bounds_ms: Tuple[float, ...] = DEFAULT_BUCKET_BOUNDS_MS
+    bucket_counts: Optional[List[int]] = None
+    count: int = 0
+    total_ms: float = 0
+    max_ms: float = 0
+
+    def __post_init__(self):
+        if self.bucket_counts is None:
+            self.bucket_counts = [0] * (len(self.bucket_bounds_ms) + 1)
+
+    def record(self, duration_ms: float):
+        """Records a duration."""
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds_ms, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        """Average duration."""
+        return self.total_ms / self.count if self.count else 0
+
+    def percentile_ms(self, percentile: float) -> float:
+        """
+        Returns the upper bound of the bucket containing the specified
+        percentile (between 0 and 100), or the maximum duration if it's in
+        the overflow bucket.
+        """
+        if not self.count:
+            return 0
+
+        rank = percentile / 100 * self.count
+        accumulated = 0
+        for bound, bucket_count in zip(self.bucket_bounds_ms, self.bucket_counts):
+            accumulated += bucket_count
+            if accumulated >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def copy(self) -> Histogram:
+        """Returns a copy of the histogram."""
+        return Histogram(
+            bucket_bounds_ms=self.bucket_bounds_ms,
+            bucket_counts=list(self.bucket_counts),
+            count=self.count,
+            total_ms=self.total_ms,
+            max_ms=self.max_ms
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the histogram as a JSON serializable dict."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile_ms(50),
+            "p95_ms": self.percentile_ms(95),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(
+                [f"<={bound}" for bound in self.bucket_bounds_ms] + ["overflow"],
+                self.bucket_counts
+            ))
+        }
+
+
+@dataclass
+class TaskStats:
+    """
+    Timings of the tasks submitted with the same name.
+
+    Attributes:
+        queue_wait: time elapsed between a task being submitted and it
+            starting to run.
+        run_time: time elapsed between a task starting and finishing to run.
+        slow_tasks: number of tasks that exceeded the slow task threshold.
+    """
+    queue_wait: Histogram = field(default_factory=Histogram)
+    run_time: Histogram = field(default_factory=Histogram)
+    slow_tasks: int = 0
+
+    def copy(self) -> TaskStats:
+        """Returns a copy of the task stats."""
+        return TaskStats(
+            queue_wait=self.queue_wait.copy(),
+            run_time=self.run_time.copy(),
+            slow_tasks=self.slow_tasks
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the task stats as a JSON serializable dict."""
+        return {
+            "queue_wait": self.queue_wait.to_dict(),
+            "run_time": self.run_time.to_dict(),
+            "slow_tasks": self.slow_tasks
+        }
+
+
+def get_task_name(fn: Callable) -> str:
+    """Returns the name tasks running the specified callable are recorded with."""
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    return getattr(fn, "__qualname__", None) or getattr(fn, "__name__", None) \
+        or type(fn).__name__
+
+
+def get_call_site() -> str:
+    """Returns the location the task is being submitted from."""
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame and os.path.normcase(frame.f_code.co_filename) in _INSTRUMENTATION_MODULES:
+        frame = frame.f_back
+    if not frame:
+        return "unknown"
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def is_task_instrumentation_enabled(
+        argv: List[str] = None, environ: Dict[str, str] = None
+) -> bool:
+    """Returns whether task instrumentation was enabled by the user."""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    return f"--{INSTRUMENT_TASKS_OPTION}" in argv or bool(environ.get(INSTRUMENT_TASKS_ENV_VAR))
+
+
+class TaskInstrumentation:
+    """
+    Measures how long the tasks submitted to the async executor wait before
+    running and how long they run, grouped by task name.
+
+    Tasks taking longer than the slow task threshold (queue wait plus run
+    time) are logged together with the location they were submitted from.
+    """
+    DEFAULT_SLOW_TASK_THRESHOLD_MS = 1000
+
+    def __init__(
+            self, slow_task_threshold_ms: float = DEFAULT_SLOW_TASK_THRESHOLD_MS,
+            clock: Callable[[], float] = time.perf_counter
+    ):
+        self.slow_task_threshold_ms = slow_task_threshold_ms
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: Dict[str, TaskStats] = {}
+
+    def wrap(self, fn: Callable, lane: Optional[str] = None) -> Callable:
+        """
+        Returns a callable (or a coroutine function, if `fn` is one) that
+        records the timings of `fn` when it's called.
+
+        It should be called at the time the task is submitted, since that's
+        when the queue wait starts being measured.
+        """
+        name = get_task_name(fn)
+        call_site = get_call_site()
+        submitted_at = self._clock()
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def coroutine_wrapper(*args, **kwargs):
+                started_at = self._clock()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    self._record(name, call_site, lane, submitted_at, started_at)
+            return coroutine_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started_at = self._clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(name, call_site, lane, submitted_at, started_at)
+        return wrapper
+
+    def snapshot(self) -> Dict[str, TaskStats]:
+        """Returns a copy of the timings recorded so far, indexed by task name."""
+        with self._lock:
+            return {name: stats.copy() for name, stats in self._stats.items()}
+
+    def to_dict(self) -> dict:
+        """Returns the timings recorded so far as a JSON serializable dict."""
+        return {name: stats.to_dict() for name, stats in self.snapshot().items()}
+
+    def reset(self):
+        """Discards the timings recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def _record(  # pylint: disable=too-many-arguments
+            self, name: str, call_site: str, lane: Optional[str],
+            submitted_at: float, started_at: float
+    ):
+        finished_at = self._clock()
+        queue_wait_ms = (started_at - submitted_at) * 1000
+        run_time_ms = (finished_at - started_at) * 1000
+        is_slow = queue_wait_ms + run_time_ms > self.slow_task_threshold_ms
+
+        with self._lock:
+            stats = self._stats.setdefault(name, TaskStats())
+            stats.queue_wait.record(queue_wait_ms)
+            stats.run_time.record(run_time_ms)
+            if is_slow:
+                stats.slow_tasks += 1
+
+        if is_slow:
+            logger.warning(
+                f"Slow task {name} submitted from {call_site}"
+                f"{f' to the {lane} lane' if lane else ''}: "
+                f"waited {queue_wait_ms:.0f} ms and ran for {run_time_ms:.0f} ms."
+            )
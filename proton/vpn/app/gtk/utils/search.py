@@ -17,8 +17,142 @@ GNU General Public License for more details.
 
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>."""
+import threading
+from collections import defaultdict
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
 
 
 def normalize(search_string: str):
     """Returns the normalized version of the input search string."""
     return search_string.lower().replace(" ", "")
+
+
+class SearchIndex(Generic[T]):
+    """
+    N-gram index used to find the entries whose normalized name contains
+    the normalized search text.
+
+    All the substrings of up to NGRAM_LENGTH characters of each name are
+    indexed. To search, only the entries containing the least common n-gram
+    of the search text are checked for a match, which keeps the cost of a
+    search independent of the total number of entries.
+    """
+    NGRAM_LENGTH = 3
+
+    def __init__(self, entries: Iterable[Tuple[str, T]]):
+        """
+        :param entries: (name, value) pairs, where name is the text to be
+            searched and value what the search returns for it.
+        """
+        self._names: List[str] = []
+        self._values: List[T] = []
+        # Entry ids are appended in increasing order, so posting lists are sorted.
+        self._ngrams: Dict[str, List[int]] = defaultdict(list)
+
+        for entry_id, (name, value) in enumerate(entries):
+            normalized_name = normalize(name)
+            self._names.append(normalized_name)
+            self._values.append(value)
+            for ngram in self._get_ngrams(normalized_name):
+                self._ngrams[ngram].append(entry_id)
+
+    def __len__(self):
+        return len(self._values)
+
+    def _get_ngrams(self, text: str) -> Set[str]:
+        return {
+            text[start:start + length]
+            for length in range(1, self.NGRAM_LENGTH + 1)
+            for start in range(len(text) - length + 1)
+        }
+
+    def search(self, search_text: str) -> List[T]:
+        """
+        Returns the values of the entries whose name contains the search
+        text, in the same order the entries were indexed.
+        """
+        return self.get_values(self.search_entry_ids(normalize(search_text or "")))
+
+    def get_values(self, entry_ids: List[int]) -> List[T]:
+        """Returns the values of the specified entries."""
+        return [self._values[entry_id] for entry_id in entry_ids]
+
+    def search_entry_ids(
+            self, normalized_search_text: str, candidate_ids: Optional[List[int]] = None
+    ) -> List[int]:
+        """
+        Returns the ids of the entries whose name contains the normalized
+        search text, sorted in ascending order.
+
+        :param normalized_search_text: the normalized search text.
+        :param candidate_ids: optional sorted list of entry ids known to contain
+            all the matching entries (e.g. the result of a previous search for
+            a substring of the search text). If it's shorter than the candidates
+            found in the index, only these entries are checked.
+        """
+        if not normalized_search_text:
+            return []
+
+        if len(normalized_search_text) <= self.NGRAM_LENGTH:
+            # A copy is returned so that callers can't modify the index.
+            return list(self._ngrams.get(normalized_search_text, []))
+
+        ngram_length = self.NGRAM_LENGTH
+        index_candidate_ids = min(
+            (self._ngrams.get(normalized_search_text[start:start + ngram_length], [])
+             for start in range(len(normalized_search_text) - ngram_length + 1)),
+            key=len
+        )
+        if candidate_ids is None or len(index_candidate_ids) < len(candidate_ids):
+            candidate_ids = index_candidate_ids
+
+        return [
+            entry_id for entry_id in candidate_ids
+            if normalized_search_text in self._names[entry_id]
+        ]
+
+
+class IncrementalSearch(Generic[T]):
+    """
+    Searches a SearchIndex, narrowing down the results of the previous search
+    when the search text is extended (e.g. "uni" -> "unit") instead of
+    searching the whole index again.
+
+    Searches can be done from multiple threads.
+    """
+
+    def __init__(self, index: SearchIndex[T]):
+        self._index = index
+        self._lock = threading.Lock()
+        self._previous_search_text = ""
+        self._previous_entry_ids: List[int] = []
+
+    @property
+    def index(self) -> SearchIndex[T]:
+        """Returns the index being searched."""
+        return self._index
+
+    def search(self, search_text: str) -> List[T]:
+        """
+        Returns the values of the entries whose name contains the search
+        text, in the same order the entries were indexed.
+        """
+        search_text = normalize(search_text or "")
+        with self._lock:
+            previous_search_text = self._previous_search_text
+            previous_entry_ids = self._previous_entry_ids
+
+        candidate_ids = None
+        if previous_search_text and previous_search_text in search_text:
+            # Any entry containing the new search text also contains the previous one.
+            candidate_ids = previous_entry_ids
+
+        entry_ids = self._index.search_entry_ids(search_text, candidate_ids)
+
+        with self._lock:
+            self._previous_search_text = search_text
+            self._previous_entry_ids = entry_ids
+
+        return self._index.get_values(entry_ids)
@@ -0,0 +1,259 @@
+"""
+Opt-in tracing of the app startup phases.
+
+This module is imported before GTK, so that the time it takes to import
+it can be traced as well. It should not import GTK.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from proton.vpn import logging
+
+logger = logging.getLogger(__name__)
+
+# Startup tracing is enabled either with the command line option or by
+# setting the environment variable. The value of the environment variable
+# is used as trace file path, unless it's "1".
+TRACE_STARTUP_OPTION = "trace-startup"
+TRACE_STARTUP_ENV_VAR = "PROTON_VPN_TRACE_STARTUP"
+
+DEFAULT_TRACE_PATH = os.path.join(tempfile.gettempdir(), "proton-vpn-startup-trace.json")
+
+
+@dataclass
+class StartupPhase:
+    """
+    Startup phase, with its start and end times in seconds since the
+    process started.
+    """
+    name: str
+    start: float
+    end: Optional[float] = None
+    thread_id: int = 0
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the phase lasted, or None if it didn't end yet."""
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def to_chrome_trace_event(self, pid: int) -> dict:
+        """Returns the phase as an event in the Chrome trace event format."""
+        event = {
+            "name": self.name,
+            "cat": "startup",
+            "pid": pid,
+            "tid": self.thread_id,
+            "ts": self.start * 1_000_000,
+        }
+        if self.duration:
+            event.update({"ph": "X", "dur": self.duration * 1_000_000})
+        else:
+            # Phases without duration are displayed as instant events.
+            event.update({"ph": "i", "s": "g"})
+        return event
+
+
+def get_process_start_time(clock: Callable[[], float] = time.monotonic) -> Optional[float]:
+    """
+    Returns the time the process started according to the specified clock,
+    or None if it can't be determined (it's only supported on Linux).
+    """
+    try:
+        with open("/proc/self/stat", encoding="utf-8") as stat_file:
+            stat = stat_file.read()
+        # The process name (between parenthesis) may contain spaces, so
+        # fields are counted after it. The start time is the 22nd field.
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        # The start time is measured in clock ticks since boot.
+        process_age = time.clock_gettime(time.CLOCK_BOOTTIME) \
+            - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+    return clock() - process_age
+
+
+def is_startup_tracing_enabled(argv: List[str] = None, environ: Dict[str, str] = None) -> bool:
+    """Returns whether startup tracing was enabled by the user."""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    return f"--{TRACE_STARTUP_OPTION}" in argv or bool(environ.get(TRACE_STARTUP_ENV_VAR))
+
+
+def get_trace_path(environ: Dict[str, str] = None) -> str:
+    """Returns the path of the file the startup trace is written to."""
+    environ = os.environ if environ is None else environ
+    trace_path = environ.get(TRACE_STARTUP_ENV_VAR)
+    if not trace_path or trace_path == "1":
+        return DEFAULT_TRACE_PATH
+    return trace_path
+
+
+class StartupTracer:
+    """
+    Records the time spent on each startup phase, from the time the
+    process started until the app is ready to be used.
+
+    Phases are recorded with a monotonic clock and are only kept when
+    tracing is enabled. Once startup finishes, a summary is logged and the
+    phases are written to a file in the Chrome trace event format, which can
+    be loaded in chrome://tracing or https://ui.perfetto.dev. Phases
+    recorded after that (e.g. after logging in again) are ignored.
+    """
+
+    def __init__(
+            self, enabled: bool = False, trace_path: str = DEFAULT_TRACE_PATH,
+            clock: Callable[[], float] = time.monotonic, process_start_time: float = None
+    ):
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self._clock = clock
+        self._origin = process_start_time if process_start_time is not None else clock()
+        self._phases: List[StartupPhase] = []
+        self._ongoing_phases: Dict[str, StartupPhase] = {}
+        self._last_phase_end = 0.0
+        self._finished = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_environment() -> StartupTracer:
+        """Returns a tracer enabled or not depending on the command line and
+        the environment variables."""
+        return StartupTracer(
+            enabled=is_startup_tracing_enabled(),
+            trace_path=get_trace_path(),
+            process_start_time=get_process_start_time()
+        )
+
+    @property
+    def phases(self) -> List[StartupPhase]:
+        """Returns the phases recorded so far, in the order they started."""
+        with self._lock:
+            return sorted(self._phases, key=lambda phase: phase.start)
+
+    def begin(self, name: str):
+        """Records the start of a phase, which will end when `end` is called."""
+        if not self._is_recording:
+            return
+
+        with self._lock:
+            phase = StartupPhase(name, self._now(), thread_id=threading.get_ident())
+            self._ongoing_phases[name] = phase
+            self._phases.append(phase)
+
+    def end(self, name: str):
+        """Records the end of a phase started with `begin`."""
+        if not self._is_recording:
+            return
+
+        with self._lock:
+            phase = self._ongoing_phases.pop(name, None)
+            if phase is not None:
+                phase.end = self._now()
+                self._last_phase_end = max(self._last_phase_end, phase.end)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Records the phase running within the context."""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def checkpoint(self, name: str):
+        """Records a phase from the end of the last phase until now."""
+        if not self._is_recording:
+            return
+
+        with self._lock:
+            now = self._now()
+            self._phases.append(StartupPhase(
+                name, self._last_phase_end, now, thread_id=threading.get_ident()
+            ))
+            self._last_phase_end = now
+
+    def mark(self, name: str):
+        """Records an instant event."""
+        if not self._is_recording:
+            return
+
+        with self._lock:
+            now = self._now()
+            self._phases.append(StartupPhase(name, now, now, thread_id=threading.get_ident()))
+
+    def summary(self) -> str:
+        """Returns a human-readable summary of the phases recorded so far."""
+        lines = []
+        for phase in self.phases:
+            duration = f"{phase.duration * 1000:9.1f} ms" if phase.duration is not None \
+                else "  ongoing"
+            lines.append(f"{phase.start * 1000:9.1f} ms {duration}  {phase.name}")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> dict:
+        """Returns the phases recorded so far in the Chrome trace event format."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [phase.to_chrome_trace_event(pid) for phase in self.phases],
+            "displayTimeUnit": "ms"
+        }
+
+    def finish(self, name: str):
+        """
+        Marks the end of the startup, logs the summary of the phases and
+        writes the trace to disk. Only the first call has any effect.
+        """
+        if not self._is_recording:
+            return
+
+        self.mark(name)
+        self._finished = True
+        logger.info(f"Startup phases (start, duration, name):\n{self.summary()}")
+        try:
+            with open(self.trace_path, "w", encoding="utf-8") as trace_file:
+                json.dump(self.to_chrome_trace(), trace_file)
+        except OSError:
+            logger.exception(f"Unable to write startup trace to {self.trace_path}.")
+            return
+        logger.info(f"Startup trace written to {self.trace_path}.")
+
+    @property
+    def _is_recording(self) -> bool:
+        return self.enabled and not self._finished
+
+    def _now(self) -> float:
+        return self._clock() - self._origin
+
+
+# Tracer shared by all the startup phases.
+startup_tracer = StartupTracer.from_environment()
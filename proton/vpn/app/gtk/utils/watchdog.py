@@ -0,0 +1,195 @@
+"""
+Detection of GLib main loop stalls.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional
+
+from gi.repository import GLib
+
+from proton.vpn import logging
+from proton.vpn.app.gtk.utils.instrumentation import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MainLoopStall:
+    """
+    Period of time during which the main loop did not run its callbacks.
+
+    Attributes:
+        started_at: time the main loop was pinged (in seconds since the epoch).
+        duration_ms: time it took the main loop to answer the ping.
+        stack: stack of the main thread at the time the stall was detected.
+    """
+    started_at: float
+    duration_ms: float
+    stack: str
+
+    def to_dict(self) -> dict:
+        """Returns the stall as a JSON serializable dict."""
+        return {
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "stack": self.stack
+        }
+
+
+def _schedule_high_priority_idle(callback: Callable[[], None]):
+    def run_callback():
+        callback()
+        return False
+
+    GLib.idle_add(run_callback, priority=GLib.PRIORITY_HIGH)
+
+
+class MainLoopWatchdog:  # pylint: disable=too-many-instance-attributes
+    """
+    Watches the responsiveness of the GLib main loop from a separate thread.
+
+    The main loop is periodically pinged with a high priority idle callback,
+    and the time it takes to run it (the lag) is recorded. When the lag goes
+    over the stall threshold, the Python stack of the main thread is
+    captured and logged, so that it shows what was blocking the main loop.
+    """
+    DEFAULT_INTERVAL_MS = 500
+    DEFAULT_STALL_THRESHOLD_MS = 250
+    DEFAULT_MAX_STALLS = 20
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+            self,
+            interval_ms: int = DEFAULT_INTERVAL_MS,
+            stall_threshold_ms: int = DEFAULT_STALL_THRESHOLD_MS,
+            max_stalls: int = DEFAULT_MAX_STALLS,
+            schedule: Callable[[Callable[[], None]], None] = _schedule_high_priority_idle,
+            main_thread: threading.Thread = None
+    ):
+        """
+        :param interval_ms: time between pings.
+        :param stall_threshold_ms: lag above which the main loop is considered stalled.
+        :param max_stalls: maximum number of stalls to keep.
+        :param schedule: function scheduling a callback on the main loop.
+        :param main_thread: thread running the main loop.
+        """
+        self._interval_ms = interval_ms
+        self._stall_threshold_ms = stall_threshold_ms
+        self._schedule = schedule
+        self._main_thread = main_thread or threading.main_thread()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._lag = Histogram()
+        self._stalls: Deque[MainLoopStall] = deque(maxlen=max_stalls)
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True if the watchdog was started and False otherwise."""
+        return self._thread is not None
+
+    @property
+    def lag(self) -> Histogram:
+        """Returns the distribution of the time it took the main loop to answer pings."""
+        with self._lock:
+            return self._lag.copy()
+
+    @property
+    def stalls(self) -> List[MainLoopStall]:
+        """Returns the last stalls detected, from oldest to newest."""
+        with self._lock:
+            return list(self._stalls)
+
+    def start(self):
+        """Starts watching the main loop."""
+        if self.is_running:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            raise RuntimeError("The main loop watchdog is already running.")
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="main-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops watching the main loop."""
+        if not self.is_running:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def to_dict(self) -> dict:
+        """Returns the lag distribution and the last stalls as a JSON serializable dict."""
+        return {
+            "lag": self.lag.to_dict(),
+            "stalls": [stall.to_dict() for stall in self.stalls]
+        }
+
+    def to_json(self) -> str:
+        """Returns the lag distribution and the last stalls as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._ping()
+            self._stop_event.wait(self._interval_ms / 1000)
+
+    def _ping(self):
+        answered = threading.Event()
+        pinged_at = time.time()
+        pinged_at_monotonic = time.monotonic()
+        self._schedule(answered.set)
+
+        stack = None
+        if not answered.wait(self._stall_threshold_ms / 1000):
+            stack = self._capture_main_thread_stack()
+            # Wait for the main loop to recover, unless the watchdog is stopped.
+            while not answered.wait(self._interval_ms / 1000):
+                if self._stop_event.is_set():
+                    return
+
+        lag_ms = (time.monotonic() - pinged_at_monotonic) * 1000
+        with self._lock:
+            self._lag.record(lag_ms)
+            if stack is not None:
+                self._stalls.append(MainLoopStall(pinged_at, lag_ms, stack))
+
+        if stack is not None:
+            logger.warning(
+                f"Main loop stalled for {lag_ms:.0f} ms. Main thread stack:\n{stack}"
+            )
+
+    def _capture_main_thread_stack(self) -> str:
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        frame = frames.get(self._main_thread.ident)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame))
@@ -27,14 +27,14 @@ import subprocess  # nosec B404 # nosemgrep: gitlab.bandit.B404
 from tempfile import NamedTemporaryFile
 from concurrent.futures import Future
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 from gi.repository import Gtk, GLib
 
 from proton.session.exceptions import ProtonAPINotReachable, ProtonAPIError
 from proton.vpn.session.dataclasses import BugReportForm
 from proton.vpn.app.gtk import __version__
 from proton.vpn import logging
-from proton.vpn.app.gtk.utils.executor import AsyncExecutor
+from proton.vpn.app.gtk.utils.executor import AsyncExecutor, ExecutorLane, Lane
 from proton.vpn.app.gtk.widgets.main.notification_bar import NotificationBar
 
 if TYPE_CHECKING:
@@ -73,7 +73,8 @@ class BugReportDialog(Gtk.Dialog):  # pylint: disable=too-many-instance-attribut
         self._main_window = main_window
         self.notification_bar = notification_bar or NotificationBar()
         self._log_collector = log_collector or LogCollector(
-            self._controller.executor
+            self._controller.executor.lane(Lane.BACKGROUND),
+            diagnostics=self._controller.get_diagnostics
         )
 
         self.set_title("Report an Issue")
@@ -301,8 +302,18 @@ class BugReportDialog(Gtk.Dialog):  # pylint: disable=too-many-instance-attribut
 class LogCollector:  # pylint: disable=too-few-public-methods
     """Collects all necessary logs needed for the report tool."""
 
-    def __init__(self, executor: AsyncExecutor):
+    def __init__(
+        self, executor: Union[AsyncExecutor, ExecutorLane],
+        diagnostics: Optional[Callable[[], Dict[str, str]]] = None
+    ):
+        """
+        :param executor: executor used to generate the logs.
+        :param diagnostics: optional callable returning the contents of
+            additional diagnostics files (e.g. the timeline of the last
+            VPN outages), indexed by file name.
+        """
         self._executor = executor
+        self._diagnostics = diagnostics
 
     def get_logs(self) -> Future:
         """
@@ -312,9 +323,10 @@ class LogCollector:  # pylint: disable=too-few-public-methods
         logs_future = Future()
 
         app_log = self._get_app_log()
+        diagnostics_logs = self._get_diagnostics_logs()
         nm_log_future = self._generate_network_manager_log()
         nm_log_future.add_done_callback(
-            lambda f: logs_future.set_result([app_log, f.result()])
+            lambda f: logs_future.set_result([app_log, f.result(), *diagnostics_logs])
         )
 
         return logs_future
@@ -328,6 +340,25 @@ class LogCollector:  # pylint: disable=too-few-public-methods
 
         raise RuntimeError("App logs not found.")
 
+    def _get_diagnostics_logs(self) -> List[io.IOBase]:
+        """Get the diagnostics files, if available."""
+        if not self._diagnostics:
+            return []
+
+        try:
+            diagnostics = self._diagnostics()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Diagnostics could not be generated.")
+            return []
+
+        diagnostics_logs = []
+        for filename, content in diagnostics.items():
+            diagnostics_log = io.BytesIO(content.encode("utf-8"))
+            diagnostics_log.name = filename
+            diagnostics_logs.append(diagnostics_log)
+
+        return diagnostics_logs
+
     def _generate_network_manager_log(self) -> Future:
         """Generate Network Manager logs"""
         def run_subprocess():
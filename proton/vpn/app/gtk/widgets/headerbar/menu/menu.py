@@ -26,13 +26,9 @@ from gi.repository import Gio, GLib, GObject
 from proton.vpn.app.gtk import Gtk
 
 from proton.vpn.connection.states import State, Disconnected
-from proton.vpn.app.gtk.widgets.headerbar.menu.bug_report_dialog import BugReportDialog
-from proton.vpn.app.gtk.widgets.headerbar.menu.about_dialog import AboutDialog
 from proton.vpn.app.gtk.widgets.main.confirmation_dialog import ConfirmationDialog
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.main.loading_widget import OverlayWidget, DefaultLoadingWidget
-from proton.vpn.app.gtk.widgets.headerbar.menu.settings import SettingsWindow
-from proton.vpn.app.gtk.widgets.headerbar.menu.release_notes_dialog import ReleaseNotesDialog
 from proton.vpn.connection.enum import KillSwitchSetting as KillSwitchSettingEnum
 
 from proton.session.exceptions import ProtonAPINotReachable
@@ -159,6 +155,12 @@ class Menu(Gio.Menu):  # pylint: disable=too-many-instance-attributes
         )
 
     def _on_report_an_issue_clicked(self, *_):
+        # Dialogs are only imported once they are opened, to keep them (and
+        # their dependencies) from slowing down the app startup.
+        from proton.vpn.app.gtk.widgets.headerbar.menu.bug_report_dialog import (  # noqa: E501 # pylint: disable=import-outside-toplevel, line-too-long
+            BugReportDialog
+        )
+
         bug_dialog = BugReportDialog(self._controller, self._main_window)
         bug_dialog.set_transient_for(self._main_window)
         # run() blocks the main loop, and only exist once the `::response` signal
@@ -167,6 +169,10 @@ class Menu(Gio.Menu):  # pylint: disable=too-many-instance-attributes
         bug_dialog.destroy()
 
     def _on_settings_clicked(self,  *_):
+        from proton.vpn.app.gtk.widgets.headerbar.menu.settings import (  # noqa: E501 # pylint: disable=import-outside-toplevel, line-too-long
+            SettingsWindow
+        )
+
         self._settings_window = SettingsWindow(
             self._controller,
             self._main_window.application.tray_indicator
@@ -180,11 +186,19 @@ class Menu(Gio.Menu):  # pylint: disable=too-many-instance-attributes
         self._settings_window.present()
 
     def _on_release_notes_clicked(self,  *_):
+        from proton.vpn.app.gtk.widgets.headerbar.menu.release_notes_dialog import (  # noqa: E501 # pylint: disable=import-outside-toplevel, line-too-long
+            ReleaseNotesDialog
+        )
+
         release_notes = ReleaseNotesDialog()
         release_notes.set_transient_for(self._main_window)
         release_notes.present()
 
     def _on_about_clicked(self, *_):
+        from proton.vpn.app.gtk.widgets.headerbar.menu.about_dialog import (  # noqa: E501 # pylint: disable=import-outside-toplevel, line-too-long
+            AboutDialog
+        )
+
         about_dialog = AboutDialog()
         # run() blocks the main loop, and only exist once the `::response` signal
         # is emitted.
@@ -19,8 +19,8 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import List, Tuple, Callable, Union
-from gi.repository import Gtk, Gdk
+from typing import Any, Dict, List, Tuple, Callable, Union, Optional
+from gi.repository import GLib, Gtk, Gdk
 from proton.vpn.app.gtk.controller import Controller
 
 
@@ -121,7 +121,95 @@ def is_upgrade_required(requires_subscription_to_be_active: bool, user_tier: int
     return requires_subscription_to_be_active and user_tier < 1
 
 
-def get_setting(controller: Controller, setting_path_name: str):
+class SettingsTransaction:
+    """
+    Settings shared by all the setting widgets in a window.
+
+    Settings are loaded once, the first time they are accessed through the
+    transaction, and are then read from and modified in memory. Changes are
+    written to disk once no further changes were made for `write_delay_ms`,
+    so that rapid changes (e.g. toggling a switch several times) result in
+    a single write. Pending changes can be written immediately with `commit`.
+
+    Similarly to `get_setting` and `save_setting`, settings are accessed
+    using their path name (e.g. `settings.features.netshield` or
+    `app_configuration.tray_pinned_servers`).
+    """
+    WRITE_DELAY_MS = 300
+
+    def __init__(self, controller: Controller, write_delay_ms: int = WRITE_DELAY_MS):
+        self._controller = controller
+        self._write_delay_ms = write_delay_ms
+        self._loaded_settings: Dict[str, Any] = {}
+        self._modified_setting_types: Dict[str, None] = {}  # Used as an ordered set.
+        self._write_source_id = None
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Returns whether there are changes that were not written yet."""
+        return bool(self._modified_setting_types)
+
+    def get(self, setting_path_name: str):
+        """Returns the value of the setting."""
+        setting_type, setting_attrs = setting_path_name.split(DOT, maxsplit=1)
+        return _get_nested_attr(self._load(setting_type), setting_attrs)
+
+    def set(self, setting_path_name: str, new_value: Any):
+        """Sets the new value of the setting and schedules writing it."""
+        setting_type, setting_attrs = setting_path_name.split(DOT, maxsplit=1)
+        _set_nested_attr(self._load(setting_type), setting_attrs, new_value)
+        self._modified_setting_types[setting_type] = None
+
+        if self._write_source_id is not None:
+            GLib.source_remove(self._write_source_id)
+        self._write_source_id = GLib.timeout_add(
+            self._write_delay_ms, self._on_write_delay_elapsed
+        )
+
+    def commit(self):
+        """Writes pending changes immediately."""
+        if self._write_source_id is not None:
+            GLib.source_remove(self._write_source_id)
+            self._write_source_id = None
+
+        modified_setting_types = list(self._modified_setting_types)
+        self._modified_setting_types.clear()
+        for setting_type in modified_setting_types:
+            save_settings_method = getattr(self._controller, f"save_{setting_type}")
+            save_settings_method(self._loaded_settings[setting_type])
+
+    def _on_write_delay_elapsed(self):
+        self._write_source_id = None
+        self.commit()
+        return False
+
+    def _load(self, setting_type: str):
+        if setting_type not in self._loaded_settings:
+            self._loaded_settings[setting_type] = getattr(
+                self._controller, f"get_{setting_type}"
+            )()
+        return self._loaded_settings[setting_type]
+
+
+def _get_nested_attr(root, attr_path: str):
+    for attr in attr_path.split(DOT):
+        root = getattr(root, attr)
+
+    return root
+
+
+def _set_nested_attr(root, attr_path: str, value):
+    if attr_path.count(DOT) == 0:
+        setattr(root, attr_path, value)
+    else:
+        name, path = attr_path.split(DOT, maxsplit=1)
+        _set_nested_attr(getattr(root, name), path, value)
+
+
+def get_setting(
+        controller: Controller, setting_path_name: str,
+        settings_transaction: Optional[SettingsTransaction] = None
+):
     """Helper method to get the settings.
 
     In this case the setting_path_name can be a multi-layered setting, for example
@@ -135,31 +223,34 @@ def get_setting(controller: Controller, setting_path_name: str):
     ```
     So the for loop will loop for each attribute and attempt to get it from the original
     settings object, thus solving the nesting situation.
+
+    If a settings transaction is specified, the setting is read from it.
     """
+    if settings_transaction:
+        return settings_transaction.get(setting_path_name)
+
     setting_type, setting_attrs = setting_path_name.split(DOT, maxsplit=1)
     settings = getattr(controller, f"get_{setting_type}")()
-    setting_attrs_split = setting_attrs.split(DOT)
-
-    for attr in setting_attrs_split:
-        settings = getattr(settings, attr)
+    return _get_nested_attr(settings, setting_attrs)
 
-    return settings
 
+def save_setting(
+        controller: Controller, setting_path_name: str, new_value: Union[str, int],
+        settings_transaction: Optional[SettingsTransaction] = None
+):
+    """Helper method to save the settings.
 
-def save_setting(controller: Controller, setting_path_name: str, new_value: Union[str, int]):
-    """Helper method to save the settings."""
-    def set_setting(root, attr, value):
-        if attr.count(DOT) == 0:
-            setattr(root, attr, value)
-        else:
-            name, path = attr.split(DOT, maxsplit=1)
-            set_setting(getattr(root, name), path, value)
+    If a settings transaction is specified, the setting is saved through it.
+    """
+    if settings_transaction:
+        settings_transaction.set(setting_path_name, new_value)
+        return
 
     setting_type, setting_attrs = setting_path_name.split(DOT, maxsplit=1)
 
     save_settings_method = getattr(controller, f"save_{setting_type}")
     settings = getattr(controller, f"get_{setting_type}")()
-    set_setting(settings, setting_attrs, new_value)
+    _set_nested_attr(settings, setting_attrs, new_value)
 
     save_settings_method(settings)
 
@@ -222,12 +313,14 @@ class ToggleWidget(Gtk.Grid):  # pylint: disable=too-many-instance-attributes
         setting_name: str,
         requires_subscription_to_be_active: bool = False,
         callback: Callable = None,
-        disable_on_active_connection: bool = False
+        disable_on_active_connection: bool = False,
+        settings_transaction: Optional[SettingsTransaction] = None
     ):
         super().__init__()
         self._apply_grid_styles()
         self._controller = controller
         self._setting_name = setting_name
+        self._settings_transaction = settings_transaction
         self._callback = callback
         self._requires_subscription_to_be_active = requires_subscription_to_be_active
         self._disable_on_active_connection = disable_on_active_connection
@@ -248,11 +341,13 @@ class ToggleWidget(Gtk.Grid):  # pylint: disable=too-many-instance-attributes
 
     def get_setting(self) -> bool:
         """Shortcut property that returns the current setting"""
-        return get_setting(self._controller, self._setting_name)
+        return get_setting(self._controller, self._setting_name, self._settings_transaction)
 
     def save_setting(self, new_value: bool):
         """Shortcut property that sets the new setting and stores to disk."""
-        save_setting(self._controller, self._setting_name, new_value)
+        save_setting(
+            self._controller, self._setting_name, new_value, self._settings_transaction
+        )
 
     @property
     def overridden_by_upgrade_tag(self) -> bool:
@@ -327,12 +422,14 @@ class ComboboxWidget(Gtk.Grid):  # pylint: disable=too-many-instance-attributes
         description: str = None,
         requires_subscription_to_be_active: bool = False,
         callback: Callable = None,
-        disable_on_active_connection: bool = False
+        disable_on_active_connection: bool = False,
+        settings_transaction: Optional[SettingsTransaction] = None
     ):
         super().__init__()
         self._apply_grid_styles()
         self._controller = controller
         self._setting_name = setting_name
+        self._settings_transaction = settings_transaction
         self._combobox_options = combobox_options
         self._callback = callback
         self._requires_subscription_to_be_active = requires_subscription_to_be_active
@@ -354,11 +451,13 @@ class ComboboxWidget(Gtk.Grid):  # pylint: disable=too-many-instance-attributes
 
     def get_setting(self) -> str:
         """Shortcut property that returns the current setting"""
-        return str(get_setting(self._controller, self._setting_name))
+        return str(get_setting(self._controller, self._setting_name, self._settings_transaction))
 
     def save_setting(self, new_value: Union[str, int]):
         """Shortcut property that sets the new setting and stores to disk."""
-        save_setting(self._controller, self._setting_name, new_value)
+        save_setting(
+            self._controller, self._setting_name, new_value, self._settings_transaction
+        )
 
     @property
     def overridden_by_upgrade_tag(self) -> bool:
@@ -441,11 +540,13 @@ class EntryWidget(Gtk.Grid):
         description: str,
         callback: Callable = None,
         requires_subscription_to_be_active: bool = False,
+        settings_transaction: Optional[SettingsTransaction] = None
     ):
         super().__init__()
         self._apply_grid_styles()
         self._controller = controller
         self._setting_name = setting_name
+        self._settings_transaction = settings_transaction
         self._callback = callback
         self._requires_subscription_to_be_active = requires_subscription_to_be_active
         self.label = SettingName(title)
@@ -465,11 +566,13 @@ class EntryWidget(Gtk.Grid):
 
     def get_setting(self) -> Union[str, List[str]]:
         """Shortcut property that returns the current setting"""
-        return get_setting(self._controller, self._setting_name)
+        return get_setting(self._controller, self._setting_name, self._settings_transaction)
 
     def save_setting(self, new_value: str):
         """Shortcut property that sets the new setting and stores to disk."""
-        save_setting(self._controller, self._setting_name, new_value)
+        save_setting(
+            self._controller, self._setting_name, new_value, self._settings_transaction
+        )
 
     @property
     def overridden_by_upgrade_tag(self) -> bool:
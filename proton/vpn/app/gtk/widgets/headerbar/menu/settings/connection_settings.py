@@ -19,11 +19,11 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import (
-    BaseCategoryContainer, ToggleWidget, ComboboxWidget
+    BaseCategoryContainer, ToggleWidget, ComboboxWidget, SettingsTransaction
 )
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.custom_dns import CustomDNSWidget
 
@@ -50,10 +50,14 @@ class ConnectionSettings(BaseCategoryContainer):  # pylint: disable=too-many-ins
     IPV6_DESCRIPTION = "Tunnels IPv6 traffic through the VPN. "\
         "Can enhance compatibility with IPv6 networks."
 
-    def __init__(self, controller: Controller, settings_window: "SettingsWindow"):
+    def __init__(
+            self, controller: Controller, settings_window: "SettingsWindow",
+            settings_transaction: Optional[SettingsTransaction] = None
+    ):
         super().__init__(self.CATEGORY_NAME)
         self._controller = controller
         self._settings_window = settings_window
+        self._settings_transaction = settings_transaction
         self.custom_dns = None
 
     def build_ui(self):
@@ -79,7 +83,8 @@ class ConnectionSettings(BaseCategoryContainer):  # pylint: disable=too-many-ins
                 description=self.PROTOCOL_DESCRIPTION,
                 setting_name="settings.protocol",
                 combobox_options=protocol_list_of_tuples,
-                disable_on_active_connection=True
+                disable_on_active_connection=True,
+                settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_vpn_accelerator(self):
@@ -93,7 +98,8 @@ class ConnectionSettings(BaseCategoryContainer):  # pylint: disable=too-many-ins
             description=self.VPN_ACCELERATOR_DESCRIPTION,
             setting_name="settings.features.vpn_accelerator",
             requires_subscription_to_be_active=True,
-            callback=on_switch_state
+            callback=on_switch_state,
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_moderate_nat(self):
@@ -107,7 +113,8 @@ class ConnectionSettings(BaseCategoryContainer):  # pylint: disable=too-many-ins
             description=self.MODERATE_NAT_DESCRIPTION,
             setting_name="settings.features.moderate_nat",
             requires_subscription_to_be_active=True,
-            callback=on_switch_state
+            callback=on_switch_state,
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_ipv6(self):
@@ -121,10 +128,13 @@ class ConnectionSettings(BaseCategoryContainer):  # pylint: disable=too-many-ins
             title=self.IPV6_LABEL,
             description=self.IPV6_DESCRIPTION,
             setting_name="settings.ipv6",
-            callback=on_switch_state
+            callback=on_switch_state,
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_custom_dns(self):
         """Builds and adds the `custom_dns` setting to the widget."""
-        self.custom_dns = CustomDNSWidget.build(self._controller, self._settings_window)
+        self.custom_dns = CustomDNSWidget.build(
+            self._controller, self._settings_window, self._settings_transaction
+        )
         self.pack_start(self.custom_dns, False, False, 0)
@@ -19,7 +19,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from contextlib import contextmanager
 
 from gi.repository import Gtk, GObject
@@ -27,7 +27,7 @@ from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.main.confirmation_dialog import ConfirmationDialog
 from proton.vpn.core.settings import CustomDNSEntry, NetShield
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import (
-    ToggleWidget, save_setting, get_setting
+    ToggleWidget, save_setting, get_setting, SettingsTransaction
 )
 
 if TYPE_CHECKING:
@@ -92,13 +92,15 @@ class CustomDNSManager(Gtk.Box):  # pylint: disable=too-few-public-methods
         self,
         controller: Controller,
         gtk: Gtk = None,
-        custom_dns_list: CustomDNSList = None
+        custom_dns_list: CustomDNSList = None,
+        settings_transaction: Optional[SettingsTransaction] = None
     ):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.set_spacing(15)
 
         self.gtk = gtk or Gtk
         self._controller = controller
+        self._settings_transaction = settings_transaction
 
         self._dns_entry = None
         self._add_button = None
@@ -178,14 +180,21 @@ class CustomDNSManager(Gtk.Box):  # pylint: disable=too-few-public-methods
     @contextmanager
     def _get_ip_list(self):
         """Helper method to view the ip list."""
-        yield get_setting(self._controller, CustomDNSManager.SETTING_NAME)
+        yield get_setting(
+            self._controller, CustomDNSManager.SETTING_NAME, self._settings_transaction
+        )
 
     @contextmanager
     def _edit_ip_list(self):
         """Helper method to edit the ip list and save it."""
-        ip_list = get_setting(self._controller, CustomDNSManager.SETTING_NAME)
+        ip_list = get_setting(
+            self._controller, CustomDNSManager.SETTING_NAME, self._settings_transaction
+        )
         yield ip_list
-        save_setting(self._controller, CustomDNSManager.SETTING_NAME, ip_list)
+        save_setting(
+            self._controller, CustomDNSManager.SETTING_NAME, ip_list,
+            self._settings_transaction
+        )
 
     def set_entry_text(self, new_value: str):
         """Simulate typing content to entry."""
@@ -206,7 +215,10 @@ class CustomDNSWidget(ToggleWidget):
     DESCRIPTION = "Connect to Proton VPN using your own domain name servers (DNS)."
     SETTING_NAME = "settings.custom_dns.enabled"
 
-    def __init__(self, controller: Controller, settings_window: Gtk.Window, gtk: Gtk = None, ):
+    def __init__(
+            self, controller: Controller, settings_window: Gtk.Window, gtk: Gtk = None,
+            settings_transaction: Optional[SettingsTransaction] = None
+    ):
         super().__init__(
             controller=controller,
             title=self.LABEL,
@@ -214,6 +226,7 @@ class CustomDNSWidget(ToggleWidget):
             setting_name=self.SETTING_NAME,
             requires_subscription_to_be_active=True,
             callback=self._on_switch_button_toggle,
+            settings_transaction=settings_transaction
         )
 
         self.gtk = gtk or Gtk
@@ -222,9 +235,14 @@ class CustomDNSWidget(ToggleWidget):
         self._settings_window = settings_window
 
     @staticmethod
-    def build(controller: Controller, settings_window: "SettingsWindow") -> "CustomDNSWidget":
+    def build(
+            controller: Controller, settings_window: "SettingsWindow",
+            settings_transaction: Optional[SettingsTransaction] = None
+    ) -> "CustomDNSWidget":
         """Shortcut method to initialize widget."""
-        widget = CustomDNSWidget(controller, settings_window)
+        widget = CustomDNSWidget(
+            controller, settings_window, settings_transaction=settings_transaction
+        )
         widget.build_revealer()
         widget.show_all()
         return widget
@@ -238,7 +256,9 @@ class CustomDNSWidget(ToggleWidget):
         self.revealer.set_reveal_child(self.get_setting())
 
     def _build_revealer_container(self) -> Gtk.Box:
-        revealer_container = CustomDNSManager(self._controller)
+        revealer_container = CustomDNSManager(
+            self._controller, settings_transaction=self._settings_transaction
+        )
         return revealer_container
 
     def _on_switch_button_toggle(self, _, new_value: bool, __):
@@ -25,11 +25,11 @@ from concurrent.futures import Future
 from typing import Optional, Tuple
 import os
 import distro
-import requests
 from gi.repository import Gtk, GLib, Pango
 from proton.utils.environment import VPNExecutionEnvironment
 from proton.vpn import logging
 from proton.vpn.app.gtk.controller import Controller
+from proton.vpn.app.gtk.utils.executor import Lane
 from proton.vpn.app.gtk.widgets.main.loading_widget import Spinner
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import ToggleWidget
 
@@ -58,6 +58,9 @@ class DistroManager:  # pylint: disable=too-many-instance-attributes
     def download_release_package(self, url: str) -> None:
         """Builds and returns a string which contains a command to
         download a package from our repositories."""
+        # requests is only imported when early access is toggled.
+        import requests  # pylint: disable=import-outside-toplevel
+
         file = url.split("/")[-1]
         filepath = os.path.join(self.runtime_path, file)
 
@@ -281,6 +284,8 @@ class EarlyAccessWidget(ToggleWidget):
         )
 
     def _process(self, url: str, package_to_uninstall: str, early_access_enabled: bool = False):
+        import requests  # pylint: disable=import-outside-toplevel
+
         def _on_finish_download_release_package(_future: Future):
             try:
                 _future.result()
@@ -293,7 +298,7 @@ class EarlyAccessWidget(ToggleWidget):
                 package_to_install = url.split("/")[-1]
                 self._run_commands(package_to_install, package_to_uninstall, early_access_enabled)
 
-        future = self._controller.executor.submit(
+        future = self._controller.executor.lane(Lane.BACKGROUND).submit(
             self.distro_manager.download_release_package,
             url
         )
@@ -19,14 +19,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from gi.repository import Gtk, GObject
 from proton.vpn.app.gtk.widgets.main.confirmation_dialog import ConfirmationDialog
 from proton.vpn.core.settings import NetShield
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import (
-    BaseCategoryContainer, ComboboxWidget, ToggleWidget, SettingName, SettingDescription
+    BaseCategoryContainer, ComboboxWidget, ToggleWidget, SettingName, SettingDescription,
+    SettingsTransaction
 )
 from proton.vpn.connection.enum import KillSwitchSetting as KillSwitchSettingEnum
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.custom_dns import CustomDNSWidget
@@ -53,14 +54,18 @@ class KillSwitchWidget(ToggleWidget):  # noqa pylint: disable=too-many-instance-
         "Advanced kill switch will remain active even when you restart your device."
     SETTING_NAME = "settings.killswitch"
 
-    def __init__(self, controller: Controller, gtk: Gtk = None):
+    def __init__(
+            self, controller: Controller, gtk: Gtk = None,
+            settings_transaction: Optional[SettingsTransaction] = None
+    ):
         super().__init__(
             controller=controller,
             title=self.KILLSWITCH_LABEL,
             description=self.KILLSWITCH_DESCRIPTION,
             setting_name=self.SETTING_NAME,
             callback=self._on_switch_button_toggle,
-            disable_on_active_connection=True
+            disable_on_active_connection=True,
+            settings_transaction=settings_transaction
         )
 
         self.gtk = gtk or Gtk
@@ -81,9 +86,12 @@ class KillSwitchWidget(ToggleWidget):  # noqa pylint: disable=too-many-instance-
         self.revealer.set_reveal_child(self.get_setting() > KillSwitchSettingEnum.OFF)
 
     @staticmethod
-    def build(controller: Controller) -> "KillSwitchWidget":
+    def build(
+            controller: Controller,
+            settings_transaction: Optional[SettingsTransaction] = None
+    ) -> "KillSwitchWidget":
         """Shortcut method to initialize widget."""
-        widget = KillSwitchWidget(controller)
+        widget = KillSwitchWidget(controller, settings_transaction=settings_transaction)
         widget.build_revealer()
         return widget
 
@@ -175,10 +183,14 @@ class FeatureSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
     SWITCH_KILLSWITCH_IF_CONNECTION_ACTIVE_DESCRIPTION = "Kill switch selection "\
         "is disabled while VPN is active. Disconnect to make changes."
 
-    def __init__(self, controller: Controller, settings_window: "SettingsWindow"):
+    def __init__(
+            self, controller: Controller, settings_window: "SettingsWindow",
+            settings_transaction: Optional[SettingsTransaction] = None
+    ):
         super().__init__(self.CATEGORY_NAME)
         self._controller = controller
         self._settings_window = settings_window
+        self._settings_transaction = settings_transaction
         self.netshield = None
 
     def build_ui(self):
@@ -213,13 +225,14 @@ class FeatureSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
             setting_name="settings.features.netshield",
             combobox_options=netshield_options,
             requires_subscription_to_be_active=True,
-            callback=on_combobox_changed
+            callback=on_combobox_changed,
+            settings_transaction=self._settings_transaction
         )
         self.pack_start(self.netshield, False, False, 0)
 
     def build_killswitch(self):
         """Builds and adds the `killswitch` setting to the widget."""
-        killswitch = KillSwitchWidget.build(self._controller)
+        killswitch = KillSwitchWidget.build(self._controller, self._settings_transaction)
         self.pack_start(killswitch, False, False, 0)
 
     def build_port_forwarding(self):
@@ -246,7 +259,8 @@ class FeatureSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
             description=self.PORT_FORWARDING_DESCRIPTION,
             setting_name="settings.features.port_forwarding",
             requires_subscription_to_be_active=True,
-            callback=on_switch_state
+            callback=on_switch_state,
+            settings_transaction=self._settings_transaction
         )
         is_pf_enabled = port_forwarding_widget.get_setting()
         display_port_forwarding = self._controller.feature_flags.get("DisplayPortForwarding")
@@ -25,7 +25,7 @@ from proton.vpn import logging
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import (
     BaseCategoryContainer, ToggleWidget, EntryWidget, get_setting,
-    save_setting
+    save_setting, SettingsTransaction
 )
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.early_access import \
     EarlyAccessWidget
@@ -43,13 +43,17 @@ class TrayPinnedServersWidget(EntryWidget):
         "(e.g.: NL#42, JP, US, IT#01)."
     SETTING_NAME = "app_configuration.tray_pinned_servers"
 
-    def __init__(self, controller: Controller, tray_indicator: "TrayIndicator" = None):
+    def __init__(
+            self, controller: Controller, tray_indicator: "TrayIndicator" = None,
+            settings_transaction: Optional[SettingsTransaction] = None
+    ):
         super().__init__(
             controller=controller,
             title=self.TRAY_PINNED_SERVERS_LABEL,
             description=self.TRAY_PINNED_SERVERS_DESCRIPTION,
             setting_name=self.SETTING_NAME,
-            callback=self._on_focus_outside_entry
+            callback=self._on_focus_outside_entry,
+            settings_transaction=settings_transaction
         )
         self._controller = controller
         self._tray_indicator = tray_indicator
@@ -60,7 +64,9 @@ class TrayPinnedServersWidget(EntryWidget):
 
     def get_setting(self):
         """Shortcut property that sets the new setting and stores to disk."""
-        tray_pinned_servers = get_setting(self._controller, self.SETTING_NAME)
+        tray_pinned_servers = get_setting(
+            self._controller, self.SETTING_NAME, self._settings_transaction
+        )
         return ', '.join(tray_pinned_servers)
 
     def save_setting(self, new_value: List[str]):  # noqa: F811
@@ -74,7 +80,7 @@ class TrayPinnedServersWidget(EntryWidget):
             if cleaned_pinned_server:
                 server_list.append(cleaned_pinned_server)
 
-        save_setting(self._controller, self.SETTING_NAME, server_list)
+        save_setting(self._controller, self.SETTING_NAME, server_list, self._settings_transaction)
 
 
 class GeneralSettings(BaseCategoryContainer):  # pylint: disable=too-many-instance-attributes
@@ -96,10 +102,12 @@ class GeneralSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
     def __init__(
         self, controller: Controller,
         tray_indicator: Optional["TrayIndicator"] = None,
+        settings_transaction: Optional[SettingsTransaction] = None
     ):
         super().__init__(self.CATEGORY_NAME)
         self._controller = controller
         self._tray_indicator = tray_indicator
+        self._settings_transaction = settings_transaction
 
     def build_ui(self):
         """Builds the UI, invoking all necessary methods that are
@@ -127,7 +135,8 @@ class GeneralSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
             title=self.CONNECT_AT_APP_STARTUP_LABEL,
             description=self.CONNECT_AT_APP_STARTUP_DESCRIPTION,
             setting_name="app_configuration.connect_at_app_startup",
-            callback=on_focus_out_callback
+            callback=on_focus_out_callback,
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_start_app_minimized(self):
@@ -136,13 +145,15 @@ class GeneralSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
             controller=self._controller,
             title=self.START_APP_MINIMIZED_LABEL,
             description=self.START_APP_MINIMIZED_DESCRIPTION,
-            setting_name="app_configuration.start_app_minimized"
+            setting_name="app_configuration.start_app_minimized",
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_tray_pinned_servers(self):
         """Builds and adds the `tray_pinned_servers` setting to the widget."""
         self.pack_start(TrayPinnedServersWidget(
-            controller=self._controller, tray_indicator=self._tray_indicator
+            controller=self._controller, tray_indicator=self._tray_indicator,
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_anonymous_crash_reports(self):
@@ -151,7 +162,8 @@ class GeneralSettings(BaseCategoryContainer):  # pylint: disable=too-many-instan
             controller=self._controller,
             title=self.ANONYMOUS_CRASH_REPORTS_LABEL,
             description=self.ANONYMOUS_CRASH_REPORTS_DESCRIPTION,
-            setting_name="settings.anonymous_crash_reports"
+            setting_name="settings.anonymous_crash_reports",
+            settings_transaction=self._settings_transaction
         ), False, False, 0)
 
     def build_beta_upgrade(self):
@@ -34,7 +34,7 @@ from proton.vpn.app.gtk.widgets.headerbar.menu.settings.feature_settings import
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.general_settings import \
     GeneralSettings
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import \
-    RECONNECT_MESSAGE
+    RECONNECT_MESSAGE, SettingsTransaction
 
 if TYPE_CHECKING:
     from proton.vpn.app.gtk.widgets.main.tray_indicator import TrayIndicator
@@ -63,20 +63,34 @@ class SettingsWindow(Gtk.Window):  # pylint: disable=too-many-instance-attribute
         self._controller = controller
         self._notification_bar = notification_bar or NotificationBar()
 
+        # Settings are loaded once for all the settings widgets in the window,
+        # and changes done through them are batched.
+        self._settings_transaction = SettingsTransaction(self._controller)
+
         self._account_settings = account_settings or AccountSettings(self._controller)
         self._feature_settings = feature_settings or FeatureSettings(
-            self._controller, self
+            self._controller, self, self._settings_transaction
         )
         self._connection_settings = connection_settings or ConnectionSettings(
-            self._controller, self
+            self._controller, self, self._settings_transaction
         )
         self._general_settings = general_settings or GeneralSettings(
-            self._controller, tray_indicator
+            self._controller, tray_indicator, self._settings_transaction
         )
 
         self._create_elastic_window()
 
         self.connect("realize", self._build_ui)
+        self.connect("unrealize", self._on_unrealize)
+
+    @property
+    def settings_transaction(self) -> SettingsTransaction:
+        """Returns the transaction used by the settings widgets in the window."""
+        return self._settings_transaction
+
+    def _on_unrealize(self, *_):
+        # Make sure pending changes are written when the window is closed.
+        self._settings_transaction.commit()
 
     def _build_ui(self, *_):
         self._account_settings.build_ui()
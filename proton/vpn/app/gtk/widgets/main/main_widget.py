@@ -175,6 +175,9 @@ class MainWidget(Gtk.Overlay):
         vpn_widget.connect(
             "vpn-widget-ready", self._hide_overlay_widget
         )
+        vpn_widget.connect(
+            "snapshot-displayed", self._hide_overlay_widget
+        )
 
         return vpn_widget
 
@@ -129,7 +129,10 @@ class TrayIndicator:
         self._controller.register_connection_status_subscriber(self)
 
     def status_update(self, connection_status):
-        """This method is called whenever the VPN connection status changes."""
+        """
+        This method is called from the main thread whenever the VPN
+        connection status changes.
+        """
         logger.debug(
             f"Tray widget received connection status update: "
             f"{type(connection_status).__name__}."
@@ -137,7 +140,7 @@ class TrayIndicator:
 
         update_ui_method = f"_on_connection_{type(connection_status).__name__.lower()}"
         if hasattr(self, update_ui_method):
-            GLib.idle_add(getattr(self, update_ui_method))
+            getattr(self, update_ui_method)()
 
     @property
     def display_connect_entry(self) -> bool:
@@ -20,11 +20,17 @@ You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
-from typing import Callable, List, Optional, Set, Tuple, Generator
+import time
+from concurrent.futures import Executor, Future
+from threading import Lock
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
 
-from gi.repository import GObject
+from gi.repository import GLib, GObject
 
 from proton.vpn.app.gtk import Gtk
+from proton.vpn.app.gtk.utils.search import IncrementalSearch, SearchIndex
+from proton.vpn.session.servers import LogicalServer, ServerList
 from proton.vpn import logging
 
 logger = logging.getLogger(__name__)
@@ -43,6 +49,12 @@ COLUMN_LOAD_COLOR = 2  # Sets the column color.
 COLUMN_SENSITIVE = 3  # Whether the item is sensitive to selection.
 LOAD_COLOR = "Grey"  # We want to show the load % in grey.
 
+# Time to wait after the last change of the search text before filtering.
+SEARCH_DEBOUNCE_MS = 100
+
+# Search results grouped by section: [(section name, [(item name, load)])].
+SearchResultSections = List[Tuple[str, List[Tuple[str, Optional[int]]]]]
+
 
 class FilteredList(Gtk.TreeView):
     """
@@ -56,8 +68,7 @@ class FilteredList(Gtk.TreeView):
         super().__init__()
         self._countries = countries
         self._servers = servers
-        self._model = Gtk.TreeStore(str, str, str, bool)
-        self.set_model(Gtk.TreeModelSort(model=self._model))
+        self.set_model(self._new_model())
 
         self.set_show_expanders(False)
         self.set_activate_on_single_click(True)
@@ -100,44 +111,106 @@ class FilteredList(Gtk.TreeView):
 
         self.set_headers_visible(False)
 
-    def update(self, search_text: str = None):
-        """Rebuild the view using the search_text as a filter"""
-        self._model.clear()
-
-        sections = (
-            ("Countries", self._countries),
-            ("Servers", self._servers)
-        )
-
-        for section in sections:
-            section_name, section_data = section
-            data = list(section_data(search_text))
+    def search(self, search_text: str = None) -> SearchResultSections:
+        """
+        Returns the countries and servers matching the search text.
+        This method does not modify the view, so it can be called from any thread.
+        """
+        return [
+            ("Countries", list(self._countries(search_text))),
+            ("Servers", list(self._servers(search_text)))
+        ]
+
+    def display(self, sections: SearchResultSections):
+        """
+        Rebuild the view with the search results.
+
+        The rows are added to a new model which is only attached to the view
+        once it's complete, so that the view does not process the insertion
+        of each row. Section headers and their items are added to a flat
+        list so that rows don't need to be expanded.
+        """
+        model = self._new_model()
+
+        for section_name, data in sections:
             if not data:
                 continue
 
-            row = [f"{section_name} ({len(data)})", "", LOAD_COLOR, False]
-            root = self._model.append(None, row)
+            model.append([f"{section_name} ({len(data)})", "", LOAD_COLOR, False])
             for i, (name, load) in enumerate(data):
                 load_string = "" if load is None else f"{load}%"
-                self._model.append(
-                    root,
-                    [name, load_string, LOAD_COLOR, True]
-                )
+                model.append([name, load_string, LOAD_COLOR, True])
                 if i == MAX_SEARCH_RESULTS_PER_SECTION:
-                    self._model.append(
-                        None,
-                        ["...", "", LOAD_COLOR, False]
-                    )
+                    model.append(["...", "", LOAD_COLOR, False])
                     break
 
-        self.expand_all()
+        self.set_model(model)
+
+    @staticmethod
+    def _new_model() -> Gtk.ListStore:
+        return Gtk.ListStore(str, str, str, bool)
+
+    def update(self, search_text: str = None):
+        """Rebuild the view using the search_text as a filter"""
+        self.display(self.search(search_text))
+
+
+@dataclass
+class ServerListSearchIndex:
+    """
+    Search indexes for the countries and servers in a server list.
+
+    Attributes:
+        server_list: the server list that was indexed.
+        user_tier: the tier of the user the server list was indexed for.
+        countries: search over the entry country names.
+        servers: search over the servers the user has access to.
+    """
+    server_list: ServerList
+    user_tier: int
+    countries: IncrementalSearch[str]
+    servers: IncrementalSearch[LogicalServer]
+
+    @staticmethod
+    def build(server_list: ServerList, user_tier: int) -> ServerListSearchIndex:
+        """Indexes the countries and servers in the server list."""
+        start = time.time()
+        country_names = sorted({server.entry_country_name for server in server_list})
+        search_index = ServerListSearchIndex(
+            server_list=server_list,
+            user_tier=user_tier,
+            countries=IncrementalSearch(
+                SearchIndex((name, name) for name in country_names)
+            ),
+            servers=IncrementalSearch(SearchIndex(
+                (server.name, server)
+                for server in server_list
+                if server.tier <= user_tier
+            ))
+        )
+        logger.info(
+            f"Search index built in {time.time() - start:.2f} seconds "
+            f"({len(search_index.countries.index)} countries, "
+            f"{len(search_index.servers.index)} servers)."
+        )
+        return search_index
 
 
 class SearchResults(Gtk.ScrolledWindow):
     """Display a filtered view of countries and servers.
        Inside a scroll-able widget.
     """
-    def __init__(self, controller):
+    def __init__(
+            self, controller, executor: Optional[Executor] = None,
+            debounce_ms: int = SEARCH_DEBOUNCE_MS
+    ):
+        """
+        :param controller: the app controller.
+        :param executor: optional executor used to filter the search results
+            off the main thread. If not set, they are filtered on the main thread.
+        :param debounce_ms: time to wait after the last change of the search
+            text before filtering the search results.
+        """
         super().__init__()
         self.set_policy(
             hscrollbar_policy=Gtk.PolicyType.NEVER,
@@ -149,37 +222,21 @@ class SearchResults(Gtk.ScrolledWindow):
         self.set_property("height-request", 200)
 
         self._revealer = None
-
-        def countries(search_text: str = None) -> Set(Optional[Tuple[str, None]]):
-            result = set({})
-            server_list = controller.server_list
-
-            if not server_list:
-                return result
-
-            for server in controller.server_list:
-                if self._search_input_exists(search_text, server, entry_country_name=True):
-                    result.add((server.entry_country_name, None))
-
-            return result
-
-        def servers(search_text: str = None) -> Generator[Tuple[Optional[str], Optional[int]]]:
-            def user_tier_allows_access_to_server(server_tier: int, user_tier: int) -> bool:
-                return server_tier <= user_tier
-
-            user_tier = controller.user_tier
-            server_list = controller.server_list
-            if not server_list:
-                yield (None, None)
-
-            for server in controller.server_list:
-                if not user_tier_allows_access_to_server(server.tier, user_tier):
-                    continue
-
-                if self._search_input_exists(search_text, server, server_name=True):
-                    yield (server.name, server.load)
-
-        self._filtered_country_list = FilteredList(countries, servers)
+        self._controller = controller
+        self._executor = executor
+        self._debounce_ms = debounce_ms
+        self._search_index: Optional[ServerListSearchIndex] = None
+        # The search index is built from the executor threads, so it's only
+        # built by one of them at a time and published once fully built.
+        self._search_index_lock = Lock()
+
+        # Incremented on every search text change, so that the results of
+        # superseded searches are discarded.
+        self._search_generation = 0
+        self._debounce_source_id = None
+        self._pending_search: Optional[Future] = None
+
+        self._filtered_country_list = FilteredList(self._search_countries, self._search_servers)
         self._filtered_country_list.connect(
             "row-activated", self._on_row_activated
         )
@@ -188,28 +245,133 @@ class SearchResults(Gtk.ScrolledWindow):
             self._filtered_country_list, expand=True, fill=True, padding=0
         )
 
-    def _search_input_exists(
-        self, search_text: str, server, entry_country_name: bool = False, server_name: bool = False
-    ) -> bool:
-        if entry_country_name:
-            return search_text and (search_text in server.entry_country_name.lower())
-
-        if server_name:
-            return search_text and (search_text in server.name.lower())
-
-        return None
+    @property
+    def filtered_list(self) -> FilteredList:
+        """Returns the list displaying the search results.
+        This method was made available for tests."""
+        return self._filtered_country_list
+
+    def refresh_search_index(self) -> Optional[ServerListSearchIndex]:
+        """
+        Makes sure the search index was built for the current server list,
+        and returns it. The index is only rebuilt when the server list changes.
+        """
+        server_list = self._controller.server_list
+        user_tier = self._controller.user_tier
+        with self._search_index_lock:
+            search_index = self._search_index
+            if not server_list:
+                search_index = None
+            elif (
+                not search_index
+                or search_index.server_list is not server_list
+                or search_index.user_tier != user_tier
+            ):
+                search_index = ServerListSearchIndex.build(server_list, user_tier)
+
+            self._search_index = search_index
+            return search_index
+
+    def _search_countries(self, search_text: str = None) -> List[Tuple[str, None]]:
+        search_index = self.refresh_search_index()
+        if not search_index:
+            return []
+
+        return [(name, None) for name in search_index.countries.search(search_text)]
+
+    def _search_servers(self, search_text: str = None) -> List[Tuple[str, int]]:
+        search_index = self.refresh_search_index()
+        if not search_index:
+            return []
+
+        return [
+            (server.name, server.load)
+            for server in search_index.servers.search(search_text)
+        ]
 
     @GObject.Signal(name="result-chosen", arg_types=(str,))
     def result_chosen(self, _row: str):
         """Broadcast that a result has been chosen in the search results."""
 
+    @GObject.Signal(name="search-complete", arg_types=(str, float))
+    def search_complete(self, _search_text: str, _latency_ms: float):
+        """
+        Signal emitted once the search results for the search text are
+        displayed, with the time elapsed since the search text changed.
+        """
+
     def on_search_changed(self, search_widget: Gtk.SearchEntry, revealer: Gtk.Revealer):
         """Callback when search entry has changed."""
         search_text = search_widget.get_text().lower()
         self._revealer = revealer
 
-        self._filtered_country_list.update(search_text)
-        self._revealer.set_reveal_child(bool(search_text))
+        self._search_generation += 1
+        self._cancel_pending_search()
+
+        if not search_text:
+            self._filtered_country_list.display([])
+            self._revealer.set_reveal_child(False)
+            return
+
+        # Searches are debounced so that fast typing only triggers a single
+        # rebuild of the search results.
+        self._debounce_source_id = GLib.timeout_add(
+            self._debounce_ms, self._start_search,
+            self._search_generation, search_text, time.time()
+        )
+
+    def _cancel_pending_search(self):
+        if self._debounce_source_id is not None:
+            GLib.source_remove(self._debounce_source_id)
+            self._debounce_source_id = None
+
+        if self._pending_search:
+            # Only possible if the search has not started yet. Otherwise, its
+            # results will be discarded once it finishes.
+            self._pending_search.cancel()
+            self._pending_search = None
+
+    def _start_search(self, generation: int, search_text: str, start_time: float):
+        self._debounce_source_id = None
+
+        if not self._executor:
+            self._on_search_results(
+                generation, search_text, start_time,
+                self._filtered_country_list.search(search_text)
+            )
+            return False
+
+        future = self._executor.submit(self._filtered_country_list.search, search_text)
+        self._pending_search = future
+
+        def on_search_done(future: Future):
+            if not future.cancelled():
+                GLib.idle_add(self._on_search_done, generation, search_text, start_time, future)
+
+        future.add_done_callback(on_search_done)
+        return False
+
+    def _on_search_done(
+            self, generation: int, search_text: str, start_time: float, future: Future
+    ):
+        # Any errors while filtering the search results are bubbled up here.
+        self._on_search_results(generation, search_text, start_time, future.result())
+
+    def _on_search_results(
+            self, generation: int, search_text: str, start_time: float,
+            sections: SearchResultSections
+    ):
+        if generation != self._search_generation:
+            # The search text changed while the results were being filtered.
+            return
+
+        self._pending_search = None
+        self._filtered_country_list.display(sections)
+        self._revealer.set_reveal_child(True)
+
+        latency_ms = (time.time() - start_time) * 1000
+        logger.debug(f"Search results for \"{search_text}\" displayed in {latency_ms:.1f} ms.")
+        self.emit("search-complete", search_text, latency_ms)
 
     def _on_row_activated(
         self,
@@ -24,10 +24,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
 from gi.repository import Atk, GLib, GObject
 
 from proton.vpn.app.gtk.utils import accessibility
+from proton.vpn.app.gtk.utils.glib import run_in_batches
 from proton.vpn.app.gtk.utils.search import normalize
 from proton.vpn.connection.enum import ConnectionStateEnum
 from proton.vpn.session.servers import Country
@@ -53,8 +54,8 @@ class CountryAnalysis:
     country_features: Set[ServerFeatureEnum]
 
 
-def _analyze_servers(ordered_servers: List[LogicalServer],
-                     connected_server_id: str = None) -> CountryAnalysis:
+def analyze_servers(ordered_servers: List[LogicalServer],
+                    connected_server_id: str = None) -> CountryAnalysis:
     """
     Iterates over the ordered list of servers and extracts information
     to be displayed for the country.
@@ -100,6 +101,21 @@ def _analyze_servers(ordered_servers: List[LogicalServer],
     )
 
 
+def _server_row_key(server: LogicalServer) -> tuple:
+    """
+    Returns the server attributes displayed in a server row that can only be
+    updated by rebuilding the row.
+    """
+    return (
+        server.name,
+        server.tier,
+        frozenset(server.features),
+        server.host_country,
+        server.entry_country_name,
+        server.exit_country_name
+    )
+
+
 class CountryHeader(Gtk.Box):  # pylint: disable=too-many-instance-attributes
     """Header with the country name shown at the beginning of each CountryRow."""
     # pylint: disable=too-many-arguments
@@ -295,9 +311,9 @@ class CountryHeader(Gtk.Box):  # pylint: disable=too-many-instance-attributes
 
         if self.available:
             # Update the server row according to the connection state.
-            method = f"_on_connection_state_{connection_state.name.lower()}"
-            if hasattr(self, method):
-                getattr(self, method)()
+            handler = self._CONNECTION_STATE_HANDLERS.get(connection_state)
+            if handler:
+                handler(self)
 
     def _on_toggle_button_clicked(self, _toggle_button: Gtk.Button):
         self.show_country_servers = not self.show_country_servers
@@ -329,6 +345,14 @@ class CountryHeader(Gtk.Box):  # pylint: disable=too-many-instance-attributes
         """Flags this server as "error"."""
         self._on_connection_state_disconnected()
 
+    _CONNECTION_STATE_HANDLERS = {
+        ConnectionStateEnum.DISCONNECTED: _on_connection_state_disconnected,
+        ConnectionStateEnum.CONNECTING: _on_connection_state_connecting,
+        ConnectionStateEnum.CONNECTED: _on_connection_state_connected,
+        ConnectionStateEnum.DISCONNECTING: _on_connection_state_disconnecting,
+        ConnectionStateEnum.ERROR: _on_connection_state_error,
+    }
+
     def click_toggle_country_servers_button(self):
         """Clicks the button to toggle the country servers.
         This method was made available for tests."""
@@ -355,90 +379,128 @@ class DeferredCountryRow(Gtk.Box):  # pylint: disable=too-many-instance-attribut
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
 
         self._controller = controller
+        self._user_tier = user_tier
         self._indexed_server_rows = {}
+        self._server_rows_built = False
+        self._server_rows_builder_id = None
+        self._server_loads_outdated = False
 
-        free_servers, plus_servers =\
-            self._group_servers_by_tier(country.servers)
-        is_free_user = user_tier == 0
-
-        # Properties initialized after building all server rows.
+        # Properties initialized after analysing the country servers.
         self._is_free_country = None
         self._upgrade_required = None
         self._country_features = set()
         self._under_maintenance = None
+        self._smart_routing_country = None
 
         self._server_rows_revealer = Gtk.Revealer()
-        server_rows_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self._server_rows_revealer.add(server_rows_container)
-
-        ordered_servers = []
-        if is_free_user:
-            ordered_servers.extend(free_servers)
-            ordered_servers.extend(plus_servers)
-        else:
-            ordered_servers.extend(plus_servers)
-            ordered_servers.extend(free_servers)
-
-        analysis = _analyze_servers(ordered_servers, connected_server_id)
+        self._server_rows_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        self._server_rows_revealer.add(self._server_rows_container)
 
-        self._under_maintenance = analysis.under_maintenance  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
-        self._is_free_country = analysis.is_free_country  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
-        self._country_features = analysis.country_features  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+        self._ordered_servers = self._order_servers_by_user_tier(country.servers)
+        analysis = analyze_servers(self._ordered_servers, connected_server_id)
+        self._set_country_analysis(analysis)
         self._connected_server_id = connected_server_id
+        # Id of the server whose row displays the current connection state.
+        self._displayed_server_id = connected_server_id
 
-        def add_servers_to_country():
-            for server in ordered_servers:
-                server_row = ServerRow(
-                    server=server,
-                    user_tier=user_tier,
-                    controller=self._controller
-                )
-                server_rows_container.pack_start(
-                    server_row,
-                    expand=False, fill=False, padding=5
-                )
+        self._country_header = self._build_country_header(
+            country, analysis.country_connection_state, show_country_servers
+        )
 
-                self._indexed_server_rows[server.id] = server_row
+        self.pack_start(self._country_header, expand=False, fill=False, padding=5)
+        self.pack_start(self._server_rows_revealer, expand=False, fill=False, padding=5)
 
-                # If we are currently connected to a server then set its row
-                # state to "connected".
-                #
-                # We use self._connected_server_id instead of
-                # connected_server_id because there's a chance it might change
-                # before this function is called.
-                if self._connected_server_id == server.id:
-                    server_row.connection_state = ConnectionStateEnum.CONNECTED
+        if show_country_servers:
+            self._server_rows_revealer.set_reveal_child(True)
 
-        self._add_servers_to_country = add_servers_to_country
+        self.connect("destroy", lambda _: self._cancel_server_rows_builder())
 
-        self._upgrade_required = is_free_user and not self._is_free_country
+    @GObject.Signal(name="server-rows-built")
+    def server_rows_built(self):
+        """Signal emitted once all the server rows for the country were built."""
 
-        self._country_header = CountryHeader(
+    def _set_country_analysis(self, analysis: CountryAnalysis):
+        self._under_maintenance = analysis.under_maintenance  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+        self._is_free_country = analysis.is_free_country  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+        self._country_features = analysis.country_features  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+        self._smart_routing_country = analysis.smart_routing_country  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+        self._upgrade_required = self._user_tier == 0 and not self._is_free_country
+
+    def _build_country_header(
+            self, country: Country, connection_state: ConnectionStateEnum,
+            show_country_servers: bool
+    ) -> CountryHeader:
+        country_header = CountryHeader(
             country=country,
             under_maintenance=self._under_maintenance,
             upgrade_required=self._upgrade_required,
             server_features=self._country_features,
-            smart_routing=analysis.smart_routing_country,
-            connection_state=analysis.country_connection_state,
-            controller=controller,
+            smart_routing=self._smart_routing_country,
+            connection_state=connection_state,
+            controller=self._controller,
             show_country_servers=show_country_servers
         )
-        self._country_header.connect(
+        country_header.connect(
             "toggle-country-servers", self._on_toggle_country_servers
         )
+        return country_header
+
+    def _order_servers_by_user_tier(self, country_servers) -> List[LogicalServer]:
+        free_servers, plus_servers = self._group_servers_by_tier(country_servers)
+        if self._user_tier == 0:
+            return free_servers + plus_servers
+        return plus_servers + free_servers
+
+    def _build_server_row(self, server: LogicalServer) -> ServerRow:
+        server_row = ServerRow(
+            server=server,
+            user_tier=self._user_tier,
+            controller=self._controller
+        )
+        self._indexed_server_rows[server.id] = server_row
 
-        self.pack_start(self._country_header, expand=False, fill=False, padding=5)
-        self.pack_start(self._server_rows_revealer, expand=False, fill=False, padding=5)
+        # If we are currently connected to a server then set its row
+        # state to "connected".
+        #
+        # We use self._connected_server_id instead of the connected server id
+        # passed to the constructor because there's a chance it might change
+        # before the server rows are built.
+        if self._connected_server_id == server.id:
+            server_row.connection_state = ConnectionStateEnum.CONNECTED
 
-        if show_country_servers:
-            self._server_rows_revealer.set_reveal_child(True)
+        return server_row
+
+    def _add_servers_to_country(self):
+        """
+        Builds the server rows in batches on the GLib main loop, so that
+        expanding countries with many servers does not block user input.
+        The revealer shows the rows as they are built.
+        """
+        def add_server_row(server: LogicalServer):
+            server_row = self._build_server_row(server)
+            self._server_rows_container.pack_start(
+                server_row, expand=False, fill=False, padding=5
+            )
+            server_row.show_all()
+
+        def on_server_rows_built():
+            self._server_rows_builder_id = None
+            self.emit("server-rows-built")
+
+        self._server_rows_revealer.show_all()
+        self._server_rows_builder_id = run_in_batches(
+            add_server_row, list(self._ordered_servers), on_complete=on_server_rows_built
+        )
+
+    def _cancel_server_rows_builder(self):
+        if self._server_rows_builder_id is not None:
+            GLib.source_remove(self._server_rows_builder_id)
+            self._server_rows_builder_id = None
 
     def _generate_servers_if_needed(self, country_header: CountryHeader):
-        if country_header.show_country_servers:
-            if self._add_servers_to_country:
-                self._add_servers_to_country()
-                self._add_servers_to_country = None
-                self._server_rows_revealer.show_all()
+        if country_header.show_country_servers and not self._server_rows_built:
+            self._server_rows_built = True
+            self._add_servers_to_country()
 
     def toggle_row(self):
         """Toggles the view of the children of the country row."""
@@ -514,19 +576,29 @@ class DeferredCountryRow(Gtk.Box):  # pylint: disable=too-many-instance-attribut
             country_header.show_country_servers
         )
         self._generate_servers_if_needed(country_header)
+        if self._server_loads_outdated and country_header.show_country_servers:
+            self.update_server_loads()
 
     def set_servers_visibility(self, visible: bool):
         """Country servers will be shown if set to True. Otherwise, they'll be hidden."""
         self._country_header.show_country_servers = visible
         self._server_rows_revealer.set_reveal_child(visible)
 
+    def get_server_row(self, server_id: str) -> Optional[ServerRow]:
+        """Returns the server row for the specified server, if it was already built."""
+        return self._indexed_server_rows.get(server_id)
+
     def connection_status_update(self, connection_state):
         """This method is called by VPNWidget whenever the VPN connection status changes."""
         self._country_header.connection_state = connection_state.type
         server_id = connection_state.context.connection.server_id
-        server = self._indexed_server_rows.get(server_id, None)
-        if server:
-            server.connection_state = connection_state.type
+        if self._displayed_server_id != server_id:
+            # Only the previous server row needs to be repainted.
+            self._set_server_row_connection_state(
+                self._displayed_server_id, ConnectionStateEnum.DISCONNECTED
+            )
+            self._displayed_server_id = server_id
+        self._set_server_row_connection_state(server_id, connection_state.type)
 
         # maintain connected server id only when connected
         if self._controller.is_connection_active:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
@@ -534,23 +606,153 @@ class DeferredCountryRow(Gtk.Box):  # pylint: disable=too-many-instance-attribut
         else:
             self._connected_server_id = None
 
+    def reset_connection_state(self):
+        """
+        Displays the row as disconnected. This method is called when the VPN
+        connection status changes for a server in another country.
+        """
+        self._country_header.connection_state = ConnectionStateEnum.DISCONNECTED
+        self._set_server_row_connection_state(
+            self._displayed_server_id, ConnectionStateEnum.DISCONNECTED
+        )
+        self._displayed_server_id = None
+        self._connected_server_id = None
+
+    def _set_server_row_connection_state(
+            self, server_id: Optional[str], connection_state: ConnectionStateEnum
+    ):
+        server_row = self._indexed_server_rows.get(server_id)
+        if server_row:
+            server_row.connection_state = connection_state
+
     def click_connect_button(self):
         """Clicks the button to connect to the country.
         This method was made available for tests."""
         self._country_header.click_connect_button()
 
-    def update_server_loads(self, new_country: Country):
-        """Refreshes the UI after new server loads were retrieved."""
-        # Start by setting the country under maintenance until the opposite is proven.
-        for server_row in self._indexed_server_rows.values():
-            server_row.update_server_load()
+    def update_country(self, country: Country) -> int:
+        """
+        Patches the row after a server list update.
 
-        if new_country is not None:
-            self._under_maintenance = _analyze_servers(
-                new_country.servers,
-                self._connected_server_id
-            ).under_maintenance
+        The country header is only rebuilt if the information it displays
+        changed, and only the server rows for servers that were added, removed
+        or modified are rebuilt. The rest of server rows are kept as they are.
 
-            self._country_header.update_under_maintenance_status(
-                self._under_maintenance
-            )
+        :return: the number of rows (country header and server rows) that were
+            added, removed or rebuilt.
+        """
+        self._ordered_servers = self._order_servers_by_user_tier(country.servers)
+        analysis = analyze_servers(self._ordered_servers, self._connected_server_id)
+
+        old_header_values = (
+            self._upgrade_required, self._country_features,
+            self._smart_routing_country, self._under_maintenance
+        )
+        self._set_country_analysis(analysis)
+        new_header_values = (
+            self._upgrade_required, self._country_features,
+            self._smart_routing_country, self._under_maintenance
+        )
+
+        touched_rows = 0
+        if old_header_values[:3] != new_header_values[:3]:
+            self._replace_country_header(country)
+            touched_rows += 1
+        elif old_header_values[3] != new_header_values[3]:
+            self._country_header.update_under_maintenance_status(self._under_maintenance)
+            touched_rows += 1
+
+        if self._server_rows_built:
+            building_server_rows = self._server_rows_builder_id is not None
+            # The rows that were not built yet are added while patching them.
+            self._cancel_server_rows_builder()
+            touched_rows += self._patch_server_rows()
+            if building_server_rows:
+                self.emit("server-rows-built")
+
+        return touched_rows
+
+    def _replace_country_header(self, country: Country):
+        old_country_header = self._country_header
+        self._country_header = self._build_country_header(
+            country,
+            old_country_header.connection_state,
+            old_country_header.show_country_servers
+        )
+        self.remove(old_country_header)
+        old_country_header.destroy()
+        self.pack_start(self._country_header, expand=False, fill=False, padding=5)
+        self.reorder_child(self._country_header, 0)
+        self._country_header.show_all()
+
+    def _patch_server_rows(self) -> int:
+        """Reconciles the existing server rows with the current list of servers."""
+        touched_rows = 0
+        old_server_rows = self._indexed_server_rows
+        self._indexed_server_rows = {}
+
+        for position, server in enumerate(self._ordered_servers):
+            server_row = old_server_rows.pop(server.id, None)
+            if server_row and _server_row_key(server_row.server) == _server_row_key(server):
+                # The row is kept, but it has to point to the new server object
+                # so that server load updates are displayed.
+                server_row.server = server
+                self._indexed_server_rows[server.id] = server_row
+            else:
+                if server_row:
+                    self._server_rows_container.remove(server_row)
+                    server_row.destroy()
+                server_row = self._build_server_row(server)
+                self._server_rows_container.pack_start(
+                    server_row, expand=False, fill=False, padding=5
+                )
+                server_row.show_all()
+                touched_rows += 1
+
+            self._server_rows_container.reorder_child(server_row, position)
+
+        for server_row in old_server_rows.values():
+            self._server_rows_container.remove(server_row)
+            server_row.destroy()
+            touched_rows += 1
+
+        return touched_rows
+
+    @property
+    def server_loads_outdated(self) -> bool:
+        """Returns True if repainting the server rows after a server load
+        update was deferred because they were not visible."""
+        return self._server_loads_outdated
+
+    def update_server_loads(self, visible: bool = True) -> int:
+        """
+        Refreshes the UI after new server loads were retrieved.
+
+        Server loads are updated in place on the servers being displayed, so
+        only the rows whose load or status changed are repainted. Repainting
+        the server rows is deferred while they are not visible.
+
+        :param visible: whether the country row is currently visible or not.
+        :return: the number of rows that were repainted.
+        """
+        repainted_rows = 0
+
+        under_maintenance = not any(server.enabled for server in self._ordered_servers)
+        if under_maintenance != self._under_maintenance:
+            self._under_maintenance = under_maintenance
+            self._country_header.update_under_maintenance_status(under_maintenance)
+            repainted_rows += 1
+
+        if not self._server_rows_built:
+            return repainted_rows
+
+        if not visible or not self.showing_servers:
+            self._server_loads_outdated = True
+            return repainted_rows
+
+        self._server_loads_outdated = False
+        for server_row in self._indexed_server_rows.values():
+            if server_row.update_server_load():
+                repainted_rows += 1
+
+        return repainted_rows
@@ -53,6 +53,8 @@ class ServerRow(Gtk.Box):
         self._under_maintenance_icon: Optional[UnderMaintenanceIcon] = None
         self._server_load: Optional[ServerLoad] = None
         self._connect_button: Optional[Gtk.Button] = None
+        # Server (load, enabled) values currently displayed by the row.
+        self._displayed_load_state = None
 
         self._build_row()
 
@@ -77,9 +79,9 @@ class ServerRow(Gtk.Box):
 
         if self.available:
             # Update the server row according to the connection state.
-            method = f"_on_connection_state_{connection_state.name.lower()}"
-            if hasattr(self, method):
-                getattr(self, method)()
+            handler = self._CONNECTION_STATE_HANDLERS.get(connection_state)
+            if handler:
+                handler(self)
 
     def _build_row(self):
         self._server_label = Gtk.Label(label=self._server.name)
@@ -91,6 +93,7 @@ class ServerRow(Gtk.Box):
         )
 
         self._show_under_maintenance_icon_or_server_details(self._server.enabled)
+        self._displayed_load_state = (self._server.load, self._server.enabled)
 
     def _show_under_maintenance_icon_or_server_details(self, server_enabled: bool):
         if server_enabled:
@@ -212,6 +215,14 @@ class ServerRow(Gtk.Box):
         """Flags this server as "not connected"."""
         self._on_connection_state_disconnected()
 
+    _CONNECTION_STATE_HANDLERS = {
+        ConnectionStateEnum.DISCONNECTED: _on_connection_state_disconnected,
+        ConnectionStateEnum.CONNECTING: _on_connection_state_connecting,
+        ConnectionStateEnum.CONNECTED: _on_connection_state_connected,
+        ConnectionStateEnum.DISCONNECTING: _on_connection_state_disconnecting,
+        ConnectionStateEnum.ERROR: _on_connection_state_error,
+    }
+
     def _on_connect_button_clicked(self, _):
         future = self._controller.connect_to_server(self._server.name)
         future.add_done_callback(lambda f: GLib.idle_add(f.result))  # bubble up exceptions if any.
@@ -227,6 +238,20 @@ class ServerRow(Gtk.Box):
         """Returns if a plan upgrade is required to connect to server."""
         return self._server.tier > self._user_tier
 
+    @property
+    def server(self) -> LogicalServer:
+        """Returns the server displayed in this row."""
+        return self._server
+
+    @server.setter
+    def server(self, server: LogicalServer):
+        """
+        Replaces the server displayed in this row with an updated version of
+        the same server, after a server list update.
+        """
+        self._server = server
+        self.update_server_load()
+
     @property
     def server_label(self) -> str:
         """Returns the server label."""
@@ -286,36 +311,59 @@ class ServerRow(Gtk.Box):
 
         return bool(filtered_icons)
 
-    def update_server_load(self):
-        """Redraws the row after a server load update."""
+    def update_server_load(self) -> bool:
+        """
+        Redraws the row after a server load update.
+
+        :return: True if the row was redrawn or False if the server load and
+            status displayed were already up-to-date.
+        """
+        load_state = (self._server.load, self._server.enabled)
+        if load_state == self._displayed_load_state:
+            return False
+
+        self._displayed_load_state = load_state
         # The server status may have changed
         self._show_under_maintenance_icon_or_server_details(self._server.enabled)
         if self._server.enabled:
             self._server_load.set_load(self._server.load)
 
+        return True
+
 
 class ServerLoad(Gtk.Label):
     """Displays the server load shown in a server row."""
     def __init__(self, load: int):
         super().__init__()
         self.set_name("server-load")
+        self._load = None
+        self._style_class = None
 
         self.set_load(load)
 
     def set_load(self, load: int):
         """Sets the load percentage to be displayed."""
+        if load == self._load:
+            return
+
+        self._load = load
         self.set_label(f"{load}%")
         help_text = f"Server load is at {load}%"
         self.set_tooltip_text(help_text)
         self.get_accessible().set_name(help_text)
-        style_context = self.get_style_context()
-
-        for cls in "signal-danger", "signal-warning", "signal-success":
-            style_context.remove_class(cls)
 
         if load > 90:
-            style_context.add_class("signal-danger")
+            style_class = "signal-danger"
         elif load > 75:
-            style_context.add_class("signal-warning")
+            style_class = "signal-warning"
         else:
-            style_context.add_class("signal-success")
+            style_class = "signal-success"
+
+        # Changing the style classes invalidates the widget style, so it's
+        # only done when the load crosses a threshold.
+        if style_class != self._style_class:
+            style_context = self.get_style_context()
+            if self._style_class:
+                style_context.remove_class(self._style_class)
+            style_context.add_class(style_class)
+            self._style_class = style_class
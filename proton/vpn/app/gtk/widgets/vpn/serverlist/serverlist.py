@@ -23,13 +23,14 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 
 from gi.repository import GLib, GObject
 
 from proton.vpn.app.gtk import Gtk
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.vpn.serverlist.country import DeferredCountryRow
+from proton.vpn.app.gtk.widgets.vpn.serverlist.server import ServerRow
 from proton.vpn.session.servers import Country, LogicalServer, ServerList
 from proton.vpn import logging
 
@@ -47,10 +48,23 @@ class ServerListWidgetState:
         user_tier: the tier the user has access to.
         server_list: list of servers to be displayed.
         country_rows: country rows indexed by country code.
+        outdated_country_codes: codes of the country rows that were not
+            visible during the last server loads update, and that need to
+            be updated once they are.
+        country_rows_by_server_id: country rows indexed by the ids of the
+            servers they contain.
+        connected_country_row: country row displaying the current
+            connection state.
+        is_snapshot: flag set to True while the server list being displayed
+            is the snapshot persisted the last time the app ran.
     """
     user_tier: int = None
     server_list: ServerList = None
     country_rows: Dict[str, DeferredCountryRow] = field(default_factory=dict)
+    outdated_country_codes: Set[str] = field(default_factory=set)
+    country_rows_by_server_id: Dict[str, DeferredCountryRow] = field(default_factory=dict)
+    connected_country_row: Optional[DeferredCountryRow] = None
+    is_snapshot: bool = False
 
     def get_server_by_id(self, server_id: str) -> LogicalServer:
         """Returns the server with the given name."""
@@ -58,6 +72,41 @@ class ServerListWidgetState:
             return self.server_list.get_by_id(server_id)
         return None
 
+    def get_rows(
+            self, server_id: str
+    ) -> Tuple[Optional[DeferredCountryRow], Optional[ServerRow]]:
+        """
+        Returns the country row containing the specified server and its
+        server row, which is None until the country row is expanded.
+        """
+        country_row = self.country_rows_by_server_id.get(server_id)
+        if country_row is None:
+            return None, None
+        return country_row, country_row.get_server_row(server_id)
+
+    def index_country_row(self, country: Country, country_row: DeferredCountryRow):
+        """Indexes the country row by the ids of the servers of the country."""
+        for server in country.servers:
+            self.country_rows_by_server_id[server.id] = country_row
+
+
+@dataclass
+class CountryRowChanges:
+    """
+    Summary of the changes done to the country rows after a server list update.
+
+    Attributes:
+        added: number of country rows added.
+        removed: number of country rows removed.
+        updated: number of country rows that were patched.
+        touched_rows: total number of country headers and server rows
+            that were added, removed or rebuilt.
+    """
+    added: int = 0
+    removed: int = 0
+    updated: int = 0
+    touched_rows: int = 0
+
 
 class ServerListWidget(Gtk.ScrolledWindow):
     """Displays the VPN servers list."""
@@ -79,6 +128,8 @@ class ServerListWidget(Gtk.ScrolledWindow):
         self._state = ServerListWidgetState()
 
         self.connect("unrealize", self._on_unrealize)
+        self.connect("map", self._on_viewport_changed)
+        self.get_vadjustment().connect("value-changed", self._on_viewport_changed)
 
     def _on_unrealize(self, _widget):
         self.unload()
@@ -99,19 +150,18 @@ class ServerListWidget(Gtk.ScrolledWindow):
         return list(self._state.country_rows.values())
 
     def connection_status_update(self, connection_status):
-        """
-        This method is called by VPNWidget whenever the VPN connection status changes.
-        Important: as this method is always called from another thread, we need
-        to make sure that any resulting actions are passed to the main thread
-        running GLib's main loop with GLib.idle_add.
-        """
+        """This method is called by VPNWidget whenever the VPN connection status changes."""
         connection = connection_status.context.connection
-        if connection:
-            def update_server_rows():
-                country_row = self._get_country_row(connection.server_id)
-                country_row.connection_status_update(connection_status)
+        if not connection:
+            return
+
+        country_row = self._get_country_row(connection.server_id)
+        previous_country_row = self._state.connected_country_row
+        if previous_country_row is not None and previous_country_row is not country_row:
+            previous_country_row.reset_connection_state()
 
-            GLib.idle_add(update_server_rows)
+        country_row.connection_status_update(connection_status)
+        self._state.connected_country_row = country_row
 
     def _remove_country_rows(self):
         """Remove UI country rows."""
@@ -123,29 +173,55 @@ class ServerListWidget(Gtk.ScrolledWindow):
         """Whenever a new server list is received the UI should be updated."""
         start = time.time()
         self._state.server_list = self._controller.server_list
-        self._build_country_rows()
+        changes = self._reconcile_country_rows()
         logger.info(
             "Full server list widget update completed in "
-            f"{time.time() - start:.2f} seconds."
+            f"{time.time() - start:.2f} seconds "
+            f"({changes.added} country rows added, {changes.removed} removed "
+            f"and {changes.updated} updated, {changes.touched_rows} rows touched)."
         )
 
     def _on_server_loads_update(self):
         start = time.time()
+        repainted_rows = 0
 
-        new_countries = {
-            country.code: country
-            for country in self._controller.server_list.group_by_country()
-        }
-
-        for country_row in self._state.country_rows.values():
-            new_country = new_countries.get(country_row.country_code, None)
-            country_row.update_server_loads(new_country)
+        for country_code, country_row in self._state.country_rows.items():
+            repainted_rows += country_row.update_server_loads(
+                visible=self._is_country_row_visible(country_row)
+            )
+            if country_row.server_loads_outdated:
+                self._state.outdated_country_codes.add(country_code)
 
         logger.info(
             "Partial server list widget update completed in "
-            f"{time.time() - start:.2f} seconds."
+            f"{time.time() - start:.2f} seconds ({repainted_rows} rows repainted, "
+            f"{len(self._state.outdated_country_codes)} countries deferred)."
         )
 
+    def _is_country_row_visible(self, country_row: DeferredCountryRow) -> bool:
+        """Returns whether the country row is within the scrolled window viewport."""
+        if not self.get_mapped():
+            return False
+
+        adjustment = self.get_vadjustment()
+        viewport_top = adjustment.get_value()
+        viewport_bottom = viewport_top + adjustment.get_page_size()
+        allocation = country_row.get_allocation()
+        return allocation.y < viewport_bottom and allocation.y + allocation.height > viewport_top
+
+    def _on_viewport_changed(self, *_):
+        """Updates the server loads of the rows that were scrolled into view."""
+        if not self._state.outdated_country_codes:
+            return
+
+        for country_code in list(self._state.outdated_country_codes):
+            country_row = self._state.country_rows.get(country_code)
+            if not country_row or not country_row.server_loads_outdated:
+                self._state.outdated_country_codes.discard(country_code)
+            elif self._is_country_row_visible(country_row):
+                country_row.update_server_loads()
+                self._state.outdated_country_codes.discard(country_code)
+
     def focus_on_entry(self, _widget, name_to_search: str) -> None:
         """Searches for an entry by name and either connects to it directly,
            or focuses on it."""
@@ -166,14 +242,43 @@ class ServerListWidget(Gtk.ScrolledWindow):
                 country.set_can_focus(False)  # required to navigate countries with keyboard
                 return
 
-    def display(self, user_tier: int, server_list: int):
-        """Update UI with the new server list."""
+    def display_snapshot(self, user_tier: int, server_list: ServerList):
+        """
+        Displays the server list persisted the last time the app ran, while
+        the up-to-date one is being retrieved. Rows are not actionable until
+        `display` is called.
+        """
         self._state = ServerListWidgetState(
             server_list=server_list,
-            user_tier=user_tier
+            user_tier=user_tier,
+            is_snapshot=True
         )
 
         self._build_country_rows()
+        self._container.set_sensitive(False)
+
+    def display(self, user_tier: int, server_list: ServerList):
+        """Update UI with the new server list."""
+        if self._state.is_snapshot and self._state.user_tier == user_tier:
+            # Only patch the rows that changed since the snapshot was taken.
+            start = time.time()
+            self._state.is_snapshot = False
+            self._state.server_list = server_list
+            changes = self._reconcile_country_rows()
+            logger.info(
+                "Server list snapshot reconciled in "
+                f"{time.time() - start:.2f} seconds "
+                f"({changes.added} country rows added, {changes.removed} removed "
+                f"and {changes.updated} updated, {changes.touched_rows} rows touched)."
+            )
+        else:
+            self._state = ServerListWidgetState(
+                server_list=server_list,
+                user_tier=user_tier
+            )
+            self._build_country_rows()
+
+        self._container.set_sensitive(True)
         self._controller.set_server_list_updated_callback(self._on_server_list_update)
         self._controller.set_server_loads_updated_callback(self._on_server_loads_update)
 
@@ -182,6 +287,9 @@ class ServerListWidget(Gtk.ScrolledWindow):
         self._state.country_rows = self._create_new_country_rows(
             old_country_rows=self._state.country_rows
         )
+        self._state.connected_country_row, _ = self._state.get_rows(
+            self._get_connected_server_id()
+        )
         self._add_country_rows()
         self._container.show_all()
         self.emit("ui-updated")
@@ -199,46 +307,114 @@ class ServerListWidget(Gtk.ScrolledWindow):
                 expand=False, fill=False, padding=0
             )
 
-    def _create_new_country_rows(self, old_country_rows) -> Dict[str, DeferredCountryRow]:
-        """Returns new country rows."""
+    def _reconcile_country_rows(self) -> CountryRowChanges:
+        """
+        Updates the country rows to match the current server list.
+
+        Instead of rebuilding all rows, the new server list is compared with
+        the one being displayed by country code and server id, and only the
+        rows that changed are added, removed or patched. Existing rows keep
+        their expanded state and their server rows.
+        """
+        changes = CountryRowChanges()
+        old_country_rows = self._state.country_rows
+        connected_server_id = self._get_connected_server_id()
+        self._state.country_rows_by_server_id = {}
+
+        new_country_rows = {}
+        for country in self._get_sorted_countries():
+            country_code = country.code.lower()
+            country_row = old_country_rows.pop(country_code, None)
+            if country_row is None:
+                country_row = self._create_country_row(country, connected_server_id)
+                self._container.pack_start(
+                    country_row, expand=False, fill=False, padding=0
+                )
+                country_row.show_all()
+                changes.added += 1
+                changes.touched_rows += 1
+            else:
+                touched_rows = country_row.update_country(country)
+                if touched_rows:
+                    changes.updated += 1
+                    changes.touched_rows += touched_rows
+
+            new_country_rows[country_code] = country_row
+            self._state.index_country_row(country, country_row)
+
+        for country_row in old_country_rows.values():
+            if country_row is self._state.connected_country_row:
+                self._state.connected_country_row = None
+            self._container.remove(country_row)
+            country_row.destroy()
+            changes.removed += 1
+            changes.touched_rows += 1
+
+        # Keep the order of the country rows in sync with the server list.
+        for position, country_row in enumerate(new_country_rows.values()):
+            self._container.reorder_child(country_row, position)
+
+        self._state.country_rows = new_country_rows
+        self.emit("ui-updated")
+        return changes
+
+    def _get_sorted_countries(self) -> List[Country]:
         countries = self._state.server_list.group_by_country()
         if self._state.user_tier == 0:
             # If the current user has a free account, sort the countries having
             # free servers first.
             countries.sort(key=free_countries_first_sorting_key)
+        return countries
 
-        connected_server_id = None
+    def _get_connected_server_id(self) -> Optional[str]:
         if self._controller.is_connection_active:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
-            connected_server_id = self._controller.current_server_id
+            return self._controller.current_server_id
+        return None
 
+    def _create_new_country_rows(self, old_country_rows) -> Dict[str, DeferredCountryRow]:
+        """Returns new country rows."""
+        countries = self._get_sorted_countries()
+        connected_server_id = self._get_connected_server_id()
+
+        self._state.country_rows_by_server_id = {}
         new_country_rows = {}
         for country in countries:
             show_country_servers = False
             if old_country_rows and old_country_rows.get(country.code):
                 show_country_servers = old_country_rows[country.code].showing_servers
 
-            country_row = DeferredCountryRow(
-                country=country,
-                user_tier=self._state.user_tier,
-                controller=self._controller,
-                connected_server_id=connected_server_id,
-                show_country_servers=show_country_servers
+            country_row = self._create_country_row(
+                country, connected_server_id, show_country_servers
             )
             new_country_rows[country.code.lower()] = country_row
+            self._state.index_country_row(country, country_row)
 
         return new_country_rows
 
+    def _create_country_row(
+            self, country: Country, connected_server_id: Optional[str],
+            show_country_servers: bool = False
+    ) -> DeferredCountryRow:
+        country_row = DeferredCountryRow(
+            country=country,
+            user_tier=self._state.user_tier,
+            controller=self._controller,
+            connected_server_id=connected_server_id,
+            show_country_servers=show_country_servers
+        )
+        country_row.connect("server-rows-built", self._on_server_rows_built)
+        return country_row
+
+    def _on_server_rows_built(self, _country_row: DeferredCountryRow):
+        self.emit("ui-updated")
+        self.emit("filter-complete")
+
     def _get_country_row(self, server_id: str) -> DeferredCountryRow:
         """Returns a country row based on the vpn server."""
-        logical_server = self._state.get_server_by_id(server_id)
-        country_code = logical_server.exit_country.lower()
-        try:
-            return self._state.country_rows[country_code]
-        except KeyError as error:
-            raise RuntimeError(
-                f"Unable to get country row {country_code} for server "
-                f"{server_id}."
-            ) from error
+        country_row, _ = self._state.get_rows(server_id)
+        if country_row is None:
+            raise RuntimeError(f"Unable to get country row for server {server_id}.")
+        return country_row
 
 
 def free_countries_first_sorting_key(country: Country):
@@ -0,0 +1,546 @@
+"""
+This module defines a virtualized version of the server list widget.
+
+Instead of building one widget hierarchy per country/server, the virtualized
+server list keeps a flat tree model of countries and servers and lets
+Gtk.TreeView render only the rows that are currently visible.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from gi.repository import GLib, GObject, Gdk, GdkPixbuf
+
+from proton.vpn.app.gtk import Gtk
+from proton.vpn.app.gtk.assets import icons
+from proton.vpn.app.gtk.controller import Controller
+from proton.vpn.app.gtk.widgets.vpn.serverlist.country import analyze_servers
+from proton.vpn.app.gtk.widgets.vpn.serverlist.serverlist import \
+    free_countries_first_sorting_key
+from proton.vpn.connection.enum import ConnectionStateEnum
+from proton.vpn.session.servers import Country, LogicalServer, ServerList, ServerFeatureEnum
+from proton.vpn import logging
+
+logger = logging.getLogger(__name__)
+
+UPGRADE_URL = "https://account.protonvpn.com/"
+
+# Column indexes in the tree model for the VirtualizedServerListWidget.
+COLUMN_ENTRY = 0  # The Country or LogicalServer displayed in the row.
+COLUMN_NAME = 1  # The country/server name.
+COLUMN_NAME_SENSITIVE = 2  # False when the country/server is under maintenance.
+COLUMN_LOAD = 3  # The server load (empty for countries).
+COLUMN_LOAD_COLOR = 4  # The color used to display the server load.
+COLUMN_SMART_ROUTING_ICON = 5
+COLUMN_SECURE_CORE_ICON = 6
+COLUMN_STREAMING_ICON = 7
+COLUMN_P2P_ICON = 8
+COLUMN_TOR_ICON = 9
+COLUMN_MAINTENANCE_ICON = 10
+COLUMN_ACTION = 11  # Label of the row action (Connect, Connected, Upgrade...).
+COLUMN_ACTION_SENSITIVE = 12  # Whether the row action can be triggered.
+COLUMN_TOOLTIP = 13  # Text describing the row, also used for accessibility.
+
+# Labels displayed in the action column.
+ACTION_CONNECT = "Connect"
+ACTION_CONNECTING = "Connecting..."
+ACTION_CONNECTED = "Connected"
+ACTION_UPGRADE = "Upgrade"
+
+# Style classes the load color is looked up from, with their fallbacks.
+LOAD_COLORS = {
+    "signal-danger": "#DC3251",
+    "signal-warning": "#FF9900",
+    "signal-success": "#1EA885",
+}
+
+
+@dataclass
+class VirtualizedServerListWidgetState:
+    """
+    Holds the state of the VirtualizedServerListWidget. This state is reset
+    after login/logout.
+
+    Attributes:
+        user_tier: the tier the user has access to.
+        server_list: list of servers to be displayed.
+        country_iters: tree iters of the country rows indexed by country code.
+        server_iters: tree iters of the server rows that have already been
+            added to the model, indexed by server id.
+        connected_server_id: id of the server the user is connected/connecting to.
+        connection_state: state of the connection to connected_server_id.
+        is_snapshot: flag set to True while the server list being displayed
+            is the snapshot persisted the last time the app ran.
+    """
+    user_tier: int = None
+    server_list: ServerList = None
+    country_iters: Dict[str, Gtk.TreeIter] = field(default_factory=dict)
+    server_iters: Dict[str, Gtk.TreeIter] = field(default_factory=dict)
+    connected_server_id: Optional[str] = None
+    connection_state: ConnectionStateEnum = ConnectionStateEnum.DISCONNECTED
+    is_snapshot: bool = False
+
+    def get_server_by_id(self, server_id: str) -> Optional[LogicalServer]:
+        """Returns the server with the given id."""
+        if self.server_list:
+            return self.server_list.get_by_id(server_id)
+        return None
+
+
+class VirtualizedServerListWidget(Gtk.ScrolledWindow):
+    """
+    Displays the VPN servers list using a Gtk.TreeView.
+
+    Country rows are top-level rows in the model, and their server rows are
+    only added to the model the first time the country is expanded. Since
+    Gtk.TreeView only renders the rows in the visible area, the cost of a
+    server list update does not depend on the number of countries/servers.
+    """
+
+    def __init__(self, controller: Controller):
+        super().__init__()
+        self.set_policy(
+            hscrollbar_policy=Gtk.PolicyType.NEVER,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC
+        )
+        self._controller = controller
+        self._state = VirtualizedServerListWidgetState()
+        self._icons = _load_icons()
+
+        self._tree_view = Gtk.TreeView(model=self._new_model())
+        self._tree_view.set_headers_visible(False)
+        self._tree_view.set_enable_search(False)
+        self._tree_view.set_activate_on_single_click(True)
+        self._tree_view.set_tooltip_column(COLUMN_TOOLTIP)
+        self._tree_view.set_margin_end(15)  # Leave space for the scroll bar.
+        self._tree_view.get_selection().set_mode(Gtk.SelectionMode.NONE)
+        self._tree_view.connect("test-expand-row", self._on_test_expand_row)
+        self._tree_view.connect("row-activated", self._on_row_activated)
+        self._action_column = None
+        self._add_columns()
+        self.add(self._tree_view)
+
+        self.connect("unrealize", self._on_unrealize)
+
+    def _on_unrealize(self, _widget):
+        self.unload()
+
+    @GObject.Signal(name="filter-complete")
+    def filter_complete(self):
+        """Signal emitted after the UI finalized filtering the UI."""
+
+    @GObject.Signal(name="ui-updated")
+    def ui_updated(self):
+        """Signal emitted once the server list within the UI has been updated.
+        Mainly used for test purposes."""
+
+    @staticmethod
+    def _new_model() -> Gtk.TreeStore:
+        return Gtk.TreeStore(
+            object,  # COLUMN_ENTRY
+            str,  # COLUMN_NAME
+            bool,  # COLUMN_NAME_SENSITIVE
+            str,  # COLUMN_LOAD
+            str,  # COLUMN_LOAD_COLOR
+            GdkPixbuf.Pixbuf,  # COLUMN_SMART_ROUTING_ICON
+            GdkPixbuf.Pixbuf,  # COLUMN_SECURE_CORE_ICON
+            GdkPixbuf.Pixbuf,  # COLUMN_STREAMING_ICON
+            GdkPixbuf.Pixbuf,  # COLUMN_P2P_ICON
+            GdkPixbuf.Pixbuf,  # COLUMN_TOR_ICON
+            GdkPixbuf.Pixbuf,  # COLUMN_MAINTENANCE_ICON
+            str,  # COLUMN_ACTION
+            bool,  # COLUMN_ACTION_SENSITIVE
+            str,  # COLUMN_TOOLTIP
+        )
+
+    def _add_columns(self):
+        name_column = Gtk.TreeViewColumn(
+            "Name", cell_renderer=Gtk.CellRendererText(),
+            text=COLUMN_NAME, sensitive=COLUMN_NAME_SENSITIVE
+        )
+        name_column.set_expand(True)
+        self._tree_view.append_column(name_column)
+
+        features_column = Gtk.TreeViewColumn("Features")
+        for icon_column in (
+                COLUMN_SMART_ROUTING_ICON, COLUMN_SECURE_CORE_ICON, COLUMN_STREAMING_ICON,
+                COLUMN_P2P_ICON, COLUMN_TOR_ICON, COLUMN_MAINTENANCE_ICON
+        ):
+            renderer = Gtk.CellRendererPixbuf()
+            features_column.pack_start(renderer, expand=False)
+            features_column.add_attribute(renderer, "pixbuf", icon_column)
+        self._tree_view.append_column(features_column)
+
+        load_column = Gtk.TreeViewColumn(
+            "Load", cell_renderer=Gtk.CellRendererText(),
+            text=COLUMN_LOAD, foreground=COLUMN_LOAD_COLOR
+        )
+        self._tree_view.append_column(load_column)
+
+        self._action_column = Gtk.TreeViewColumn(
+            "Action", cell_renderer=Gtk.CellRendererText(),
+            text=COLUMN_ACTION, sensitive=COLUMN_ACTION_SENSITIVE
+        )
+        self._tree_view.append_column(self._action_column)
+
+    @property
+    def model(self) -> Gtk.TreeStore:
+        """Returns the tree model backing the list.
+        This method was made available for tests."""
+        return self._tree_view.get_model()
+
+    @property
+    def tree_view(self) -> Gtk.TreeView:
+        """Returns the tree view displaying the list.
+        This method was made available for tests."""
+        return self._tree_view
+
+    @property
+    def country_names(self) -> List[str]:
+        """Returns the names of the countries currently being displayed.
+        This method was made available for tests."""
+        return [row[COLUMN_NAME] for row in self.model]
+
+    def display_snapshot(self, user_tier: int, server_list: ServerList):
+        """
+        Displays the server list persisted the last time the app ran, while
+        the up-to-date one is being retrieved. Rows are not actionable until
+        `display` is called.
+        """
+        self._set_state(user_tier, server_list, is_snapshot=True)
+        self._build_model()
+        self._tree_view.set_sensitive(False)
+
+    def display(self, user_tier: int, server_list: ServerList):
+        """Update UI with the new server list."""
+        self._set_state(user_tier, server_list)
+        self._build_model()
+        self._tree_view.set_sensitive(True)
+        self._controller.set_server_list_updated_callback(self._on_server_list_update)
+        self._controller.set_server_loads_updated_callback(self._on_server_loads_update)
+
+    def _set_state(self, user_tier: int, server_list: ServerList, is_snapshot: bool = False):
+        self._state = VirtualizedServerListWidgetState(
+            server_list=server_list,
+            user_tier=user_tier,
+            is_snapshot=is_snapshot
+        )
+        if self._controller.is_connection_active:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            self._state.connected_server_id = self._controller.current_server_id
+            self._state.connection_state = ConnectionStateEnum.CONNECTED
+
+    def unload(self):
+        """Things to do before the widget is being removed from the window."""
+        self._controller.unset_server_list_updated_callback()
+        self._controller.unset_server_loads_updated_callback()
+
+    def connection_status_update(self, connection_status):
+        """This method is called by VPNWidget whenever the VPN connection status changes."""
+        connection = connection_status.context.connection
+        if connection:
+            self._update_connection_state(connection.server_id, connection_status.type)
+
+    def focus_on_entry(self, _widget, name_to_search: str) -> None:
+        """Searches for an entry by name and either connects to it directly,
+           or focuses on it."""
+        # Server
+        if "#" in name_to_search:
+            future = self._controller.connect_to_server(name_to_search)
+            future.add_done_callback(lambda f: GLib.idle_add(f.result))
+            return
+
+        # Country
+        for country_iter in self._state.country_iters.values():
+            country = self.model.get_value(country_iter, COLUMN_ENTRY)
+            if country.name.lower() == name_to_search.lower():
+                path = self.model.get_path(country_iter)
+                self._tree_view.expand_row(path, open_all=False)
+                self._tree_view.scroll_to_cell(path, None, True, 0, 0)
+                self._tree_view.set_cursor(path, None, False)
+                self._tree_view.grab_focus()
+                return
+
+    def _on_server_list_update(self):
+        """Whenever a new server list is received the UI should be updated."""
+        start = time.time()
+        self._state.server_list = self._controller.server_list
+        self._build_model()
+        logger.info(
+            "Full virtualized server list widget update completed in "
+            f"{time.time() - start:.2f} seconds."
+        )
+
+    def _on_server_loads_update(self):
+        start = time.time()
+        model = self.model
+
+        for server_iter in self._state.server_iters.values():
+            server = model.get_value(server_iter, COLUMN_ENTRY)
+            self._set_server_row_values(model, server_iter, server)
+
+        for country_iter in self._state.country_iters.values():
+            country = model.get_value(country_iter, COLUMN_ENTRY)
+            self._set_country_row_values(model, country_iter, country)
+
+        logger.info(
+            "Partial virtualized server list widget update completed in "
+            f"{time.time() - start:.2f} seconds."
+        )
+
+    def _build_model(self):
+        """
+        Builds a new model for the current server list. The model is
+        filled while detached from the view to avoid per-row signal emissions.
+        """
+        expanded_country_codes = {
+            country_code for country_code, country_iter in self._state.country_iters.items()
+            if self._tree_view.row_expanded(self.model.get_path(country_iter))
+        }
+
+        countries = self._state.server_list.group_by_country()
+        if self._state.user_tier == 0:
+            # If the current user has a free account, sort the countries having
+            # free servers first.
+            countries.sort(key=free_countries_first_sorting_key)
+
+        model = self._new_model()
+        self._state.country_iters = {}
+        self._state.server_iters = {}
+        for country in countries:
+            country_iter = model.append(None)
+            self._set_country_row_values(model, country_iter, country)
+            # Placeholder row so that the country can be expanded. The actual
+            # server rows are only added once the country is expanded.
+            model.append(country_iter)
+            self._state.country_iters[country.code.lower()] = country_iter
+
+        self._tree_view.set_model(model)
+
+        for country_code in expanded_country_codes:
+            country_iter = self._state.country_iters.get(country_code)
+            if country_iter:
+                self._tree_view.expand_row(model.get_path(country_iter), open_all=False)
+
+        self.emit("ui-updated")
+
+    def _order_servers(self, servers: List[LogicalServer]) -> List[LogicalServer]:
+        """Servers in the user tier are shown first."""
+        free_servers = [server for server in servers if server.tier == 0]
+        plus_servers = [server for server in servers if server.tier != 0]
+        if self._state.user_tier == 0:
+            return free_servers + plus_servers
+        return plus_servers + free_servers
+
+    def _on_test_expand_row(self, tree_view: Gtk.TreeView, country_iter: Gtk.TreeIter, _path):
+        """Adds the server rows to the country before expanding it, if required."""
+        model = tree_view.get_model()
+        first_child = model.iter_children(country_iter)
+        if first_child is None or model.get_value(first_child, COLUMN_ENTRY) is not None:
+            return False  # Server rows were already added.
+
+        country = model.get_value(country_iter, COLUMN_ENTRY)
+        for server in self._order_servers(country.servers):
+            server_iter = model.append(country_iter)
+            self._set_server_row_values(model, server_iter, server)
+            self._state.server_iters[server.id] = server_iter
+
+        model.remove(first_child)
+        return False  # Allow the row to be expanded.
+
+    def _on_row_activated(
+            self, tree_view: Gtk.TreeView, path: Gtk.TreePath, column: Gtk.TreeViewColumn
+    ):
+        model = tree_view.get_model()
+        entry = model.get_value(model.get_iter(path), COLUMN_ENTRY)
+        if entry is None:
+            return
+
+        if column is self._action_column:
+            self._on_action_activated(model, path, entry)
+        elif isinstance(entry, Country):
+            if tree_view.row_expanded(path):
+                tree_view.collapse_row(path)
+            else:
+                tree_view.expand_row(path, open_all=False)
+
+    def _on_action_activated(
+            self, model: Gtk.TreeStore, path: Gtk.TreePath,
+            entry: Union[Country, LogicalServer]
+    ):
+        tree_iter = model.get_iter(path)
+        if not model.get_value(tree_iter, COLUMN_ACTION_SENSITIVE):
+            return
+
+        if model.get_value(tree_iter, COLUMN_ACTION) == ACTION_UPGRADE:
+            Gtk.show_uri_on_window(None, UPGRADE_URL, Gdk.CURRENT_TIME)
+            return
+
+        if isinstance(entry, Country):
+            future = self._controller.connect_to_country(entry.code)
+        else:
+            future = self._controller.connect_to_server(entry.name)
+        future.add_done_callback(lambda f: GLib.idle_add(f.result))  # bubble up exceptions if any.
+
+    def _update_connection_state(self, server_id: str, connection_state: ConnectionStateEnum):
+        previous_server = self._state.get_server_by_id(self._state.connected_server_id)
+        self._state.connected_server_id = server_id
+        self._state.connection_state = connection_state
+        if previous_server and previous_server.id != server_id:
+            self._refresh_server_and_country_rows(previous_server)
+
+        server = self._state.get_server_by_id(server_id)
+        if server:
+            self._refresh_server_and_country_rows(server)
+
+    def _refresh_server_and_country_rows(self, server: LogicalServer):
+        model = self.model
+        server_iter = self._state.server_iters.get(server.id)
+        if server_iter:
+            self._set_server_row_values(model, server_iter, server)
+        country_iter = self._state.country_iters.get(server.exit_country.lower())
+        if country_iter:
+            country = model.get_value(country_iter, COLUMN_ENTRY)
+            self._set_country_row_values(model, country_iter, country)
+
+    def _get_action_values(
+            self, upgrade_required: bool, under_maintenance: bool, connected: bool
+    ) -> (str, bool):
+        if upgrade_required:
+            return ACTION_UPGRADE, True
+        if under_maintenance:
+            return "", False
+        if not connected:
+            return ACTION_CONNECT, True
+
+        if self._state.connection_state == ConnectionStateEnum.CONNECTING:
+            return ACTION_CONNECTING, False
+        if self._state.connection_state == ConnectionStateEnum.CONNECTED:
+            return ACTION_CONNECTED, False
+        return ACTION_CONNECT, True
+
+    def _set_country_row_values(
+            self, model: Gtk.TreeStore, country_iter: Gtk.TreeIter, country: Country
+    ):
+        analysis = analyze_servers(country.servers, self._state.connected_server_id)
+        upgrade_required = self._state.user_tier == 0 and not analysis.is_free_country
+        action, action_sensitive = self._get_action_values(
+            upgrade_required, analysis.under_maintenance,
+            connected=analysis.country_connection_state == ConnectionStateEnum.CONNECTED
+        )
+        details_visible = not analysis.under_maintenance
+        features = analysis.country_features
+        tooltip = (
+            f"{country.name} is under maintenance" if analysis.under_maintenance
+            else country.name
+        )
+        model.set(country_iter, {
+            COLUMN_ENTRY: country,
+            COLUMN_NAME: country.name,
+            COLUMN_NAME_SENSITIVE: not analysis.under_maintenance,
+            COLUMN_LOAD: "",
+            COLUMN_LOAD_COLOR: None,
+            COLUMN_SMART_ROUTING_ICON: self._icon(
+                "smart-routing", details_visible and analysis.smart_routing_country
+            ),
+            COLUMN_SECURE_CORE_ICON: None,
+            COLUMN_STREAMING_ICON: None,
+            COLUMN_P2P_ICON: self._icon(
+                "p2p", details_visible and ServerFeatureEnum.P2P in features
+            ),
+            COLUMN_TOR_ICON: self._icon(
+                "tor", details_visible and ServerFeatureEnum.TOR in features
+            ),
+            COLUMN_MAINTENANCE_ICON: self._icon("maintenance", analysis.under_maintenance),
+            COLUMN_ACTION: action,
+            COLUMN_ACTION_SENSITIVE: action_sensitive,
+            COLUMN_TOOLTIP: tooltip,
+        })
+
+    def _set_server_row_values(
+            self, model: Gtk.TreeStore, server_iter: Gtk.TreeIter, server: LogicalServer
+    ):
+        under_maintenance = not server.enabled
+        upgrade_required = server.tier > self._state.user_tier
+        action, action_sensitive = self._get_action_values(
+            upgrade_required, under_maintenance,
+            connected=server.id == self._state.connected_server_id
+        )
+        details_visible = not under_maintenance
+        secure_core = ServerFeatureEnum.SECURE_CORE in server.features
+        other_icons_visible = details_visible and not secure_core
+        if under_maintenance:
+            tooltip = f"{server.name} is under maintenance"
+        else:
+            tooltip = f"Server load is at {server.load}%"
+
+        model.set(server_iter, {
+            COLUMN_ENTRY: server,
+            COLUMN_NAME: server.name,
+            COLUMN_NAME_SENSITIVE: not under_maintenance,
+            COLUMN_LOAD: f"{server.load}%" if details_visible else "",
+            COLUMN_LOAD_COLOR: self._get_load_color(server.load),
+            COLUMN_SMART_ROUTING_ICON: self._icon(
+                "smart-routing", other_icons_visible and server.host_country is not None
+            ),
+            COLUMN_SECURE_CORE_ICON: self._icon("secure-core", details_visible and secure_core),
+            COLUMN_STREAMING_ICON: self._icon(
+                "streaming", other_icons_visible and server.tier > 0
+            ),
+            COLUMN_P2P_ICON: self._icon(
+                "p2p", other_icons_visible and ServerFeatureEnum.P2P in server.features
+            ),
+            COLUMN_TOR_ICON: self._icon(
+                "tor", other_icons_visible and ServerFeatureEnum.TOR in server.features
+            ),
+            COLUMN_MAINTENANCE_ICON: self._icon("maintenance", under_maintenance),
+            COLUMN_ACTION: action,
+            COLUMN_ACTION_SENSITIVE: action_sensitive,
+            COLUMN_TOOLTIP: tooltip,
+        })
+
+    def _icon(self, name: str, visible: bool):
+        return self._icons[name] if visible else None
+
+    def _get_load_color(self, load: int) -> str:
+        if load > 90:
+            style_class = "signal-danger"
+        elif load > 75:
+            style_class = "signal-warning"
+        else:
+            style_class = "signal-success"
+
+        found, color = self.get_style_context().lookup_color(style_class)
+        return color.to_string() if found else LOAD_COLORS[style_class]
+
+
+def _load_icons() -> Dict[str, GdkPixbuf.Pixbuf]:
+    """Returns the (cached) icons displayed in the list."""
+    return {
+        "maintenance": icons.get(Path("maintenance-icon.svg")),
+        "smart-routing": icons.get(Path("servers/smart-routing.svg")),
+        "secure-core": icons.get(Path("servers/secure-core.svg")),
+        "streaming": icons.get(Path("servers/streaming.svg")),
+        "p2p": icons.get(Path("servers/p2p.svg")),
+        "tor": icons.get(Path("servers/tor.svg")),
+    }
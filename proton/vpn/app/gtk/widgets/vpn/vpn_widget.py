@@ -25,15 +25,18 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 import time
 
-from gi.repository import GObject, GLib
+from gi.repository import GLib, GObject
 
 from proton.vpn import logging
 
 from proton.vpn.connection.states import State
 from proton.vpn.app.gtk.controller import Controller
+from proton.vpn.app.gtk.utils.startup_tracer import startup_tracer
 from proton.vpn.app.gtk import Gtk
 from proton.vpn.app.gtk.widgets.vpn.quick_connect_widget import QuickConnectWidget
 from proton.vpn.app.gtk.widgets.vpn.serverlist.serverlist import ServerListWidget
+from proton.vpn.app.gtk.widgets.vpn.serverlist.virtualized import \
+    VirtualizedServerListWidget
 from proton.vpn.app.gtk.widgets.vpn.search_results import SearchResults
 from proton.vpn.app.gtk.widgets.vpn.search_entry import SearchEntry
 from proton.vpn.app.gtk.widgets.vpn.connection_status_widget import VPNConnectionStatusWidget
@@ -59,10 +62,13 @@ class VPNWidgetState:
         is_widget_ready: flag set to True once the widget has been initialized.
         user_tier: tier of the logged-in user.
         load_start_time: timestamp set when the widget starts loading.
+        is_displaying_snapshot: flag set to True while the server list
+            persisted the last time the app ran is being displayed.
     """
     is_widget_ready: bool = False
     user_tier: int = None
     load_start_time: int = None
+    is_displaying_snapshot: bool = False
 
 
 # pylint: disable=too-many-instance-attributes
@@ -91,7 +97,10 @@ class VPNWidget(Gtk.Box):
         self.pack_start(self.quick_connect_widget, expand=False, fill=False,
                         padding=0)
 
-        self.server_list_widget = ServerListWidget(self._controller)
+        if self._controller.get_app_configuration().virtualized_server_list:
+            self.server_list_widget = VirtualizedServerListWidget(self._controller)
+        else:
+            self.server_list_widget = ServerListWidget(self._controller)
         self.pack_end(self.server_list_widget, expand=True, fill=True, padding=0)
         self.server_list_widget.connect("ui-updated",
                                         self._on_server_list_updated)
@@ -102,7 +111,9 @@ class VPNWidget(Gtk.Box):
             target_signal="request_focus",
             shortcut="<Control>f"
         )
-        self.search_results_widget = SearchResults(self._controller)
+        self.search_results_widget = SearchResults(
+            self._controller, executor=self._controller.executor
+        )
         revealer = Gtk.Revealer()
         revealer.add(self.search_results_widget)
 
@@ -138,6 +149,13 @@ class VPNWidget(Gtk.Box):
     def vpn_widget_ready(self):
         """Signal emitted when all resources were loaded and widget is ready."""
 
+    @GObject.Signal
+    def snapshot_displayed(self):
+        """
+        Signal emitted when the server list persisted the last time the app
+        ran is displayed, while the widget is still loading.
+        """
+
     @property
     def user_tier(self) -> int:
         """Returns the tier of the user currently logged in."""
@@ -147,22 +165,23 @@ class VPNWidget(Gtk.Box):
         self.unload()
 
     def status_update(self, connection_state: State):
-        """This method is called whenever the VPN connection status changes."""
+        """
+        This method is called from the main thread whenever the VPN
+        connection status changes.
+        """
         logger.debug(
             f"VPN widget received connection status update: "
             f"{type(connection_state).__name__}."
         )
 
-        def update_widget():
-            for widget in self.connection_status_subscribers:
-                widget.connection_status_update(connection_state)
-
-        GLib.idle_add(update_widget)
+        for widget in self.connection_status_subscribers:
+            widget.connection_status_update(connection_state)
 
     def _on_refresher_enabled(
             self,
             future: Future
     ):
+        startup_tracer.end("enable_refresher")
         future.result()
         self.display(self._controller.user_tier, self._controller.server_list)
 
@@ -175,11 +194,44 @@ class VPNWidget(Gtk.Box):
         data has been downloaded, the widget will be automatically displayed.
         """
         self._state.load_start_time = time.time()
+        startup_tracer.begin("enable_refresher")
         self._controller.enable_refresher(self._on_refresher_enabled)
+        self._controller.load_server_list_snapshot(self._on_server_list_snapshot_loaded)
+
+    def _on_server_list_snapshot_loaded(self, future: Future):
+        snapshot = future.result()
+        if snapshot is None or self._state.is_widget_ready:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            # The up-to-date server list may already be displayed.
+            return
+
+        self.display_snapshot(snapshot.user_tier, snapshot.server_list)
+
+    def display_snapshot(self, user_tier: int, server_list: ServerList):
+        """
+        Displays the server list persisted the last time the app ran, so that
+        the user can see the app while the data from API is being acquired.
+        Servers can't be connected to until the widget is displayed.
+        """
+        self._state.is_displaying_snapshot = True
+        self._set_actionable(False)
+        self.show_all()
+
+        with startup_tracer.phase("build_server_list_snapshot"):
+            self.server_list_widget.display_snapshot(
+                user_tier=user_tier, server_list=server_list
+            )
+        self.emit("snapshot-displayed")
+        logger.info(
+            f"Server list snapshot displayed "
+            f"(load time: {time.time()-self._state.load_start_time:.2f} seconds)",
+            category="app", subcategory="vpn", event="snapshot_displayed"
+        )
 
     def display(self, user_tier: int, server_list: ServerList):
         """Displays the widget once all necessary data from API has been acquired."""
         self._state.user_tier = user_tier
+        self._state.is_displaying_snapshot = False
+        self._set_actionable(True)
 
         self.show_all()
 
@@ -188,14 +240,26 @@ class VPNWidget(Gtk.Box):
         self._controller.register_connection_status_subscriber(self)
         self._controller.reconnector.enable()
 
-        self.server_list_widget.display(user_tier=user_tier, server_list=server_list)
+        with startup_tracer.phase("build_server_list"):
+            self.server_list_widget.display(user_tier=user_tier, server_list=server_list)
+
+        future = self._controller.save_server_list_snapshot(user_tier, server_list)
+        future.add_done_callback(lambda f: GLib.idle_add(f.result))
+
+    def _set_actionable(self, actionable: bool):
+        for widget in [self.quick_connect_widget, self.search_widget]:
+            widget.set_sensitive(actionable)
 
     def _on_server_list_updated(self, *_):
+        if self._state.is_displaying_snapshot:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
+            return
+
         if not self._state.is_widget_ready:  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
             # Only update the status at this point as widgets are already generated
             self.status_update(self._controller.current_connection_status)
             self._state.is_widget_ready = True  # noqa: E501 # pylint: disable=line-too-long # nosemgrep: python.lang.maintainability.is-function-without-parentheses.is-function-without-parentheses
             self.emit("vpn-widget-ready")
+            startup_tracer.finish("vpn_widget_ready")
             logger.info(
                 f"VPN widget is ready "
                 f"(load time: {time.time()-self._state.load_start_time:.2f} seconds)",
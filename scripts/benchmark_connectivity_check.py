@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Measures the cost of a single network connectivity check, comparing the
+in-process route lookup with spawning `ip route get`.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import subprocess  # nosec B404 # nosemgrep: gitlab.bandit.B404
+import timeit
+
+from proton.vpn.app.gtk.services.reconnector.network_monitor import (
+    TEST_IPV4_ADDRESS, check_for_network_connectivity, check_for_route_in_route_tables,
+    has_policy_routing_rules
+)
+
+
+def check_with_subprocess() -> bool:
+    """Connectivity check as it was done before the in-process route lookup."""
+    result = subprocess.run(                                                      # nosec B603, B607
+        ["ip", "route", "get", TEST_IPV4_ADDRESS], check=False, capture_output=True)  # nosec B607
+    return result.returncode == 0
+
+
+def benchmark(name: str, function, iterations: int):
+    """Prints the average time per call of the function."""
+    total_seconds = timeit.timeit(function, number=iterations)
+    print(f"{name}: {total_seconds / iterations * 1_000_000:.1f} µs/check ({function()})")
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    policy_routing = has_policy_routing_rules()
+    route_tables_readable = check_for_route_in_route_tables() is not None
+    if policy_routing is None:
+        path = "ip route get (routing rules could not be retrieved)"
+    elif policy_routing:
+        path = "ip route get (there are policy routing rules)"
+    elif not route_tables_readable:
+        path = "ip route get (routing tables are not readable)"
+    else:
+        path = "route table lookup"
+    print(f"Path used by the connectivity check on this host: {path}.")
+
+    benchmark("ip route get (before)", check_with_subprocess, args.iterations)
+    benchmark("routing rules dump", has_policy_routing_rules, args.iterations)
+    if route_tables_readable:
+        benchmark("route table lookup", check_for_route_in_route_tables, args.iterations)
+    benchmark(
+        f"connectivity check (after, {path})", check_for_network_connectivity, args.iterations
+    )
+
+
+if __name__ == "__main__":
+    main()
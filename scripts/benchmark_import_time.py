@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Measures the time it takes to import the app modules loaded before the
+first window is shown, using a new interpreter for each run.
+
+
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import re
+import statistics
+import subprocess  # nosec B404 # nosemgrep: gitlab.bandit.B404
+import sys
+from collections import defaultdict
+from typing import Dict
+
+# Entry point of the app, which imports all the modules loaded before the
+# app is constructed.
+MODULE = "proton.vpn.app.gtk.__main__"
+
+# Line format of the -X importtime output:
+# "import time: self [us] | cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Imports the module in a new interpreter and returns the cumulative
+    import time (in microseconds) of each of the modules imported.
+    """
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True, capture_output=True, text=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(3)] = int(match.group(2))
+    return times
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15,
+                        help="number of slowest modules to show")
+    args = parser.parse_args()
+
+    runs = defaultdict(list)
+    for _ in range(args.runs):
+        for module, cumulative_us in import_times(args.module).items():
+            runs[module].append(cumulative_us)
+
+    total = runs[args.module]
+    print(
+        f"{args.module}: median {statistics.median(total) / 1000:.1f} ms, "
+        f"min {min(total) / 1000:.1f} ms over {args.runs} runs"
+    )
+    print("\nSlowest modules (median cumulative import time):")
+    medians = sorted(
+        ((statistics.median(times), module) for module, times in runs.items()
+         if module != args.module),
+        reverse=True
+    )
+    for median_us, module in medians[:args.top]:
+        print(f"{median_us / 1000:9.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+import pytest
+
+from proton.vpn.app.gtk.services.reconnector.backoff import BackoffPolicy, Jitter
+
+
+def simulate_time_to_recovery_ms(policy: BackoffPolicy, outages_ms):
+    """
+    Simulates the reconnection attempts after a VPN drop at t = 0 while
+    the network is down during the specified outages, and returns the time
+    at which the first attempt happened while the network was up.
+
+    :param outages_ms: list of (start, end) periods in which the network is down.
+    """
+    policy.reset()
+    time_ms = 0
+    for attempt in range(1000):
+        time_ms += policy.next_delay_ms(attempt)
+        if not any(start <= time_ms < end for start, end in outages_ms):
+            return time_ms
+
+    raise AssertionError("Connection was never restored.")
+
+
+OUTAGE_PATTERNS = {
+    "short outage": [(0, 5_000)],
+    "long outage": [(0, 40 * 60_000)],
+    "flapping network": [(0, 60_000), (70_000, 10 * 60_000)],
+}
+
+
+@pytest.mark.parametrize("outage_pattern", OUTAGE_PATTERNS.keys())
+@pytest.mark.parametrize("jitter", list(Jitter))
+def test_time_to_recovery_after_outage_is_bounded_by_max_delay(outage_pattern, jitter):
+    max_delay_ms = 60_000
+    outages_ms = OUTAGE_PATTERNS[outage_pattern]
+    policy = BackoffPolicy(max_delay_ms=max_delay_ms, jitter=jitter, rng=random.Random(42))
+
+    time_to_recovery_ms = simulate_time_to_recovery_ms(policy, outages_ms)
+
+    outage_end_ms = outages_ms[-1][1]
+    assert time_to_recovery_ms - outage_end_ms <= max_delay_ms
+
+
+def test_uncapped_backoff_recovers_much_later_than_capped_backoff_after_long_outage():
+    outages_ms = OUTAGE_PATTERNS["long outage"]
+    uncapped_policy = BackoffPolicy(max_delay_ms=None, jitter=Jitter.NONE)
+    capped_policy = BackoffPolicy(max_delay_ms=60_000, jitter=Jitter.NONE)
+
+    uncapped_time_to_recovery_ms = simulate_time_to_recovery_ms(uncapped_policy, outages_ms)
+    capped_time_to_recovery_ms = simulate_time_to_recovery_ms(capped_policy, outages_ms)
+
+    # The uncapped policy only retries ~68 minutes after the drop, 28 minutes
+    # after the network came back, while the capped one retries every minute.
+    assert uncapped_time_to_recovery_ms == (2 ** 12 - 1) * 1000
+    assert capped_time_to_recovery_ms <= outages_ms[0][1] + 60_000
+
+
+def test_delays_grow_exponentially_without_jitter():
+    policy = BackoffPolicy(base_delay_ms=1000, max_delay_ms=5000, jitter=Jitter.NONE)
+
+    assert [policy.next_delay_ms(attempt) for attempt in range(5)] == [
+        1000, 2000, 4000, 5000, 5000
+    ]
+
+
+@pytest.mark.parametrize("jitter, min_ratio, max_ratio", [
+    (Jitter.PROPORTIONAL, 0.9, 1.1),
+    (Jitter.FULL, 0, 1),
+])
+def test_jittered_delays_are_within_expected_bounds(jitter, min_ratio, max_ratio):
+    policy = BackoffPolicy(base_delay_ms=1000, max_delay_ms=None, jitter=jitter, rng=random.Random(1))
+
+    for attempt in range(10):
+        delay_ms = policy.next_delay_ms(attempt)
+        assert min_ratio * 2 ** attempt * 1000 <= delay_ms <= max_ratio * 2 ** attempt * 1000
+
+
+def test_decorrelated_jitter_starts_again_from_base_delay_after_reset():
+    policy = BackoffPolicy(
+        base_delay_ms=1000, max_delay_ms=60_000, jitter=Jitter.DECORRELATED, rng=random.Random(7)
+    )
+    delays_ms = [policy.next_delay_ms(attempt) for attempt in range(20)]
+    assert all(1000 <= delay_ms <= 60_000 for delay_ms in delays_ms)
+
+    policy.reset()
+
+    assert policy.next_delay_ms(0) <= 3000
+
+
+def test_delay_does_not_overflow_after_many_attempts():
+    policy = BackoffPolicy(multiplier=2.0, max_delay_ms=60_000, jitter=Jitter.NONE)
+
+    assert policy.next_delay_ms(5000) == 60_000
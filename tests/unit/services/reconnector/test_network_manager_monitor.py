@@ -0,0 +1,160 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from unittest.mock import Mock
+
+from proton.vpn.app.gtk.services.reconnector.network_manager_monitor import (
+    NetworkManagerMonitor, NETWORK_MANAGER_INTERFACE, PROPERTIES_INTERFACE,
+    NM_STATE_CONNECTED_GLOBAL, NM_CONNECTIVITY_FULL
+)
+
+NM_STATE_CONNECTING = 40
+NM_STATE_CONNECTED_SITE = 60
+NM_CONNECTIVITY_PORTAL = 2
+NM_CONNECTIVITY_LIMITED = 3
+
+
+class FakeNetworkManagerBus:
+    """
+    Fake system bus exposing the NetworkManager service.
+
+    It's used instead of a NetworkManager service exported on a private
+    D-Bus daemon, so that the tests don't depend on dbus-daemon being
+    available nor on timing of the message delivery.
+    """
+    def __init__(self, properties: dict):
+        self.properties = properties
+        self.signal_handlers = {}
+
+    def add_signal_receiver(self, handler_function, signal_name, dbus_interface, **_kwargs):
+        self.signal_handlers[(dbus_interface, signal_name)] = handler_function
+        signal_receiver = Mock()
+        signal_receiver.remove.side_effect = lambda: self.signal_handlers.pop(
+            (dbus_interface, signal_name)
+        )
+        return signal_receiver
+
+    def get_object(self, _bus_name, _object_path, introspect=True):
+        assert not introspect, "Introspection is a blocking call."
+        return self
+
+    def GetAll(self, interface_name, dbus_interface, reply_handler, error_handler):  # pylint: disable=invalid-name
+        assert dbus_interface == PROPERTIES_INTERFACE
+        assert interface_name == NETWORK_MANAGER_INTERFACE
+        reply_handler(self.properties)
+
+    def emit_state_changed(self, state: int):
+        self.properties["State"] = state
+        self.signal_handlers[(NETWORK_MANAGER_INTERFACE, "StateChanged")](state)
+
+    def emit_properties_changed(self, changed_properties: dict):
+        self.properties.update(changed_properties)
+        self.signal_handlers[(PROPERTIES_INTERFACE, "PropertiesChanged")](
+            NETWORK_MANAGER_INTERFACE, changed_properties, []
+        )
+
+
+def test_enable_reads_initial_network_manager_state():
+    bus = FakeNetworkManagerBus({"State": NM_STATE_CONNECTED_GLOBAL, "Connectivity": NM_CONNECTIVITY_FULL})
+    monitor = NetworkManagerMonitor(bus)
+    monitor.network_up_callback = Mock()
+
+    monitor.enable()
+
+    assert monitor.is_enabled
+    assert monitor.is_network_up
+    monitor.network_up_callback.assert_called_once()
+
+
+def test_network_up_callback_is_called_as_soon_as_network_manager_reports_full_connectivity():
+    bus = FakeNetworkManagerBus({"State": NM_STATE_CONNECTED_SITE, "Connectivity": NM_CONNECTIVITY_LIMITED})
+    monitor = NetworkManagerMonitor(bus)
+    monitor.network_up_callback = Mock()
+    monitor.enable()
+
+    assert not monitor.is_network_up
+    monitor.network_up_callback.assert_not_called()
+
+    bus.emit_properties_changed({
+        "State": NM_STATE_CONNECTED_GLOBAL, "Connectivity": NM_CONNECTIVITY_FULL
+    })
+
+    assert monitor.is_network_up
+    monitor.network_up_callback.assert_called_once()
+
+
+def test_network_up_callback_is_called_again_after_roaming():
+    bus = FakeNetworkManagerBus({"State": NM_STATE_CONNECTED_GLOBAL, "Connectivity": 0})
+    monitor = NetworkManagerMonitor(bus)
+    monitor.network_up_callback = Mock()
+    monitor.enable()
+    monitor.network_up_callback.reset_mock()
+
+    for state, network_up_callback_should_be_called in [
+        (NM_STATE_CONNECTING, False),        # Roaming to another access point.
+        (NM_STATE_CONNECTED_GLOBAL, True),   # Connected again.
+        (NM_STATE_CONNECTED_GLOBAL, False),  # Still connected.
+    ]:
+        bus.emit_state_changed(state)
+
+        assert monitor.network_up_callback.called == network_up_callback_should_be_called
+        monitor.network_up_callback.reset_mock()
+
+
+def test_network_up_callback_is_called_after_roaming_when_connectivity_is_not_refreshed():
+    bus = FakeNetworkManagerBus({"State": NM_STATE_CONNECTED_GLOBAL, "Connectivity": NM_CONNECTIVITY_FULL})
+    monitor = NetworkManagerMonitor(bus)
+    monitor.network_up_callback = Mock()
+    monitor.enable()
+    monitor.network_up_callback.reset_mock()
+
+    # Only the state changes, since NetworkManager did not check connectivity again.
+    bus.emit_properties_changed({"State": NM_STATE_CONNECTING})
+
+    assert not monitor.is_network_up
+
+    bus.emit_properties_changed({"State": NM_STATE_CONNECTED_GLOBAL})
+
+    assert monitor.is_network_up
+    monitor.network_up_callback.assert_called_once()
+
+
+def test_network_is_not_up_while_connectivity_is_limited_to_a_captive_portal():
+    bus = FakeNetworkManagerBus({"State": NM_STATE_CONNECTED_GLOBAL, "Connectivity": NM_CONNECTIVITY_PORTAL})
+    monitor = NetworkManagerMonitor(bus)
+    monitor.network_up_callback = Mock()
+    monitor.enable()
+
+    assert not monitor.is_network_up
+
+    bus.emit_properties_changed({"Connectivity": NM_CONNECTIVITY_FULL})
+
+    assert monitor.is_network_up
+    monitor.network_up_callback.assert_called_once()
+
+
+def test_disable_unsubscribes_from_network_manager_signals():
+    bus = FakeNetworkManagerBus({"State": NM_STATE_CONNECTED_GLOBAL})
+    monitor = NetworkManagerMonitor(bus)
+    monitor.enable()
+
+    monitor.disable()
+
+    assert not bus.signal_handlers
+    assert not monitor.is_enabled
+    assert monitor.is_network_up is None
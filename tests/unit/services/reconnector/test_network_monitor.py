@@ -16,10 +16,17 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from unittest.mock import Mock, patch
+import socket
+import struct
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 from gi.repository import GLib
 
-from proton.vpn.app.gtk.services.reconnector.network_monitor import NetworkMonitor
+from proton.vpn.app.gtk.services.reconnector.network_monitor import (
+    NetworkMonitor, NetlinkNetworkMonitor, check_for_network_connectivity,
+    check_for_route_in_route_tables, has_policy_routing_rules
+)
 from tests.unit.testing_utils import run_main_loop, DummyThreadPoolExecutor, process_gtk_events
 
 
@@ -85,3 +92,168 @@ def test_disable_stops_running_network_state_async_periodically():
     assert not monitor.is_enabled
     # Since the monitor was disabled after the second network check, only 2 network checks should have been done.
     assert patched_check_network_state.call_count == 2
+
+
+def test_netlink_network_monitor_checks_network_state_once_per_burst_of_notifications():
+    monitor_socket, kernel_socket = socket.socketpair()
+    monitor_socket.setblocking(False)
+    monitor = NetlinkNetworkMonitor(
+        DummyThreadPoolExecutor(), socket_factory=lambda: monitor_socket,
+        coalesce_interval_ms=10
+    )
+    main_loop = GLib.MainLoop()
+
+    with patch.object(monitor, "check_network_state_async") as patched_check_network_state:
+        monitor.enable()
+        # The network state is checked once when the monitor is enabled.
+        assert patched_check_network_state.call_count == 1
+
+        for _ in range(3):
+            kernel_socket.send(b"route changed")
+        GLib.timeout_add(100, main_loop.quit)
+        run_main_loop(main_loop, timeout_in_ms=1000)
+
+        monitor.disable()
+
+    kernel_socket.close()
+    assert patched_check_network_state.call_count == 2
+    assert not monitor.is_enabled
+
+
+def test_netlink_network_monitor_falls_back_to_polling_when_netlink_socket_cannot_be_opened():
+    monitor = NetlinkNetworkMonitor(
+        DummyThreadPoolExecutor(), polling_interval_ms=10,
+        socket_factory=Mock(side_effect=PermissionError("Operation not permitted"))
+    )
+    main_loop = GLib.MainLoop()
+
+    with patch.object(monitor, "check_network_state_async") as patched_check_network_state:
+        def quit_main_loop_after_2_connectivity_checks():
+            if patched_check_network_state.call_count > 2:
+                main_loop.quit()
+        patched_check_network_state.side_effect = quit_main_loop_after_2_connectivity_checks
+
+        monitor.enable()
+
+        run_main_loop(main_loop, timeout_in_ms=1000)
+        monitor.disable()
+
+    assert patched_check_network_state.call_count > 2
+
+
+IPV4_ROUTE_TABLE_HEADER = (
+    "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n"
+)
+IPV4_DEFAULT_ROUTE = "eth0\t00000000\t010200C0\t0003\t0\t0\t0\t00000000\t0\t0\t0\n"
+IPV4_LOCAL_NETWORK_ROUTE = "eth0\t0000A8C0\t00000000\t0001\t0\t0\t0\t00FFFFFF\t0\t0\t0\n"
+IPV4_REJECT_DEFAULT_ROUTE = "eth0\t00000000\t00000000\t0201\t0\t0\t0\t00000000\t0\t0\t0\n"
+IPV6_DEFAULT_ROUTE = (
+    "00000000000000000000000000000000 00 00000000000000000000000000000000 00 "
+    "fe800000000000000000000000000001 00000400 00000001 00000000 00000003     eth0\n"
+)
+IPV6_LOOPBACK_REJECT_ROUTE = (
+    "00000000000000000000000000000000 00 00000000000000000000000000000000 00 "
+    "00000000000000000000000000000000 ffffffff 00000001 00000000 00200200       lo\n"
+)
+
+
+@pytest.mark.parametrize("ipv4_routes, ipv6_routes, expected_result", [
+    ([IPV4_DEFAULT_ROUTE], [], True),
+    ([IPV4_LOCAL_NETWORK_ROUTE], [], False),
+    ([IPV4_REJECT_DEFAULT_ROUTE], [], False),
+    # Unlike `ip route get 192.0.2.1`, an IPv6 default route is enough.
+    ([], [IPV6_DEFAULT_ROUTE], True),
+    ([], [IPV6_LOOPBACK_REJECT_ROUTE], False),
+    ([], [], False),
+])
+def test_check_for_route_in_route_tables(ipv4_routes, ipv6_routes, expected_result, tmp_path):
+    ipv4_route_table = tmp_path / "route"
+    ipv4_route_table.write_text(IPV4_ROUTE_TABLE_HEADER + "".join(ipv4_routes))
+    ipv6_route_table = tmp_path / "ipv6_route"
+    ipv6_route_table.write_text("".join(ipv6_routes))
+
+    assert check_for_route_in_route_tables(
+        str(ipv4_route_table), str(ipv6_route_table)
+    ) is expected_result
+
+
+def test_check_for_route_in_route_tables_returns_none_when_route_tables_cannot_be_read(tmp_path):
+    assert check_for_route_in_route_tables(
+        str(tmp_path / "route"), str(tmp_path / "ipv6_route")
+    ) is None
+
+
+FR_ACT_TO_TBL = 1
+FR_ACT_BLACKHOLE = 6
+RT_TABLE_COMPAT = 252
+NLMSG_DONE = struct.pack("=IHHIIi", 20, 3, 2, 1, 0, 0)
+
+
+def build_routing_rule_message(table, action=FR_ACT_TO_TBL):
+    # The FRA_TABLE attribute holds the actual table id.
+    payload = struct.pack(
+        "=BBBBBBBBI", socket.AF_INET, 0, 0, 0, min(table, RT_TABLE_COMPAT), 0, 0, action, 0
+    ) + struct.pack("=HHI", 8, 15, table)
+    return struct.pack("=IHHII", 16 + len(payload), 32, 2, 1, 0) + payload
+
+
+def build_netlink_socket(*responses):
+    netlink_socket = MagicMock()
+    netlink_socket.__enter__.return_value = netlink_socket
+    netlink_socket.recv.side_effect = responses
+    return netlink_socket
+
+
+DEFAULT_ROUTING_RULES = [
+    build_routing_rule_message(255), build_routing_rule_message(254), build_routing_rule_message(253)
+]
+
+
+@pytest.mark.parametrize("routing_rules, expected_result", [
+    (DEFAULT_ROUTING_RULES, False),
+    (DEFAULT_ROUTING_RULES + [build_routing_rule_message(51820)], True),
+    (DEFAULT_ROUTING_RULES + [build_routing_rule_message(100)], True),
+    (DEFAULT_ROUTING_RULES + [build_routing_rule_message(0, action=FR_ACT_BLACKHOLE)], True),
+])
+def test_has_policy_routing_rules(routing_rules, expected_result):
+    # The end of the dump is received in a separate read.
+    netlink_socket = build_netlink_socket(b"".join(routing_rules), NLMSG_DONE)
+
+    assert has_policy_routing_rules(lambda: netlink_socket) is expected_result
+
+
+def test_has_policy_routing_rules_returns_none_when_routing_rules_cannot_be_retrieved():
+    netlink_socket = build_netlink_socket(PermissionError("Operation not permitted"))
+
+    assert has_policy_routing_rules(lambda: netlink_socket) is None
+
+
+@pytest.mark.parametrize("policy_routing_rules", [True, None])
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.subprocess")
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.check_for_route_in_route_tables")
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.has_policy_routing_rules")
+def test_check_for_network_connectivity_uses_ip_route_get_unless_there_is_no_policy_routing(
+        has_policy_routing_rules_mock, check_for_route_in_route_tables_mock, subprocess_mock,
+        policy_routing_rules
+):
+    has_policy_routing_rules_mock.return_value = policy_routing_rules
+    subprocess_mock.run.return_value.returncode = 0
+
+    assert check_for_network_connectivity() is True
+
+    check_for_route_in_route_tables_mock.assert_not_called()
+    subprocess_mock.run.assert_called_once()
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.subprocess")
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.check_for_route_in_route_tables")
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.has_policy_routing_rules")
+def test_check_for_network_connectivity_looks_up_route_tables_without_policy_routing(
+        has_policy_routing_rules_mock, check_for_route_in_route_tables_mock, subprocess_mock
+):
+    has_policy_routing_rules_mock.return_value = False
+    check_for_route_in_route_tables_mock.return_value = False
+
+    assert check_for_network_connectivity() is False
+
+    subprocess_mock.run.assert_not_called()
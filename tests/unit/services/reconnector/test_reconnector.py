@@ -16,7 +16,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock, MagicMock, patch, PropertyMock
 
 import pytest
 
@@ -28,6 +28,9 @@ from proton.vpn.core.refresher import VPNDataRefresher
 from proton.vpn.app.gtk.services.reconnector.network_monitor import NetworkMonitor
 from proton.vpn.app.gtk.services.reconnector.reconnector import VPNReconnector
 from proton.vpn.app.gtk.services.reconnector.session_monitor import SessionMonitor
+from proton.vpn.app.gtk.services.reconnector.telemetry import (
+    OutagePhase, ReconnectionTelemetry
+)
 from proton.vpn.app.gtk.services.reconnector.vpn_monitor import VPNMonitor
 from proton.vpn.app.gtk.utils.executor import AsyncExecutor
 from tests.unit.testing_utils import process_gtk_events
@@ -232,7 +235,7 @@ def test_on_vpn_drop_raises_exception_on_authentication_denied_error(
         process_gtk_events()
 
 
-@patch("proton.vpn.app.gtk.services.reconnector.reconnector.random")
+@patch("proton.vpn.app.gtk.services.reconnector.backoff.random")
 @patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
 def test_on_vpn_drop_a_reconnection_attempt_is_scheduled_with_an_exponential_backoff_delay(
     glib_mock, random_mock,
@@ -244,6 +247,9 @@ def test_on_vpn_drop_a_reconnection_attempt_is_scheduled_with_an_exponential_bac
         vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
     )
     vpn_connector.current_state = states.Error()
+    # No alternative servers to fall back to.
+    vpn_data_refresher.server_list = MagicMock()
+    vpn_data_refresher.server_list.__iter__.return_value = iter([])
 
     glib_mock.timeout_add_seconds.return_value = 1
     random_mock.uniform.return_value = 1  # Get rid of randomness.
@@ -271,7 +277,7 @@ def test_on_vpn_drop_a_reconnection_attempt_is_scheduled_with_an_exponential_bac
     (True, False),
     (False, False)
 ])
-@patch("proton.vpn.app.gtk.services.reconnector.reconnector.random")
+@patch("proton.vpn.app.gtk.services.reconnector.backoff.random")
 @patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
 def test_reconnection_is_rescheduled_if_connection_error_is_not_fatal_when_network_is_down_or_session_is_locked(
     glib_mock, random_mock,
@@ -322,7 +328,7 @@ def test_reconnection_is_rescheduled_if_connection_error_is_not_fatal_when_netwo
     assert delay_in_ms == 2000
 
 
-@patch("proton.vpn.app.gtk.services.reconnector.reconnector.random")
+@patch("proton.vpn.app.gtk.services.reconnector.backoff.random")
 @patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
 def test_on_vpn_up_resets_retry_counter_and_removes_pending_scheduled_attempt(
         glib_mock, random_mock,
@@ -373,3 +379,253 @@ def test_on_vpn_drop_trigger_force_refresh_after_expired_certificate_event_is_re
     vpn_monitor.vpn_drop_callback(event)
 
     async_executor.submit.assert_called_with(vpn_data_refresher.force_refresh_certificate)
+
+
+def build_logical_server(server_id, exit_country="CH", features=(), tier=2, score=1.0, enabled=True):
+    server = Mock()
+    server.id = server_id
+    server.name = f"{exit_country}#{server_id}"
+    server.exit_country = exit_country
+    server.features = list(features)
+    server.tier = tier
+    server.score = score
+    server.enabled = enabled
+    return server
+
+
+@pytest.fixture
+def server_list():
+    servers = [
+        build_logical_server("connected", features=["P2P"]),
+        build_logical_server("worse-alternative", features=["P2P"], score=3.0),
+        build_logical_server("best-alternative", features=["P2P"], score=2.0),
+        build_logical_server("without-same-features", score=0.1),
+        build_logical_server("with-extra-features", features=["P2P", "TOR"], score=0.1),
+        build_logical_server("other-country", exit_country="SE", features=["P2P"], score=0.1),
+        build_logical_server("disabled", features=["P2P"], score=0.1, enabled=False),
+        build_logical_server("higher-tier", features=["P2P"], score=0.1, tier=3),
+    ]
+    server_list = MagicMock()
+    server_list.__iter__.side_effect = lambda: iter(servers)
+    server_list.user_tier = 2
+    server_list.get_by_id.side_effect = lambda server_id: next(
+        (server for server in servers if server.id == server_id), None
+    )
+    return server_list
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_falls_back_to_alternative_servers_after_repeated_failures(
+    glib_mock, server_list,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+    )
+    vpn_data_refresher.server_list = server_list
+    vpn_connector.current_connection.server_id = "connected"
+    vpn_connector.get_vpn_server.side_effect = lambda logical_server, _: f"vpn-server-{logical_server.id}"
+    vpn_connector.current_state = states.Error(
+        context=states.StateContext(event=events.Timeout(context=None))
+    )
+
+    servers_tried = []
+    for _ in range(5):
+        reconnector.schedule_reconnection()
+        delay_in_ms, reconnect_func = glib_mock.timeout_add.call_args.args
+        reconnect_func()
+        servers_tried.append(async_executor.submit.call_args.args[1])
+
+    assert servers_tried == [
+        "vpn-server-connected", "vpn-server-connected",
+        "vpn-server-best-alternative", "vpn-server-worse-alternative",
+        "vpn-server-connected"
+    ]
+
+
+def follow_attempted_server(vpn_connector, async_executor):
+    """The current connection points to the last server attempted, as it happens
+    when reconnecting."""
+    def submit(_connect, vpn_server, *_args):
+        vpn_connector.current_connection.server_id = vpn_server.replace("vpn-server-", "")
+        return Mock()
+    async_executor.submit.side_effect = submit
+
+
+@pytest.mark.parametrize("extra_feature", ["SECURE_CORE", "TOR", "P2P"])
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_does_not_fall_back_to_servers_with_extra_features(
+    glib_mock, extra_feature,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    servers = [
+        build_logical_server("connected"),
+        build_logical_server("plain-alternative", score=2.0),
+        build_logical_server("with-extra-feature", features=[extra_feature], score=0.1),
+    ]
+    server_list = MagicMock()
+    server_list.__iter__.side_effect = lambda: iter(servers)
+    server_list.user_tier = 2
+    server_list.get_by_id.side_effect = lambda server_id: next(
+        (server for server in servers if server.id == server_id), None
+    )
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+    )
+    vpn_data_refresher.server_list = server_list
+    vpn_connector.current_connection.server_id = "connected"
+    vpn_monitor.vpn_up_callback()
+    vpn_connector.get_vpn_server.side_effect = lambda logical_server, _: f"vpn-server-{logical_server.id}"
+    follow_attempted_server(vpn_connector, async_executor)
+
+    for _ in range(4):
+        reconnector.schedule_reconnection()
+        _, reconnect_func = glib_mock.timeout_add.call_args.args
+        reconnect_func()
+
+    servers_tried = [call.args[1] for call in async_executor.submit.call_args_list]
+    assert servers_tried == [
+        "vpn-server-connected", "vpn-server-connected",
+        "vpn-server-plain-alternative", "vpn-server-connected"
+    ]
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_goes_back_to_the_connected_server_after_trying_alternative_servers(
+    glib_mock, server_list,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+    )
+    vpn_data_refresher.server_list = server_list
+    vpn_connector.current_connection.server_id = "connected"
+    vpn_monitor.vpn_up_callback()
+    vpn_connector.get_vpn_server.side_effect = lambda logical_server, _: f"vpn-server-{logical_server.id}"
+    follow_attempted_server(vpn_connector, async_executor)
+
+    servers_tried = []
+    for _ in range(6):
+        reconnector.schedule_reconnection()
+        _, reconnect_func = glib_mock.timeout_add.call_args.args
+        reconnect_func()
+        servers_tried.append(async_executor.submit.call_args.args[1])
+
+    assert servers_tried == [
+        "vpn-server-connected", "vpn-server-connected",
+        "vpn-server-best-alternative", "vpn-server-worse-alternative",
+        "vpn-server-connected", "vpn-server-connected"
+    ]
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_falls_back_to_alternative_servers_immediately_when_server_is_removed(
+    glib_mock, server_list,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+    )
+    vpn_data_refresher.server_list = server_list
+    vpn_connector.current_connection.server_id = "connected"
+    vpn_monitor.vpn_up_callback()  # The connected server is remembered when the VPN is up.
+
+    # The connected server is removed from the server list.
+    server_list.get_by_id.side_effect = lambda server_id: next(
+        (server for server in server_list if server.id == server_id and server_id != "connected"),
+        None
+    )
+    vpn_connector.get_vpn_server.side_effect = lambda logical_server, _: f"vpn-server-{logical_server.id}"
+    follow_attempted_server(vpn_connector, async_executor)
+
+    for _ in range(3):
+        reconnector.schedule_reconnection()
+        _, reconnect_func = glib_mock.timeout_add.call_args.args
+        reconnect_func()
+
+    servers_tried = [call.args[1] for call in async_executor.submit.call_args_list]
+    assert servers_tried == ["vpn-server-best-alternative", "vpn-server-worse-alternative"]
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_delay_is_capped_only_when_trying_alternative_servers(
+    glib_mock, server_list,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    backoff_policy = Mock()
+    backoff_policy.next_delay_ms.return_value = 60_000
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor,
+        async_executor, backoff_policy=backoff_policy
+    )
+    vpn_data_refresher.server_list = server_list
+    vpn_connector.current_connection.server_id = "connected"
+    vpn_monitor.vpn_up_callback()
+    vpn_connector.get_vpn_server.side_effect = lambda logical_server, _: f"vpn-server-{logical_server.id}"
+    follow_attempted_server(vpn_connector, async_executor)
+
+    delays = []
+    for _ in range(5):
+        reconnector.schedule_reconnection()
+        delay_in_ms, reconnect_func = glib_mock.timeout_add.call_args.args
+        delays.append(delay_in_ms)
+        reconnect_func()
+
+    fallback_delay = VPNReconnector.FALLBACK_MAX_RETRY_DELAY_IN_MS
+    assert delays == [60_000, 60_000, fallback_delay, fallback_delay, 60_000]
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_delay_is_computed_by_the_injected_backoff_policy(
+    glib_mock,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    backoff_policy = Mock()
+    backoff_policy.next_delay_ms.return_value = 1234
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor,
+        async_executor, backoff_policy=backoff_policy
+    )
+
+    reconnector.schedule_reconnection()
+
+    backoff_policy.next_delay_ms.assert_called_once_with(0)
+    delay_in_ms, _ = glib_mock.timeout_add.call_args.args
+    assert delay_in_ms == 1234
+
+    vpn_monitor.vpn_up_callback()  # Simulate VPN up event.
+
+    backoff_policy.reset.assert_called()
+
+
+@patch("proton.vpn.app.gtk.services.reconnector.reconnector.GLib")
+def test_reconnection_phases_are_recorded_in_the_outage_timeline(
+    glib_mock,
+    vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor, async_executor
+):
+    clock = Mock(side_effect=range(100))
+    reconnector = VPNReconnector(
+        vpn_connector, vpn_data_refresher, vpn_monitor, network_monitor, session_monitor,
+        async_executor, telemetry=ReconnectionTelemetry(clock=clock)
+    )
+    vpn_connector.current_state = states.Error(
+        context=states.StateContext(event=events.Timeout(context=None))
+    )
+
+    vpn_monitor.vpn_drop_callback(vpn_connector.current_state.context.event)
+    network_monitor.network_up_callback()
+    _, reconnect_func = glib_mock.timeout_add.call_args.args
+    reconnect_func()
+    vpn_monitor.vpn_up_callback()
+
+    outage, = reconnector.telemetry.outages
+    assert [event.phase for event in outage.events] == [
+        OutagePhase.DROP,
+        OutagePhase.ATTEMPT_SCHEDULED,
+        OutagePhase.NETWORK_UP,
+        OutagePhase.ATTEMPT_SCHEDULED,
+        OutagePhase.ATTEMPT_STARTED,
+        OutagePhase.CONNECTED,
+    ]
+    assert outage.events[0].details == "Timeout"
+    assert outage.duration == 5
@@ -18,10 +18,11 @@ along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
 from unittest.mock import Mock, patch
 import pytest
+from dbus.exceptions import DBusException
 
 from proton.vpn.app.gtk.services.reconnector.session_monitor import (
     SessionMonitor, BUS_NAME,
-    SESSION_INTERFACE, UNLOCK_SIGNAL
+    SESSION_INTERFACE, UNLOCK_SIGNAL, PROPERTIES_INTERFACE
 )
 
 
@@ -92,3 +93,76 @@ def test_disable_does_not_unhook_from_login1_signal_if_it_was_not_hooked_before(
 
     session_monitor.disable()
     assert not signal_receiver_mock.remove.call_count
+
+
+def test_enable_reads_locked_hint_asynchronously_and_caches_session_proxy():
+    bus_mock = Mock()
+    session_proxy_mock = bus_mock.get_object.return_value
+    session_monitor = SessionMonitor(bus_mock, PATH_NAME)
+    session_monitor.session_unlocked_callback = Mock()
+
+    session_monitor.enable()
+
+    session_proxy_mock.Get.assert_called_once()
+    get_kwargs = session_proxy_mock.Get.call_args.kwargs
+    assert get_kwargs["dbus_interface"] == PROPERTIES_INTERFACE
+    get_kwargs["reply_handler"](True)
+
+    assert not session_monitor.is_session_unlocked
+    assert not session_monitor.is_session_unlocked
+    bus_mock.get_object.assert_called_once_with(BUS_NAME, PATH_NAME, introspect=False)
+
+
+def test_is_session_unlocked_tracks_locked_hint_changes():
+    bus_mock = Mock()
+    session_proxy_mock = bus_mock.get_object.return_value
+    session_monitor = SessionMonitor(bus_mock, PATH_NAME)
+    session_monitor.session_unlocked_callback = Mock()
+    session_monitor.enable()
+    on_properties_changed = session_proxy_mock.connect_to_signal.call_args[0][1]
+
+    on_properties_changed(SESSION_INTERFACE, {"LockedHint": True}, [])
+    assert not session_monitor.is_session_unlocked
+
+    on_properties_changed(SESSION_INTERFACE, {"LockedHint": False}, [])
+    assert session_monitor.is_session_unlocked
+
+    # The D-Bus properties are only read once, when the monitor is enabled.
+    session_proxy_mock.Get.assert_called_once()
+
+
+def test_is_session_unlocked_reads_locked_hint_synchronously_until_the_initial_value_is_received():
+    bus_mock = Mock()
+    session_proxy_mock = bus_mock.get_object.return_value
+    session_monitor = SessionMonitor(bus_mock, PATH_NAME)
+    session_monitor.session_unlocked_callback = Mock()
+    session_monitor.enable()
+    session_proxy_mock.Get.return_value = True
+
+    assert not session_monitor.is_session_unlocked
+
+    session_proxy_mock.Get.assert_called_with(
+        SESSION_INTERFACE, "LockedHint", dbus_interface=PROPERTIES_INTERFACE
+    )
+    # The value read is kept, since changes are notified from now on.
+    assert session_proxy_mock.Get.call_count == 2
+    assert not session_monitor.is_session_unlocked
+    assert session_proxy_mock.Get.call_count == 2
+
+
+def test_is_session_unlocked_assumes_session_is_locked_when_locked_hint_cannot_be_read():
+    bus_mock = Mock()
+    session_proxy_mock = bus_mock.get_object.return_value
+    session_monitor = SessionMonitor(bus_mock, PATH_NAME)
+    session_monitor.session_unlocked_callback = Mock()
+    session_monitor.enable()
+    error = DBusException("logind is not available")
+    session_proxy_mock.Get.call_args.kwargs["error_handler"](error)
+    session_proxy_mock.Get.side_effect = error
+
+    assert not session_monitor.is_session_unlocked
+
+    # The lock state is read again on the next check.
+    session_proxy_mock.Get.side_effect = None
+    session_proxy_mock.Get.return_value = False
+    assert session_monitor.is_session_unlocked
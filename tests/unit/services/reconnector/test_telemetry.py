@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from proton.vpn.app.gtk.services.reconnector.telemetry import (
+    OutagePhase, ReconnectionTelemetry
+)
+
+
+@pytest.fixture
+def clock():
+    return Mock(return_value=0)
+
+
+def record_at(telemetry, clock, timestamp, phase, details=None):
+    clock.return_value = timestamp
+    telemetry.record(phase, details)
+
+
+def test_phases_are_ignored_while_there_is_no_ongoing_outage(clock):
+    telemetry = ReconnectionTelemetry(clock=clock, wall_clock=clock)
+
+    telemetry.record(OutagePhase.NETWORK_UP)
+    telemetry.record(OutagePhase.CONNECTED)
+
+    assert telemetry.outages == []
+
+
+def test_outage_ends_once_the_vpn_is_connected_again(clock):
+    telemetry = ReconnectionTelemetry(clock=clock, wall_clock=clock)
+
+    record_at(telemetry, clock, 10, OutagePhase.DROP, "Timeout")
+    assert telemetry.ongoing_outage is not None
+
+    record_at(telemetry, clock, 12, OutagePhase.NETWORK_UP)
+    record_at(telemetry, clock, 17, OutagePhase.CONNECTED)
+
+    outage, = telemetry.outages
+    assert not outage.is_ongoing
+    assert telemetry.ongoing_outage is None
+    assert outage.started_at == 10
+    assert outage.ended_at == 17
+    assert outage.duration == 7
+
+
+def test_phase_latencies_are_measured_from_the_drop_to_the_first_time_each_phase_is_reached(clock):
+    telemetry = ReconnectionTelemetry(clock=clock, wall_clock=clock)
+
+    record_at(telemetry, clock, 100, OutagePhase.DROP)
+    record_at(telemetry, clock, 101, OutagePhase.ATTEMPT_SCHEDULED)
+    record_at(telemetry, clock, 102, OutagePhase.ATTEMPT_STARTED)
+    # A failed attempt produces another drop within the same outage.
+    record_at(telemetry, clock, 105, OutagePhase.DROP)
+    record_at(telemetry, clock, 106, OutagePhase.SESSION_UNLOCKED)
+    record_at(telemetry, clock, 108, OutagePhase.ATTEMPT_SCHEDULED)
+    record_at(telemetry, clock, 110, OutagePhase.ATTEMPT_STARTED)
+    record_at(telemetry, clock, 111, OutagePhase.CONNECTED)
+
+    outage, = telemetry.outages
+    assert outage.attempts == 2
+    assert outage.phase_latencies() == {
+        "attempt_scheduled": 1,
+        "attempt_started": 2,
+        "drop": 5,
+        "session_unlocked": 6,
+        "connected": 11,
+    }
+
+
+def test_latencies_are_measured_with_the_monotonic_clock_when_the_wall_clock_is_stepped(clock):
+    wall_clock = Mock(return_value=1000)
+    telemetry = ReconnectionTelemetry(clock=clock, wall_clock=wall_clock)
+
+    record_at(telemetry, clock, 10, OutagePhase.DROP)
+    # The wall clock is stepped back (e.g. by NTP) once the network is up.
+    wall_clock.return_value = 400
+    record_at(telemetry, clock, 12, OutagePhase.NETWORK_UP)
+    record_at(telemetry, clock, 15, OutagePhase.CONNECTED)
+
+    outage, = telemetry.outages
+    assert outage.started_at == 1000
+    assert outage.ended_at == 400
+    assert outage.duration == 5
+    assert outage.phase_latencies() == {"network_up": 2, "connected": 5}
+
+
+def test_only_the_last_outages_are_kept(clock):
+    telemetry = ReconnectionTelemetry(max_outages=2, clock=clock, wall_clock=clock)
+
+    for timestamp in (1, 2, 3):
+        record_at(telemetry, clock, timestamp, OutagePhase.DROP)
+        record_at(telemetry, clock, timestamp, OutagePhase.DISCONNECTED)
+
+    assert [outage.started_at for outage in telemetry.outages] == [2, 3]
+
+
+def test_to_json_exports_the_outages_timeline(clock):
+    telemetry = ReconnectionTelemetry(clock=clock, wall_clock=clock)
+    record_at(telemetry, clock, 1, OutagePhase.DROP, "Timeout")
+    record_at(telemetry, clock, 4, OutagePhase.CONNECTED)
+    record_at(telemetry, clock, 5, OutagePhase.DROP)
+
+    exported = json.loads(telemetry.to_json())
+
+    finished_outage, ongoing_outage = exported["outages"]
+    assert finished_outage["duration"] == 3
+    assert finished_outage["phase_latencies"] == {"connected": 3}
+    assert finished_outage["events"][0] == {"phase": "drop", "timestamp": 1, "details": "Timeout"}
+    assert ongoing_outage["ended_at"] is None
+    assert ongoing_outage["duration"] is None
@@ -0,0 +1,73 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from unittest.mock import Mock, patch
+
+from proton.vpn.connection import states
+
+from proton.vpn.app.gtk.services.connection_status_dispatcher import ConnectionStatusDispatcher
+
+
+@patch("proton.vpn.app.gtk.services.connection_status_dispatcher.GLib")
+def test_status_update_burst_is_dispatched_once_with_the_latest_state(glib_mock):
+    dispatcher = ConnectionStatusDispatcher()
+    subscriber = Mock()
+    dispatcher.register(subscriber)
+
+    connected = states.Connected()
+    dispatcher.status_update(states.Connecting())
+    dispatcher.status_update(connected)
+
+    glib_mock.idle_add.assert_called_once()
+    dispatch, = glib_mock.idle_add.call_args.args
+    subscriber.status_update.assert_not_called()
+
+    dispatch()
+
+    subscriber.status_update.assert_called_once_with(connected)
+
+
+@patch("proton.vpn.app.gtk.services.connection_status_dispatcher.GLib")
+def test_status_update_after_dispatch_schedules_a_new_dispatch(glib_mock):
+    dispatcher = ConnectionStatusDispatcher()
+    subscriber = Mock()
+    dispatcher.register(subscriber)
+
+    dispatcher.status_update(states.Connecting())
+    glib_mock.idle_add.call_args.args[0]()
+    dispatcher.status_update(states.Connected())
+    glib_mock.idle_add.call_args.args[0]()
+
+    assert glib_mock.idle_add.call_count == 2
+    assert [type(call.args[0]) for call in subscriber.status_update.call_args_list] == [
+        states.Connecting, states.Connected
+    ]
+
+
+@patch("proton.vpn.app.gtk.services.connection_status_dispatcher.GLib")
+def test_unregistered_subscribers_are_not_notified(glib_mock):
+    dispatcher = ConnectionStatusDispatcher()
+    subscriber = Mock()
+    dispatcher.register(subscriber)
+    dispatcher.unregister(subscriber)
+
+    dispatcher.status_update(states.Connected())
+    glib_mock.idle_add.call_args.args[0]()
+
+    subscriber.status_update.assert_not_called()
+    assert not dispatcher.has_subscribers
@@ -0,0 +1,93 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from unittest.mock import Mock
+
+from proton.vpn.session.servers import ServerList
+
+from proton.vpn.app.gtk.services.server_list_snapshot import (
+    SNAPSHOT_VERSION, ServerListSnapshot, ServerListSnapshotStore
+)
+
+PLUS_TIER = 2
+
+SERVER_LIST = ServerList.from_dict({
+    "LogicalServers": [
+        {
+            "ID": 1,
+            "Name": "AR#1",
+            "Status": 1,
+            "Load": 50,
+            "Servers": [{"Status": 1, "EntryIP": "1.2.3.4", "X25519PublicKey": "key"}],
+            "ExitCountry": "AR",
+            "Tier": PLUS_TIER,
+            "Domain": "node-ar-01.protonvpn.net",
+        },
+    ],
+    "MaxTier": PLUS_TIER
+})
+
+
+def test_snapshot_only_keeps_the_fields_required_to_display_the_server_list():
+    data = ServerListSnapshot(user_tier=PLUS_TIER, server_list=SERVER_LIST).to_dict()
+
+    assert data == {
+        "version": SNAPSHOT_VERSION,
+        "user_tier": PLUS_TIER,
+        "logical_servers": [
+            {
+                "ID": 1,
+                "Name": "AR#1",
+                "Status": 1,
+                "Load": 50,
+                "Servers": [{"Status": 1}],
+                "ExitCountry": "AR",
+                "Tier": PLUS_TIER,
+            }
+        ]
+    }
+
+
+def test_save_and_load_snapshot():
+    cache_handler = Mock()
+    store = ServerListSnapshotStore(cache_handler)
+
+    store.save(ServerListSnapshot(user_tier=PLUS_TIER, server_list=SERVER_LIST))
+    cache_handler.load.return_value = cache_handler.save.call_args.args[0]
+    snapshot = store.load()
+
+    assert snapshot.user_tier == PLUS_TIER
+    server, = list(snapshot.server_list)
+    assert (server.id, server.name, server.load) == (1, "AR#1", 50)
+
+
+def test_load_returns_none_when_there_is_no_snapshot():
+    cache_handler = Mock()
+    cache_handler.load.return_value = None
+
+    assert ServerListSnapshotStore(cache_handler).load() is None
+
+
+def test_load_discards_snapshot_persisted_with_another_version():
+    cache_handler = Mock()
+    cache_handler.load.return_value = {
+        "version": SNAPSHOT_VERSION + 1, "user_tier": PLUS_TIER, "logical_servers": []
+    }
+
+    assert ServerListSnapshotStore(cache_handler).load() is None
+    cache_handler.remove.assert_called_once()
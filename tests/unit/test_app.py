@@ -0,0 +1,55 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import subprocess  # nosec B404 # nosemgrep: gitlab.bandit.B404
+import sys
+
+# Modules that should only be imported once the user opens them.
+LAZILY_IMPORTED_MODULES = [
+    "proton.vpn.app.gtk.widgets.headerbar.menu.about_dialog",
+    "proton.vpn.app.gtk.widgets.headerbar.menu.bug_report_dialog",
+    "proton.vpn.app.gtk.widgets.headerbar.menu.release_notes_dialog",
+    "proton.vpn.app.gtk.widgets.headerbar.menu.settings",
+    "proton.vpn.app.gtk.widgets.headerbar.menu.settings.early_access",
+]
+
+# The modules loaded are listed from a new interpreter, since other tests
+# already imported them in this one.
+LIST_MODULES_LOADED_AFTER_APP_CONSTRUCTION = """
+import json
+import sys
+from unittest.mock import Mock
+
+from proton.vpn.app.gtk.app import App
+
+App(controller=Mock())
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_dialogs_and_settings_are_not_imported_when_the_app_is_constructed():
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", LIST_MODULES_LOADED_AFTER_APP_CONSTRUCTION],
+        check=True, capture_output=True, text=True
+    )
+    loaded_modules = set(json.loads(result.stdout.splitlines()[-1]))
+
+    assert loaded_modules.isdisjoint(LAZILY_IMPORTED_MODULES), (
+        f"Modules imported eagerly: {sorted(loaded_modules & set(LAZILY_IMPORTED_MODULES))}"
+    )
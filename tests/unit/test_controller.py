@@ -1,7 +1,13 @@
-from unittest.mock import Mock, patch
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from unittest.mock import Mock, AsyncMock, patch
 import pytest
 
 from proton.vpn.app.gtk.controller import Controller
+from proton.vpn.app.gtk.utils.executor import AsyncExecutor, Lane
 
 
 MockOpenVPNTCP = Mock(name="MockOpenVPNTCP")
@@ -84,3 +90,191 @@ def test_get_available_protocols_returns_list_of_protocols_which_includes_wiregu
     mock_connector.get_available_protocols_for_backend.return_value = [MockOpenVPNUDP, MockOpenVPNTCP, MockWireGuard]
     protocols = controller.get_available_protocols()
     assert MockWireGuard in protocols
+
+
+def run_now(function, *args):
+    """Executor.submit replacement running the function synchronously."""
+    future = Future()
+    try:
+        result = function(*args)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        future.set_result(result)
+    except Exception as error:  # pylint: disable=broad-except
+        future.set_exception(error)
+    return future
+
+
+@dataclass
+class MockSettings:
+    killswitch: int = 0
+
+
+def build_controller_with_settings(settings):
+    api = Mock()
+    api.load_settings = AsyncMock(return_value=settings)
+    api.save_settings = AsyncMock()
+    executor = Mock()
+    executor.submit.side_effect = run_now
+    controller = Controller(
+        executor=executor,
+        exception_handler=Mock(),
+        api=api,
+        vpn_reconnector=Mock(),
+        app_config=Mock()
+    )
+    return controller, api
+
+
+def test_get_settings_only_loads_settings_once():
+    settings = MockSettings()
+    controller, api = build_controller_with_settings(settings)
+
+    assert controller.get_settings() is settings
+    assert controller.get_settings() is settings
+
+    api.load_settings.assert_called_once()
+
+
+def test_save_settings_updates_cached_settings_and_persists_a_copy():
+    controller, api = build_controller_with_settings(MockSettings())
+    new_settings = MockSettings(killswitch=1)
+
+    controller.save_settings(new_settings, bubble_up_errors=False)
+
+    assert controller.get_settings() is new_settings
+    api.load_settings.assert_not_called()
+    persisted_settings = api.save_settings.call_args[0][0]
+    assert persisted_settings == new_settings
+    assert persisted_settings is not new_settings
+
+
+def test_save_settings_invalidates_cached_settings_when_persisting_them_fails():
+    settings = MockSettings()
+    controller, api = build_controller_with_settings(settings)
+    api.save_settings.side_effect = OSError("Disk full")
+
+    controller.save_settings(MockSettings(killswitch=1), bubble_up_errors=False)
+
+    assert controller.get_settings() is settings
+    api.load_settings.assert_called_once()
+
+
+def test_logout_invalidates_cached_settings():
+    settings = MockSettings()
+    controller, api = build_controller_with_settings(settings)
+    api.logout = AsyncMock()
+    controller.get_settings()
+
+    controller.logout()
+    controller.get_settings()
+
+    assert api.load_settings.call_count == 2
+
+
+def test_logout_removes_server_list_snapshot():
+    api = Mock()
+    api.logout = AsyncMock()
+    executor = Mock()
+    executor.submit.side_effect = run_now
+    server_list_snapshot_store = Mock()
+    controller = Controller(
+        executor=executor,
+        exception_handler=Mock(),
+        api=api,
+        vpn_reconnector=Mock(),
+        app_config=Mock(),
+        server_list_snapshot_store=server_list_snapshot_store
+    )
+
+    controller.logout()
+
+    server_list_snapshot_store.remove.assert_called_once()
+
+
+def test_export_reconnection_telemetry_returns_the_last_outages_recorded_by_the_reconnector():
+    reconnector = Mock()
+    reconnector.telemetry.to_json.return_value = '{"outages": []}'
+    controller = Controller(
+        executor=Mock(),
+        exception_handler=Mock(),
+        api=Mock(),
+        vpn_reconnector=reconnector,
+        app_config=Mock(),
+        vpn_connector=Mock()
+    )
+
+    assert controller.reconnection_outages is reconnector.telemetry.outages
+    assert controller.export_reconnection_telemetry() == '{"outages": []}'
+
+
+def test_connection_status_dispatcher_is_only_subscribed_to_the_vpn_connector_while_there_are_subscribers():
+    vpn_connector = Mock()
+    controller = Controller(
+        executor=Mock(),
+        exception_handler=Mock(),
+        api=Mock(),
+        vpn_reconnector=Mock(),
+        app_config=Mock(),
+        vpn_connector=vpn_connector
+    )
+    first_subscriber, second_subscriber = Mock(), Mock()
+
+    controller.register_connection_status_subscriber(first_subscriber)
+    controller.register_connection_status_subscriber(second_subscriber)
+    vpn_connector.register.assert_called_once()
+
+    controller.unregister_connection_status_subscriber(first_subscriber)
+    vpn_connector.unregister.assert_not_called()
+    controller.unregister_connection_status_subscriber(second_subscriber)
+    vpn_connector.unregister.assert_called_once_with(vpn_connector.register.call_args.args[0])
+
+
+def test_get_diagnostics_includes_reconnection_telemetry_and_main_loop_stalls():
+    reconnector = Mock()
+    reconnector.telemetry.to_json.return_value = '{"outages": []}'
+    main_loop_watchdog = Mock()
+    main_loop_watchdog.to_json.return_value = '{"stalls": []}'
+    controller = Controller(
+        executor=Mock(),
+        exception_handler=Mock(),
+        api=Mock(),
+        vpn_reconnector=reconnector,
+        app_config=Mock(),
+        vpn_connector=Mock(),
+        main_loop_watchdog=main_loop_watchdog
+    )
+
+    assert controller.get_diagnostics() == {
+        "reconnection-telemetry.json": '{"outages": []}',
+        "main-loop-stalls.json": '{"stalls": []}',
+    }
+
+
+@pytest.mark.parametrize("network_monitor_backend", ["polling", "netlink"])
+@patch("proton.vpn.app.gtk.services.reconnector.network_monitor.check_for_network_connectivity")
+def test_network_checks_are_not_delayed_by_a_saturated_background_lane(
+        check_for_network_connectivity, network_monitor_backend
+):
+    check_for_network_connectivity.return_value = False
+    app_config = Mock()
+    app_config.network_monitor_backend = network_monitor_backend
+    release = threading.Event()
+    with AsyncExecutor(lane_max_workers={Lane.BACKGROUND: 1}) as executor:
+        controller = Controller(
+            executor=executor,
+            exception_handler=Mock(),
+            api=Mock(),
+            vpn_reconnector=Mock(),
+            app_config=app_config
+        )
+        executor.lane(Lane.BACKGROUND).submit(release.wait)
+        executor.lane(Lane.BACKGROUND).submit(release.wait)
+
+        network_monitor = controller._build_network_monitor()
+        try:
+            network_monitor.check_network_state_async().result(timeout=1)
+        finally:
+            release.set()
+
+    check_for_network_connectivity.assert_called_once()
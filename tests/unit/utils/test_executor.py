@@ -18,9 +18,11 @@ along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import asyncio
+import threading
 import time
 
-from proton.vpn.app.gtk.utils.executor import AsyncExecutor
+from proton.vpn.app.gtk.utils.executor import AsyncExecutor, Lane, LaneStats
+from proton.vpn.app.gtk.utils.instrumentation import TaskInstrumentation
 
 
 def test_async_executor_submit_with_coroutine_func():
@@ -54,3 +56,62 @@ def test_async_executor_stop_stops_running_the_executor():
     executor.start()
     executor.stop()
     assert not executor.is_running
+
+
+def test_lane_stats_expose_queued_and_running_functions_per_lane():
+    release = threading.Event()
+    with AsyncExecutor(lane_max_workers={Lane.BACKGROUND: 1}) as executor:
+        background_lane = executor.lane(Lane.BACKGROUND)
+        first_future = background_lane.submit(release.wait)
+        second_future = background_lane.submit(release.wait)
+
+        while executor.lane_stats()[Lane.BACKGROUND].running == 0:
+            time.sleep(0.01)
+
+        assert executor.lane_stats()[Lane.BACKGROUND] == LaneStats(queued=1, running=1)
+        assert executor.lane_stats()[Lane.DEFAULT] == LaneStats()
+
+        release.set()
+        first_future.result(timeout=1)
+        second_future.result(timeout=1)
+        assert executor.lane_stats()[Lane.BACKGROUND] == LaneStats()
+
+
+def test_critical_lane_is_not_queued_behind_background_lane():
+    release = threading.Event()
+    with AsyncExecutor(lane_max_workers={Lane.BACKGROUND: 1}) as executor:
+        executor.lane(Lane.BACKGROUND).submit(release.wait)
+        executor.lane(Lane.BACKGROUND).submit(release.wait)
+
+        future = executor.lane(Lane.CRITICAL).submit(lambda: "done")
+
+        assert future.result(timeout=1) == "done"
+        release.set()
+
+
+def test_blocking_work_from_coroutines_runs_on_the_critical_lane():
+    async def asyncio_func():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: threading.current_thread().name)
+
+    with AsyncExecutor() as executor:
+        thread_name = executor.submit(asyncio_func).result(timeout=1)
+
+    assert thread_name.startswith(Lane.CRITICAL.value)
+
+
+def test_task_stats_are_recorded_when_the_executor_is_instrumented():
+    def blocking_func():
+        return "done"
+
+    async def asyncio_func():
+        return "done"
+
+    with AsyncExecutor(instrumentation=TaskInstrumentation()) as executor:
+        executor.submit(blocking_func).result(timeout=1)
+        executor.lane(Lane.BACKGROUND).submit(blocking_func).result(timeout=1)
+        executor.submit(asyncio_func).result(timeout=1)
+
+    task_stats = executor.task_stats()
+    assert task_stats[blocking_func.__qualname__].run_time.count == 2
+    assert task_stats[asyncio_func.__qualname__].run_time.count == 1
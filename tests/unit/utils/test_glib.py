@@ -52,3 +52,35 @@ def test_run_periodically():
 
     assert mock.call_count == expected_number_of_calls
     assert mock.mock_calls == [call("arg1", arg2="arg2") for _ in range(expected_number_of_calls)]
+
+
+def test_run_in_batches_processes_first_batch_synchronously_and_the_rest_on_the_main_loop():
+    processed_items = []
+    on_complete = Mock()
+
+    # With a time budget of 0 ms, each batch processes a single item.
+    source_id = glib.run_in_batches(
+        processed_items.append, [1, 2, 3], on_complete=on_complete, time_budget_ms=0
+    )
+
+    assert source_id is not None
+    assert processed_items == [1]
+    on_complete.assert_not_called()
+
+    process_gtk_events()
+
+    assert processed_items == [1, 2, 3]
+    on_complete.assert_called_once_with()
+
+
+def test_run_in_batches_returns_none_when_all_items_fit_in_the_first_batch():
+    processed_items = []
+    on_complete = Mock()
+
+    source_id = glib.run_in_batches(
+        processed_items.append, [1, 2, 3], on_complete=on_complete, time_budget_ms=1000
+    )
+
+    assert source_id is None
+    assert processed_items == [1, 2, 3]
+    on_complete.assert_called_once_with()
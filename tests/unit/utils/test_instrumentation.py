@@ -0,0 +1,122 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+import functools
+from unittest.mock import Mock, patch
+
+import pytest
+
+from proton.vpn.app.gtk.utils.instrumentation import (
+    Histogram, TaskInstrumentation, get_task_name, is_task_instrumentation_enabled
+)
+
+
+class Clock:
+    """Clock advanced manually by the tests, in seconds."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def connect():
+    pass
+
+
+def test_histogram_counts_durations_per_bucket():
+    histogram = Histogram(bucket_bounds_ms=(10, 100))
+
+    for duration_ms in (1, 10, 50, 500):
+        histogram.record(duration_ms)
+
+    assert histogram.bucket_counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean_ms == pytest.approx(140.25)
+    assert histogram.max_ms == 500
+    assert histogram.percentile_ms(50) == 10
+    assert histogram.percentile_ms(100) == 500
+
+
+def test_get_task_name_uses_the_qualified_name_of_the_callable():
+    assert get_task_name(connect) == "connect"
+    assert get_task_name(functools.partial(connect)) == "connect"
+    assert get_task_name(Histogram.record) == "Histogram.record"
+
+
+def test_wrap_records_queue_wait_and_run_time_per_task_name():
+    clock = Clock()
+    instrumentation = TaskInstrumentation(clock=clock)
+
+    wrapper = instrumentation.wrap(lambda: clock.__setattr__("now", clock.now + 0.2))
+    clock.now = 0.05  # The task waited 50 ms before starting to run.
+    wrapper()
+
+    stats, = instrumentation.snapshot().values()
+    assert stats.queue_wait.total_ms == pytest.approx(50)
+    assert stats.run_time.total_ms == pytest.approx(200)
+    assert stats.slow_tasks == 0
+
+
+def test_wrap_records_the_timings_of_coroutine_functions():
+    clock = Clock()
+    instrumentation = TaskInstrumentation(clock=clock)
+
+    async def load_settings():
+        clock.now += 0.1
+        return "settings"
+
+    wrapper = instrumentation.wrap(load_settings)
+
+    assert asyncio.run(wrapper()) == "settings"
+    assert instrumentation.snapshot()[get_task_name(load_settings)].run_time.total_ms \
+        == pytest.approx(100)
+
+
+@patch("proton.vpn.app.gtk.utils.instrumentation.logger")
+def test_slow_tasks_are_logged_with_their_call_site(logger_mock):
+    clock = Clock()
+    instrumentation = TaskInstrumentation(slow_task_threshold_ms=100, clock=clock)
+
+    def slow_task():
+        clock.now += 0.5
+
+    instrumentation.wrap(slow_task, lane="background")()
+
+    assert instrumentation.snapshot()[get_task_name(slow_task)].slow_tasks == 1
+    message = logger_mock.warning.call_args.args[0]
+    assert get_task_name(slow_task) in message
+    assert __file__ in message
+    assert "background lane" in message
+
+
+def test_wrapped_task_exceptions_are_propagated_and_timed():
+    instrumentation = TaskInstrumentation()
+    wrapper = instrumentation.wrap(Mock(side_effect=RuntimeError, __qualname__="failing"))
+
+    with pytest.raises(RuntimeError):
+        wrapper()
+
+    assert instrumentation.snapshot()["failing"].run_time.count == 1
+
+
+def test_task_instrumentation_is_enabled_with_the_command_line_option_or_the_environment_variable():
+    assert is_task_instrumentation_enabled(argv=["protonvpn-app", "--instrument-tasks"], environ={})
+    assert is_task_instrumentation_enabled(argv=[], environ={"PROTON_VPN_INSTRUMENT_TASKS": "1"})
+    assert not is_task_instrumentation_enabled(argv=["protonvpn-app"], environ={})
@@ -16,10 +16,69 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
 """
-from proton.vpn.app.gtk.utils.search import normalize
+from unittest.mock import patch
+
+import pytest
+
+from proton.vpn.app.gtk.utils.search import normalize, IncrementalSearch, SearchIndex
 
 
 def test_normalize():
     input_string = "CH-PT#1 "
     normalized_string = normalize(input_string)
     assert normalized_string == "ch-pt#1"
+
+
+@pytest.mark.parametrize("search_text, expected_result", [
+    ("", []),
+    ("a", ["AR#1", "AR#10"]),
+    ("ar#1", ["AR#1", "AR#10"]),
+    ("ar#10", ["AR#10"]),
+    ("jp", ["JP-FREE#1", "CH-JP#1"]),
+    ("-free#", ["JP-FREE#1"]),
+    ("JP FREE", []),
+    ("jp-fr ee", ["JP-FREE#1"]),
+    ("xyz", []),
+])
+def test_search_index_returns_entries_containing_search_text_in_index_order(
+        search_text, expected_result
+):
+    names = ["AR#1", "AR#10", "JP-FREE#1", "CH-JP#1"]
+    index = SearchIndex((name, name) for name in names)
+
+    assert index.search(search_text) == expected_result
+
+
+def test_search_entry_ids_results_can_be_modified_without_modifying_the_index():
+    names = ["AR#1", "AR#10"]
+    index = SearchIndex((name, name) for name in names)
+
+    index.search_entry_ids("ar").clear()
+
+    assert index.search("ar") == ["AR#1", "AR#10"]
+
+
+def test_incremental_search_narrows_down_previous_results_when_search_text_is_extended():
+    names = ["UNITED STATES#1", "UNITED KINGDOM#1", "AUSTRALIA#1", "UNITED STATES#2"]
+    index = SearchIndex((name, name) for name in names)
+    search = IncrementalSearch(index)
+
+    assert search.search("unit") == ["UNITED STATES#1", "UNITED KINGDOM#1", "UNITED STATES#2"]
+
+    with patch.object(index, "search_entry_ids", wraps=index.search_entry_ids) as search_mock:
+        assert search.search("united s") == ["UNITED STATES#1", "UNITED STATES#2"]
+
+    # The previous results were passed as candidates.
+    search_mock.assert_called_once_with("uniteds", [0, 1, 3])
+
+
+def test_incremental_search_searches_the_whole_index_when_search_text_is_not_extended():
+    names = ["UNITED STATES#1", "UNITED KINGDOM#1", "AUSTRALIA#1"]
+    index = SearchIndex((name, name) for name in names)
+    search = IncrementalSearch(index)
+    search.search("united k")
+
+    with patch.object(index, "search_entry_ids", wraps=index.search_entry_ids) as search_mock:
+        assert search.search("unite") == ["UNITED STATES#1", "UNITED KINGDOM#1"]
+
+    search_mock.assert_called_once_with("unite", None)
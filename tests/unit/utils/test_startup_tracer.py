@@ -0,0 +1,101 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+from unittest.mock import Mock
+
+from proton.vpn.app.gtk.utils.startup_tracer import (
+    DEFAULT_TRACE_PATH, StartupTracer, get_process_start_time, get_trace_path,
+    is_startup_tracing_enabled
+)
+
+
+def build_tracer(tmp_path, enabled=True):
+    clock = Mock(return_value=10.0)
+    tracer = StartupTracer(
+        enabled=enabled, trace_path=str(tmp_path / "trace.json"),
+        clock=clock, process_start_time=9.5
+    )
+    return tracer, clock
+
+
+def test_tracer_records_phases_relative_to_the_process_start(tmp_path):
+    tracer, clock = build_tracer(tmp_path)
+
+    tracer.checkpoint("python_startup")
+    with tracer.phase("import_gtk"):
+        clock.return_value = 10.25
+    clock.return_value = 11.0
+    tracer.checkpoint("import_app_modules")
+
+    assert [(phase.name, phase.start, phase.end) for phase in tracer.phases] == [
+        ("python_startup", 0.0, 0.5),
+        ("import_gtk", 0.5, 0.75),
+        ("import_app_modules", 0.75, 1.5),
+    ]
+
+
+def test_tracer_does_not_record_phases_when_disabled(tmp_path):
+    tracer, _ = build_tracer(tmp_path, enabled=False)
+
+    tracer.checkpoint("python_startup")
+    with tracer.phase("import_gtk"):
+        pass
+    tracer.finish("vpn_widget_ready")
+
+    assert tracer.phases == []
+    assert not (tmp_path / "trace.json").exists()
+
+
+def test_finish_writes_chrome_trace_and_ignores_later_phases(tmp_path):
+    tracer, clock = build_tracer(tmp_path)
+    tracer.begin("enable_refresher")
+    clock.return_value = 12.0
+    tracer.end("enable_refresher")
+
+    tracer.finish("vpn_widget_ready")
+    tracer.begin("enable_refresher")
+
+    with open(tmp_path / "trace.json", encoding="utf-8") as trace_file:
+        trace = json.load(trace_file)
+    enable_refresher, widget_ready = trace["traceEvents"]
+    assert enable_refresher["name"] == "enable_refresher"
+    assert enable_refresher["ph"] == "X"
+    assert enable_refresher["ts"] == 500_000
+    assert enable_refresher["dur"] == 2_000_000
+    assert widget_ready["name"] == "vpn_widget_ready"
+    assert widget_ready["ph"] == "i"
+    assert len(tracer.phases) == 2
+
+
+def test_startup_tracing_is_enabled_with_the_command_line_option_or_the_environment_variable():
+    assert is_startup_tracing_enabled(argv=["protonvpn-app", "--trace-startup"], environ={})
+    assert is_startup_tracing_enabled(argv=[], environ={"PROTON_VPN_TRACE_STARTUP": "1"})
+    assert not is_startup_tracing_enabled(argv=["protonvpn-app"], environ={})
+
+
+def test_trace_path_is_taken_from_the_environment_variable_unless_it_is_a_flag():
+    assert get_trace_path({"PROTON_VPN_TRACE_STARTUP": "/tmp/trace.json"}) == "/tmp/trace.json"
+    assert get_trace_path({"PROTON_VPN_TRACE_STARTUP": "1"}) == DEFAULT_TRACE_PATH
+    assert get_trace_path({}) == DEFAULT_TRACE_PATH
+
+
+def test_get_process_start_time_is_before_now():
+    process_start_time = get_process_start_time(clock=lambda: 1000.0)
+
+    assert process_start_time is None or process_start_time < 1000.0
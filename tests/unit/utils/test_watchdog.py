@@ -0,0 +1,79 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import threading
+import time
+
+from proton.vpn.app.gtk.utils.watchdog import MainLoopWatchdog
+
+
+def wait_until(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timeout waiting for condition."
+        time.sleep(0.01)
+
+
+def test_watchdog_records_main_loop_lag_without_stalls_when_pings_are_answered():
+    watchdog = MainLoopWatchdog(interval_ms=10, schedule=lambda callback: callback())
+
+    watchdog.start()
+    try:
+        wait_until(lambda: watchdog.lag.count >= 3)
+    finally:
+        watchdog.stop()
+
+    assert watchdog.stalls == []
+    assert not watchdog.is_running
+
+
+def test_watchdog_captures_the_main_thread_stack_when_the_main_loop_stalls():
+    def answer_late(callback):
+        threading.Timer(0.2, callback).start()
+
+    watchdog = MainLoopWatchdog(
+        interval_ms=10, stall_threshold_ms=50, schedule=answer_late,
+        main_thread=threading.current_thread()
+    )
+
+    watchdog.start()
+    try:
+        wait_until(lambda: watchdog.stalls)
+    finally:
+        watchdog.stop()
+
+    stall = watchdog.stalls[0]
+    assert stall.duration_ms >= 150
+    # The stack shows what the main thread was doing during the stall.
+    assert "wait_until" in stall.stack
+    exported = json.loads(watchdog.to_json())
+    assert exported["stalls"][0]["stack"] == stall.stack
+
+
+def test_stop_does_not_wait_for_the_main_loop_to_answer():
+    watchdog = MainLoopWatchdog(
+        interval_ms=10, stall_threshold_ms=10, schedule=lambda callback: None
+    )
+
+    watchdog.start()
+    time.sleep(0.05)
+    watchdog.stop()
+
+    assert not watchdog.is_running
+    assert watchdog.stalls == []
@@ -22,7 +22,7 @@ from dataclasses import dataclass
 from unittest.mock import Mock, PropertyMock, patch
 from tests.unit.testing_utils import process_gtk_events
 from proton.vpn.app.gtk.widgets.headerbar.menu.settings.common import UpgradePlusTag, ToggleWidget, ComboboxWidget, \
-    EntryWidget, is_upgrade_required, get_setting, save_setting
+    EntryWidget, is_upgrade_required, get_setting, save_setting, SettingsTransaction
 from proton.vpn.core.settings import NetShield
 
 
@@ -122,6 +122,39 @@ def test_save_setting_saves_value_to_disk_from_a_nested_setting_structure():
     assert mock_controller.save_settings.call_args[0][0].another_nest.test_value == new_value
 
 
+def test_settings_transaction_only_loads_settings_once():
+    mock_controller = Mock()
+    mock_controller.get_settings.return_value = MockSubDataclass(MockDataclass("Test value"))
+    settings_transaction = SettingsTransaction(mock_controller)
+
+    assert get_setting(mock_controller, "settings.another_nest.test_value", settings_transaction) == "Test value"
+    settings_transaction.set("settings.another_nest.test_value", "New value")
+    assert settings_transaction.get("settings.another_nest.test_value") == "New value"
+
+    mock_controller.get_settings.assert_called_once()
+
+
+def test_settings_transaction_coalesces_changes_into_a_single_write():
+    mock_controller = Mock()
+    settings = MockDataclass("Old value")
+    mock_controller.get_settings.return_value = settings
+    settings_transaction = SettingsTransaction(mock_controller, write_delay_ms=10_000)
+
+    save_setting(mock_controller, "settings.test_value", "New value", settings_transaction)
+    save_setting(mock_controller, "settings.test_value", "Newer value", settings_transaction)
+    process_gtk_events()
+
+    # Changes are not written until the write delay elapses or they are committed.
+    mock_controller.save_settings.assert_not_called()
+    assert settings_transaction.has_pending_changes
+
+    settings_transaction.commit()
+
+    mock_controller.save_settings.assert_called_once_with(settings)
+    assert settings.test_value == "Newer value"
+    assert not settings_transaction.has_pending_changes
+
+
 class TestToggleWidget:
     DEFAULT_SETTING_NAME = "settings.test_value"
     DEFAULT_TITLE = "Test title"
@@ -120,3 +120,17 @@ def test_notify_user_with_reconnect_message_display_message_when_user_is_connect
         mock_show_info_message.assert_called_once()
     else:    
         mock_show_info_message.assert_not_called()
+
+
+def test_settings_window_commits_pending_setting_changes_when_unrealized():
+    controller = Mock()
+    settings_window = SettingsWindow(
+        controller, Mock(), Mock(), Mock(), Mock(), Mock(), Mock()
+    )
+    settings_window.realize()
+    settings_window.settings_transaction.set("settings.killswitch", 1)
+
+    settings_window.destroy()
+
+    controller.save_settings.assert_called_once_with(controller.get_settings.return_value)
+    assert not settings_window.settings_transaction.has_pending_changes
@@ -31,7 +31,7 @@ from tests.unit.testing_utils import process_gtk_events
 
 class TestReportBugMenuEntry:
 
-    @patch("proton.vpn.app.gtk.widgets.headerbar.menu.menu.BugReportDialog")
+    @patch("proton.vpn.app.gtk.widgets.headerbar.menu.bug_report_dialog.BugReportDialog")
     def test_bug_report_menu_entry_shows_bug_report_dialog_when_clicked(self, bug_report_dialog_patch):
         bug_report_dialog_mock = Mock()
         bug_report_dialog_patch.return_value = bug_report_dialog_mock
@@ -49,7 +49,7 @@ class TestReportBugMenuEntry:
 
 class TestAboutMenuEntry:
 
-    @patch("proton.vpn.app.gtk.widgets.headerbar.menu.menu.AboutDialog")
+    @patch("proton.vpn.app.gtk.widgets.headerbar.menu.about_dialog.AboutDialog")
     def test_about_menu_entry_shows_about_dialog_when_clicked(self, about_dialog_patch):
         about_dialog_mock = Mock()
         about_dialog_patch.return_value = about_dialog_mock
@@ -23,6 +23,7 @@ import pytest
 
 from proton.vpn.connection.states import ConnectionStateEnum, Connecting, Connected, Disconnected
 from proton.vpn.session.servers import ServerList, Country, LogicalServer
+from proton.vpn.session.servers.types import ServerLoad
 
 from proton.vpn.app.gtk.controller import Controller
 from proton.vpn.app.gtk.widgets.vpn.serverlist.country import DeferredCountryRow
@@ -146,6 +147,27 @@ def test_connection_status_update_resets_country_row_connected_server_on_disconn
     assert country_row.server_rows[0].connection_state != ConnectionStateEnum.CONNECTED
 
 
+def test_connection_status_update_repaints_previous_server_row_when_connecting_to_another_server(
+        country, mock_controller
+):
+    country_row = DeferredCountryRow(
+        country=country, user_tier=PLUS_TIER, controller=mock_controller,
+        connected_server_id=country.servers[0].id
+    )
+    country_row.click_toggle_country_servers_button()
+    process_gtk_events()
+
+    connection_state = Connecting()
+    connection_state.context = Mock()
+    connection_state.context.connection.server_id = country.servers[1].id
+    country_row.connection_status_update(connection_state)
+
+    previous_server_row = country_row.get_server_row(country.servers[0].id)
+    new_server_row = country_row.get_server_row(country.servers[1].id)
+    assert previous_server_row.connection_state == ConnectionStateEnum.DISCONNECTED
+    assert new_server_row.connection_state == ConnectionStateEnum.CONNECTING
+
+
 def test_connect_button_click_triggers_vpn_connection_to_country(country, mock_controller):
     country_row = DeferredCountryRow(country=country, user_tier=PLUS_TIER, controller=mock_controller)
 
@@ -179,6 +201,36 @@ def test_initialize_currently_connected_country(
     assert country_row.server_rows[1].connection_state == ConnectionStateEnum.CONNECTED
 
 
+def test_update_country_keeps_unchanged_server_rows_and_rebuilds_the_rest(
+        country, mock_controller
+):
+    country_row = DeferredCountryRow(country=country, user_tier=PLUS_TIER, controller=mock_controller)
+    country_row.click_toggle_country_servers_button()
+    process_gtk_events()
+    unchanged_server_row = country_row.server_rows[1]
+    assert unchanged_server_row.server_label == "AR#2"
+
+    updated_servers = [
+        LogicalServer({
+            "ID": 2, "Name": "AR#2", "Status": 1, "Load": 10,
+            "Servers": [{"Status": 1}], "ExitCountry": COUNTRY_CODE, "Tier": 2,
+        }),
+        LogicalServer({
+            "ID": 3, "Name": "AR#3", "Status": 1, "Load": 50,
+            "Servers": [{"Status": 1}], "ExitCountry": COUNTRY_CODE, "Tier": 2,
+        }),
+    ]
+    touched_rows = country_row.update_country(
+        Country(code=COUNTRY_CODE, servers=updated_servers)
+    )
+
+    # AR#1 was removed and AR#3 was added.
+    assert touched_rows == 2
+    assert [row.server_label for row in country_row.server_rows] == ["AR#2", "AR#3"]
+    assert country_row.server_rows[0] is unchanged_server_row
+    assert unchanged_server_row.server_load_label == "10%"
+
+
 @pytest.fixture
 def country_with_server_under_maintenance():
     api_data = {
@@ -290,3 +342,37 @@ def test_country_widget_shows_user_tier_servers_first(
 
     assert len(country_row.server_rows) == 2
     assert country_row.server_rows[0].server_tier == user_tier
+
+
+def test_update_server_loads_is_deferred_until_the_country_servers_are_shown(
+        country, mock_controller
+):
+    country_row = DeferredCountryRow(country=country, user_tier=PLUS_TIER, controller=mock_controller)
+    country_row.click_toggle_country_servers_button()  # Show servers.
+    process_gtk_events()
+    country_row.click_toggle_country_servers_button()  # Hide servers.
+    process_gtk_events()
+
+    country.servers[0].update(ServerLoad(data={"ID": 1, "Status": 1, "Load": 90}))
+    assert country_row.update_server_loads() == 0
+    assert country_row.server_loads_outdated
+
+    country_row.click_toggle_country_servers_button()  # Show servers.
+    process_gtk_events()
+
+    assert not country_row.server_loads_outdated
+    assert country_row.server_rows[0].server_load_label == "90%"
+
+
+def test_server_rows_built_signal_is_emitted_once_all_server_rows_were_built(
+        country, mock_controller
+):
+    country_row = DeferredCountryRow(country=country, user_tier=PLUS_TIER, controller=mock_controller)
+    on_server_rows_built = Mock()
+    country_row.connect("server-rows-built", on_server_rows_built)
+
+    country_row.click_toggle_country_servers_button()
+    process_gtk_events()
+
+    on_server_rows_built.assert_called_once_with(country_row)
+    assert len(country_row.server_rows) == len(country.servers)
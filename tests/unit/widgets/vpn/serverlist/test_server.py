@@ -202,6 +202,25 @@ def test_update_server_load_should_also_change_maintenance_status_if_needed(plus
     run_in_window(server_row, assertions)
 
 
+def test_update_server_load_only_redraws_the_row_when_load_or_status_changed(
+        plus_logical_server
+):
+    server_row = ServerRow(server=plus_logical_server, user_tier=PLUS_TIER, controller=Mock())
+
+    assert not server_row.update_server_load()
+
+    plus_logical_server.update(ServerLoad(data={
+        "ID": "1",
+        "Name": "IS#1",
+        "Status": 1,
+        "Load": 95,
+    }))
+
+    assert server_row.update_server_load()
+    assert server_row.server_load_label == "95%"
+    assert not server_row.update_server_load()
+
+
 def run_in_window(server_row: ServerRow, assertions: Callable):
     """Adds the server row to a Gtk.Window, launches it,
     calls the assertions and closes it."""
@@ -21,6 +21,7 @@ from unittest.mock import Mock
 
 import pytest
 from proton.vpn.session.servers import ServerList
+from proton.vpn.connection.enum import ConnectionStateEnum
 from proton.vpn.connection.states import Connecting, Connected, Disconnected
 
 from proton.vpn.app.gtk.widgets.vpn.serverlist.serverlist import ServerListWidget
@@ -233,3 +234,70 @@ def test_server_list_widget_updates_country_rows_on_connection_status_update(
     servers_widget.connection_status_update(connection_state)
     process_gtk_events()
     assert servers_widget.country_rows[0].connection_state == connection_state.type
+
+
+def test_server_list_widget_resets_previously_connected_country_row_when_connecting_to_another_country(
+        unsorted_server_list
+):
+    servers_widget = ServerListWidget(controller=Mock())
+    servers_widget.display(user_tier=PLUS_TIER, server_list=unsorted_server_list)
+    argentina_row, japan_row = servers_widget.country_rows
+
+    connected_state = Connected()
+    connected_state.context.connection = Mock()
+    connected_state.context.connection.server_id = 2  # AR#10
+    servers_widget.connection_status_update(connected_state)
+
+    connecting_state = Connecting()
+    connecting_state.context.connection = Mock()
+    connecting_state.context.connection.server_id = 4  # JP#9
+    servers_widget.connection_status_update(connecting_state)
+
+    assert argentina_row.connection_state == ConnectionStateEnum.DISCONNECTED
+    assert japan_row.connection_state == ConnectionStateEnum.CONNECTING
+
+
+def test_server_list_update_only_patches_country_rows_that_changed():
+    mock_controller = Mock()
+    mock_controller.is_connection_active = False
+    server_list_widget = ServerListWidget(controller=mock_controller)
+    server_list_widget.display(user_tier=PLUS_TIER, server_list=SERVER_LIST)
+
+    argentina_row = server_list_widget.country_rows[0]
+    argentina_row.click_toggle_country_servers_button()
+    process_gtk_events()
+
+    mock_controller.server_list = SERVER_LIST_UPDATED
+    server_list_updated_callback = mock_controller.set_server_list_updated_callback.call_args[0][0]
+    server_list_updated_callback()
+    process_gtk_events()
+
+    # The existing country row is kept, together with its expanded state.
+    assert server_list_widget.country_rows[0] is argentina_row
+    assert argentina_row.showing_servers
+    # Its server rows are patched to match the new server list.
+    assert [row.server_label for row in argentina_row.server_rows] == ["Server Name Updated"]
+    # The new country row is added.
+    assert server_list_widget.country_rows[1].country_name == "Japan"
+
+
+def test_display_after_snapshot_reconciles_country_rows_and_makes_them_actionable():
+    mock_controller = Mock()
+    mock_controller.is_connection_active = False
+    server_list_widget = ServerListWidget(controller=mock_controller)
+    server_list_widget.display_snapshot(user_tier=PLUS_TIER, server_list=SERVER_LIST)
+
+    argentina_row = server_list_widget.country_rows[0]
+    # Rows can't be interacted with, nor updated, while the snapshot is displayed.
+    assert not argentina_row.is_sensitive()
+    mock_controller.set_server_list_updated_callback.assert_not_called()
+
+    server_list_widget.display(user_tier=PLUS_TIER, server_list=SERVER_LIST_UPDATED)
+    process_gtk_events()
+
+    assert server_list_widget.country_rows[0] is argentina_row
+    assert [row.country_name for row in server_list_widget.country_rows] == [
+        "Argentina", "Japan"
+    ]
+    assert argentina_row.is_sensitive()
+    mock_controller.set_server_list_updated_callback.assert_called_once()
@@ -0,0 +1,179 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from unittest.mock import Mock
+
+import pytest
+from proton.vpn.session.servers import ServerList
+from proton.vpn.connection.states import Connected
+
+from proton.vpn.app.gtk.widgets.vpn.serverlist.virtualized import (
+    VirtualizedServerListWidget, COLUMN_NAME, COLUMN_ACTION,
+    COLUMN_MAINTENANCE_ICON, ACTION_CONNECT, ACTION_CONNECTED, ACTION_UPGRADE
+)
+from tests.unit.testing_utils import process_gtk_events
+
+PLUS_TIER = 2
+FREE_TIER = 0
+
+
+@pytest.fixture
+def server_list():
+    return ServerList.from_dict({
+        "LogicalServers": [
+            {
+                "ID": 1,
+                "Name": "AR#1",
+                "Status": 1,
+                "Load": 50,
+                "Servers": [{"Status": 1}],
+                "ExitCountry": "AR",
+                "Tier": PLUS_TIER,
+            },
+            {
+                "ID": 2,
+                "Name": "AR#2",
+                "Status": 0,
+                "Load": 50,
+                "Servers": [{"Status": 0}],
+                "ExitCountry": "AR",
+                "Tier": PLUS_TIER,
+            },
+            {
+                "ID": 3,
+                "Name": "JP-FREE#1",
+                "Status": 1,
+                "Load": 50,
+                "Servers": [{"Status": 1}],
+                "ExitCountry": "JP",
+                "Tier": FREE_TIER,
+            },
+        ],
+        "MaxTier": PLUS_TIER
+    })
+
+
+def _display(server_list, user_tier=PLUS_TIER, controller=None):
+    controller = controller or Mock()
+    controller.is_connection_active = False
+    widget = VirtualizedServerListWidget(controller=controller)
+    widget.display(user_tier=user_tier, server_list=server_list)
+    return widget
+
+
+def _expand_country(widget, index):
+    path = widget.model.get_path(widget.model.iter_nth_child(None, index))
+    widget.tree_view.expand_row(path, open_all=False)
+    return widget.model.iter_nth_child(None, index)
+
+
+def test_display_adds_one_top_level_row_per_country(server_list):
+    widget = _display(server_list)
+
+    assert widget.country_names == ["Argentina", "Japan"]
+
+
+def test_display_sorts_countries_with_free_servers_first_for_free_users(server_list):
+    widget = _display(server_list, user_tier=FREE_TIER)
+
+    assert widget.country_names == ["Japan", "Argentina"]
+
+
+def test_server_rows_are_only_added_when_the_country_is_expanded(server_list):
+    widget = _display(server_list)
+
+    country_iter = widget.model.iter_nth_child(None, 0)
+    # Only the placeholder row is added before the country is expanded.
+    assert widget.model.iter_n_children(country_iter) == 1
+
+    country_iter = _expand_country(widget, 0)
+
+    server_names = [
+        widget.model[widget.model.iter_nth_child(country_iter, i)][COLUMN_NAME]
+        for i in range(widget.model.iter_n_children(country_iter))
+    ]
+    assert server_names == ["AR#1", "AR#2"]
+
+
+def test_server_rows_show_maintenance_icon_for_disabled_servers(server_list):
+    widget = _display(server_list)
+    country_iter = _expand_country(widget, 0)
+
+    enabled_server_row = widget.model[widget.model.iter_nth_child(country_iter, 0)]
+    disabled_server_row = widget.model[widget.model.iter_nth_child(country_iter, 1)]
+    assert enabled_server_row[COLUMN_MAINTENANCE_ICON] is None
+    assert disabled_server_row[COLUMN_MAINTENANCE_ICON] is not None
+    assert disabled_server_row[COLUMN_ACTION] == ""
+
+
+def test_country_row_requires_upgrade_for_free_users_on_plus_countries(server_list):
+    widget = _display(server_list, user_tier=FREE_TIER)
+
+    japan_row, argentina_row = list(widget.model)
+    assert japan_row[COLUMN_ACTION] == ACTION_CONNECT
+    assert argentina_row[COLUMN_ACTION] == ACTION_UPGRADE
+
+
+def test_activating_the_action_column_connects_to_the_server(server_list):
+    controller = Mock()
+    widget = _display(server_list, controller=controller)
+    country_iter = _expand_country(widget, 0)
+    server_path = widget.model.get_path(widget.model.iter_nth_child(country_iter, 0))
+
+    widget.tree_view.row_activated(server_path, widget.tree_view.get_column(3))
+
+    controller.connect_to_server.assert_called_once_with("AR#1")
+
+
+def test_activating_a_country_row_toggles_its_servers(server_list):
+    widget = _display(server_list)
+    country_path = widget.model.get_path(widget.model.iter_nth_child(None, 0))
+
+    widget.tree_view.row_activated(country_path, widget.tree_view.get_column(0))
+    assert widget.tree_view.row_expanded(country_path)
+
+    widget.tree_view.row_activated(country_path, widget.tree_view.get_column(0))
+    assert not widget.tree_view.row_expanded(country_path)
+
+
+def test_connection_status_update_repaints_server_and_country_rows(server_list):
+    widget = _display(server_list)
+    country_iter = _expand_country(widget, 0)
+
+    connection_state = Connected()
+    connection_state.context.connection = Mock()
+    connection_state.context.connection.server_id = 1
+    widget.connection_status_update(connection_state)
+    process_gtk_events()
+
+    assert widget.model[country_iter][COLUMN_ACTION] == ACTION_CONNECTED
+    server_row = widget.model[widget.model.iter_nth_child(country_iter, 0)]
+    assert server_row[COLUMN_ACTION] == ACTION_CONNECTED
+
+
+def test_server_list_update_keeps_expanded_countries(server_list):
+    controller = Mock()
+    widget = _display(server_list, controller=controller)
+    _expand_country(widget, 0)
+
+    controller.server_list = server_list
+    server_list_updated_callback = controller.set_server_list_updated_callback.call_args[0][0]
+    server_list_updated_callback()
+
+    country_path = widget.model.get_path(widget.model.iter_nth_child(None, 0))
+    assert widget.tree_view.row_expanded(country_path)
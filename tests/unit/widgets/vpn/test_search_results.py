@@ -0,0 +1,193 @@
+"""
+Copyright (c) 2023 Proton AG
+
+This file is part of Proton VPN.
+
+Proton VPN is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Proton VPN is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ProtonVPN.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from gi.repository import GLib
+import pytest
+
+from proton.vpn.session.servers import ServerList, LogicalServer
+
+from proton.vpn.app.gtk import Gtk
+from proton.vpn.app.gtk.widgets.vpn.search_results import (
+    SearchResults, ServerListSearchIndex, COLUMN_NAME
+)
+from tests.unit.testing_utils import run_main_loop
+
+PLUS_TIER = 2
+FREE_TIER = 0
+
+
+@pytest.fixture
+def server_list():
+    api_data = [
+        {
+            "ID": 1,
+            "Name": "AR#10",
+            "Status": 1,
+            "Load": 50,
+            "Servers": [{"Status": 1}],
+            "ExitCountry": "AR",
+            "Tier": PLUS_TIER,
+        },
+        {
+            "ID": 2,
+            "Name": "JP-FREE#10",
+            "Status": 1,
+            "Load": 40,
+            "Servers": [{"Status": 1}],
+            "ExitCountry": "JP",
+            "Tier": FREE_TIER,
+        },
+    ]
+    return ServerList(
+        user_tier=PLUS_TIER,
+        logicals=[LogicalServer(server) for server in api_data]
+    )
+
+
+def search(search_results: SearchResults, search_text: str):
+    """Searches the text and waits until the results are displayed."""
+    main_loop = GLib.MainLoop()
+    handler_id = search_results.connect("search-complete", lambda *_: main_loop.quit())
+    change_search_text(search_results, search_text)
+    try:
+        run_main_loop(main_loop)
+    finally:
+        search_results.disconnect(handler_id)
+
+
+def change_search_text(search_results: SearchResults, search_text: str):
+    search_entry = Mock()
+    search_entry.get_text.return_value = search_text
+    search_results.on_search_changed(search_entry, Gtk.Revealer())
+
+
+def get_displayed_rows(search_results: SearchResults):
+    return [row[COLUMN_NAME] for row in search_results.filtered_list.get_model()]
+
+
+def test_search_displays_matching_countries_and_servers(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = PLUS_TIER
+    search_results = SearchResults(controller, debounce_ms=0)
+
+    search(search_results, "ar")
+
+    assert get_displayed_rows(search_results) == [
+        "Countries (1)", "Argentina", "Servers (1)", "AR#10"
+    ]
+
+
+def test_search_only_displays_servers_in_the_user_tier(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = FREE_TIER
+    search_results = SearchResults(controller, debounce_ms=0)
+
+    search(search_results, "#10")
+
+    assert get_displayed_rows(search_results) == ["Servers (1)", "JP-FREE#10"]
+
+
+def test_search_index_is_only_rebuilt_when_the_server_list_changes(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = PLUS_TIER
+    search_results = SearchResults(controller, debounce_ms=0)
+
+    with patch.object(
+            ServerListSearchIndex, "build", wraps=ServerListSearchIndex.build
+    ) as build_mock:
+        search(search_results, "a")
+        search(search_results, "ar")
+        assert build_mock.call_count == 1
+
+        controller.server_list = ServerList(user_tier=PLUS_TIER, logicals=list(server_list))
+        search(search_results, "ar")
+        assert build_mock.call_count == 2
+
+
+def test_search_index_is_only_built_once_when_searching_concurrently(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = PLUS_TIER
+    search_results = SearchResults(controller, debounce_ms=0)
+    build = ServerListSearchIndex.build
+
+    def slow_build(*args):
+        time.sleep(0.05)
+        return build(*args)
+
+    with patch.object(ServerListSearchIndex, "build", side_effect=slow_build) as build_mock, \
+            ThreadPoolExecutor() as executor:
+        futures = [executor.submit(search_results.refresh_search_index) for _ in range(2)]
+        first_search_index, second_search_index = [future.result() for future in futures]
+
+    build_mock.assert_called_once()
+    assert first_search_index is second_search_index
+
+
+def test_fast_typing_only_triggers_one_search(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = PLUS_TIER
+    search_results = SearchResults(controller, debounce_ms=50)
+    search_complete_callback = Mock()
+    search_results.connect("search-complete", search_complete_callback)
+
+    with patch.object(
+            search_results.filtered_list, "search", wraps=search_results.filtered_list.search
+    ) as search_mock:
+        change_search_text(search_results, "a")
+        change_search_text(search_results, "ar")
+        search(search_results, "ar#")
+
+    search_mock.assert_called_once_with("ar#")
+    search_complete_callback.assert_called_once()
+    assert search_complete_callback.call_args[0][1] == "ar#"
+    assert get_displayed_rows(search_results) == ["Servers (1)", "AR#10"]
+
+
+def test_search_results_can_be_filtered_off_the_main_thread(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = PLUS_TIER
+    with ThreadPoolExecutor() as executor:
+        search_results = SearchResults(controller, executor=executor, debounce_ms=0)
+
+        search(search_results, "japan")
+
+    assert get_displayed_rows(search_results) == ["Countries (1)", "Japan"]
+
+
+def test_search_results_are_displayed_by_swapping_the_model(server_list):
+    controller = Mock()
+    controller.server_list = server_list
+    controller.user_tier = PLUS_TIER
+    search_results = SearchResults(controller, debounce_ms=0)
+    previous_model = search_results.filtered_list.get_model()
+
+    search(search_results, "ar")
+
+    # The previous model is left untouched and replaced by the new one.
+    assert len(previous_model) == 0
+    assert search_results.filtered_list.get_model() is not previous_model
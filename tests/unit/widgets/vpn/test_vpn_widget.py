@@ -156,3 +156,54 @@ def test_unload_resets_widget_state():
     controller_mock.unregister_connection_status_subscriber.assert_called_once_with(vpn_widget)  # (2)
     controller_mock.reconnector.disable.assert_called_once()  # (3)
     controller_mock.disable_refresher.assert_called_once()  # (4)
+
+
+def test_load_displays_server_list_snapshot_until_data_is_ready(server_list):
+    controller_mock = Mock()
+    vpn_widget = VPNWidget(controller=controller_mock, main_window=Mock(), overlay_widget=Mock())
+    vpn_widget.server_list_widget = Mock()
+
+    snapshot_displayed_event = Event()
+    vpn_widget.connect("snapshot-displayed", lambda *_: snapshot_displayed_event.set())
+    vpn_widget_ready_event = Event()
+    vpn_widget.connect("vpn-widget-ready", lambda *_: vpn_widget_ready_event.set())
+
+    vpn_widget.load()
+
+    # Simulate the snapshot being loaded before the refresher is enabled.
+    callback = controller_mock.load_server_list_snapshot.call_args[0][0]
+    future = Future()
+    future.set_result(Mock(user_tier=PLUS_TIER, server_list=server_list))
+    callback(future)
+
+    vpn_widget.server_list_widget.display_snapshot.assert_called_once_with(
+        user_tier=PLUS_TIER, server_list=server_list
+    )
+    assert snapshot_displayed_event.wait(timeout=0), "snapshot-displayed signal was not sent."
+    assert not vpn_widget.quick_connect_widget.is_sensitive()
+
+    # The server list built from the snapshot doesn't make the widget ready.
+    vpn_widget._on_server_list_updated()
+    assert not vpn_widget_ready_event.is_set()
+
+    vpn_widget.display(user_tier=PLUS_TIER, server_list=server_list)
+    vpn_widget._on_server_list_updated()
+
+    assert vpn_widget_ready_event.wait(timeout=0), "vpn-widget-ready signal was not sent."
+    assert vpn_widget.quick_connect_widget.is_sensitive()
+    controller_mock.save_server_list_snapshot.assert_called_once_with(PLUS_TIER, server_list)
+
+
+def test_server_list_snapshot_is_not_displayed_once_the_widget_is_ready(server_list):
+    controller_mock = Mock()
+    vpn_widget = VPNWidget(controller=controller_mock, main_window=Mock(), overlay_widget=Mock())
+    vpn_widget.load()
+    vpn_widget.display(user_tier=PLUS_TIER, server_list=server_list)
+    vpn_widget.server_list_widget = Mock()
+
+    callback = controller_mock.load_server_list_snapshot.call_args[0][0]
+    future = Future()
+    future.set_result(Mock(user_tier=PLUS_TIER, server_list=server_list))
+    callback(future)
+
+    vpn_widget.server_list_widget.display_snapshot.assert_not_called()